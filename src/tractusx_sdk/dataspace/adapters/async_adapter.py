@@ -0,0 +1,109 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import httpx
+
+from .adapter import Adapter
+from ..tools import HttpTools, AsyncHttpTools
+
+
+class AsyncAdapter(Adapter):
+    """
+    Asynchronous adapter class.
+
+    It exposes the same interface as the Adapter, but every request method returns an awaitable.
+    By default the requests are sent through the shared pooled client of the AsyncHttpTools.
+    Controllers built with this adapter return awaitables from all their methods.
+    """
+
+    client: httpx.AsyncClient | None = None
+    headers: dict
+    verify: bool = True
+
+    def __init__(
+            self,
+            base_url: str,
+            headers: dict = None,
+            verify: bool = True,
+            client: httpx.AsyncClient = None
+    ):
+        """
+        Create a new asynchronous adapter instance
+
+        :param base_url: The URL of the application to be requested
+        :param headers: The headers (i.e.: API Key) of the application to be requested
+        :param verify: Whether the SSL certificates of the application are verified
+        :param client: A dedicated httpx client, if None the shared pooled client is used
+        """
+
+        self.base_url = base_url
+        self.headers = dict(headers) if headers else {}
+        self.verify = verify
+        self.client = client
+
+    class _Builder(Adapter._Builder):
+        """
+        Default _Builder class for an AsyncAdapter.
+        """
+
+        def verify(self, verify: bool):
+            self._data["verify"] = verify
+            return self
+
+        def client(self, client: httpx.AsyncClient):
+            self._data["client"] = client
+            return self
+
+    async def close(self):
+        """
+        Close the dedicated httpx client, the shared pooled client stays open
+        """
+
+        if self.client is not None:
+            await self.client.aclose()
+
+    async def request(self, method: str, path: str = "", **kwargs) -> httpx.Response:
+        """
+        Main method for performing requests
+
+        :param method: HTTP method to use
+        :param path: Path to append to the base adapter URL
+        :param kwargs: Keyword arguments to include in the request, requests-style arguments
+            (data, json, params, headers, timeout, allow_redirects) are supported
+
+        :return: The response of the request
+        """
+
+        url = HttpTools.concat_into_url(self.base_url, path)
+
+        headers = self.headers | (kwargs.pop("headers", None) or {})
+        ## SSL verification is configured per client in httpx
+        kwargs.pop("verify", None)
+
+        return await AsyncHttpTools.do_request(
+            method=method.upper(),
+            url=url,
+            client=self.client,
+            verify=self.verify,
+            headers=headers,
+            **kwargs
+        )
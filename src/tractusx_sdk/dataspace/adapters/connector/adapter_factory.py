@@ -32,6 +32,7 @@ class AdapterType(Enum):
     """
 
     DMA_ADAPTER = "Dma"
+    ASYNC_DMA_ADAPTER = "AsyncDma"
     DATAPLANE_ADAPTER = "Dataplane"
     # TODO: Add any other existing adapter types
 
@@ -121,6 +122,37 @@ class AdapterFactory:
         builder.data(kwargs)
         return builder.build()
 
+    @staticmethod
+    def get_async_dma_adapter(
+            dataspace_version: str,
+            base_url: str,
+            dma_path: str,
+            headers: dict = None,
+            **kwargs
+    ):
+        """
+        Create an asynchronous (DMA) adapter instance, based a specific version.
+
+        :param dataspace_version: The version of the Dataspace DMA (e.g., "jupiter")
+        :param base_url: The URL of the Connector DMA to be requested
+        :param dma_path: The path of the Connector Data Management API to be requested
+        :param headers: The headers (i.e.: API Key) of the Connector to be requested
+        :return: An instance of the specified AsyncAdapter subclass
+        """
+
+        builder = AdapterFactory._get_adapter_builder(
+            adapter_type=AdapterType.ASYNC_DMA_ADAPTER,
+            dataspace_version=dataspace_version,
+        )
+
+        builder.base_url(base_url)
+        builder.headers(headers)
+        builder.dma_path(dma_path)
+
+        # Include any additional parameters
+        builder.data(kwargs)
+        return builder.build()
+
     @staticmethod
     def get_dataplane_adapter(
             dataspace_version: str,
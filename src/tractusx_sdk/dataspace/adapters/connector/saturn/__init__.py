@@ -20,6 +20,6 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from .dma_adapter import DmaAdapter
+from .dma_adapter import DmaAdapter, AsyncDmaAdapter
 
-__all__ = ['DmaAdapter']
+__all__ = ['DmaAdapter', 'AsyncDmaAdapter']
@@ -22,7 +22,12 @@
 #################################################################################
 
 from ..base_dma_adapter import BaseDmaAdapter
+from ..async_base_dma_adapter import AsyncBaseDmaAdapter
 
 
 class DmaAdapter(BaseDmaAdapter):
     pass
+
+
+class AsyncDmaAdapter(AsyncBaseDmaAdapter):
+    pass
@@ -33,3 +33,5 @@ __license__ = "Apache License, Version 2.0"
 
 from .auth_manager import AuthManager
 from .oauth2_manager import OAuth2Manager
+from .edr_cache_manager import BaseEdrCacheManager, MemoryEdrCacheManager
+from .catalog_cache_manager import BaseCatalogCacheManager, MemoryCatalogCacheManager, CatalogCacheKey
@@ -0,0 +1,175 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import NamedTuple
+
+
+class CatalogCacheKey(NamedTuple):
+    counter_party_id: str
+    counter_party_address: str
+    protocol: str
+    request_checksum: str
+
+
+class BaseCatalogCacheManager(ABC):
+    """
+    Caches the DCAT catalogs received from the providers, by counter party, address, protocol and request checksum
+    (which covers the filter expression and the context of the catalog request).
+
+    A catalog is fresh during the ttl, after it a stale catalog can still be served for stale_ttl seconds while it
+    is revalidated in the background.
+    """
+
+    ttl: float
+    stale_ttl: float
+
+    def __init__(self, ttl: float = 300, stale_ttl: float = 60):
+        """
+        :param ttl: Seconds a catalog is served without revalidating it.
+        :param stale_ttl: Seconds after the ttl in which the catalog is still served while it is revalidated.
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+
+    @staticmethod
+    def get_key(counter_party_id: str, counter_party_address: str, protocol: str, request_data: dict) -> CatalogCacheKey:
+        """
+        Builds the cache key of a catalog request.
+
+        :param request_data: The serialized catalog request, its checksum identifies the filter and the context.
+        """
+        checksum = hashlib.sha3_256(json.dumps(request_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return CatalogCacheKey(counter_party_id, counter_party_address, protocol, checksum)
+
+    @abstractmethod
+    def get(self, key: CatalogCacheKey) -> tuple[dict, bool] | None:
+        """
+        Returns the cached catalog and if it must be revalidated, or None if it is missing or too old.
+        Only one caller gets a due revalidation, until put() or release_revalidation() is called for the key.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: CatalogCacheKey, catalog: dict) -> None:
+        """
+        Stores a catalog.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def release_revalidation(self, key: CatalogCacheKey) -> None:
+        """
+        Allows a new revalidation of the catalog after a failed one.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, counter_party_id: str = None, counter_party_address: str = None) -> None:
+        """
+        Removes the catalogs of a counter party and/or address, or all of them if none is given.
+        """
+        raise NotImplementedError
+
+
+class MemoryCatalogCacheManager(BaseCatalogCacheManager):
+    """
+    In-memory catalog cache, bounded by the size of the catalogs (least recently used are evicted).
+    """
+
+    max_bytes: int
+
+    def __init__(self, ttl: float = 300, stale_ttl: float = 60, max_bytes: int = 64 * 1024 * 1024):
+        """
+        :param ttl: Seconds a catalog is served without revalidating it.
+        :param stale_ttl: Seconds after the ttl in which the catalog is still served while it is revalidated.
+        :param max_bytes: Maximum size of the cached catalogs, measured as their JSON size.
+        """
+        super().__init__(ttl=ttl, stale_ttl=stale_ttl)
+        self.max_bytes = max_bytes
+        ## key -> (catalog, size, stored_at)
+        self._entries: OrderedDict[CatalogCacheKey, tuple[dict, int, float]] = OrderedDict()
+        self._revalidating: set[CatalogCacheKey] = set()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        Current size of the cached catalogs in bytes.
+        """
+        return self._size
+
+    def get(self, key: CatalogCacheKey) -> tuple[dict, bool] | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            catalog, _, stored_at = entry
+            age = now - stored_at
+            if age >= self.ttl + self.stale_ttl:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            if age < self.ttl or key in self._revalidating:
+                return catalog, False
+            self._revalidating.add(key)
+            return catalog, True
+
+    def put(self, key: CatalogCacheKey, catalog: dict) -> None:
+        size = len(json.dumps(catalog, default=str))
+        with self._lock:
+            self._revalidating.discard(key)
+            self._remove(key)
+            ## Catalogs bigger than the whole cache are not cached
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (catalog, size, time.monotonic())
+            self._size += size
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def release_revalidation(self, key: CatalogCacheKey) -> None:
+        with self._lock:
+            self._revalidating.discard(key)
+
+    def invalidate(self, counter_party_id: str = None, counter_party_address: str = None) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                if counter_party_id is not None and key.counter_party_id != counter_party_id:
+                    continue
+                if counter_party_address is not None and key.counter_party_address != counter_party_address:
+                    continue
+                self._remove(key)
+                self._revalidating.discard(key)
+
+    def _remove(self, key: CatalogCacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
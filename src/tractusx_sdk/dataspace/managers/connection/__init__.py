@@ -20,12 +20,22 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+from .async_base_connection_manager import AsyncBaseConnectionManager
 from .base_connection_manager import BaseConnectionManager
+from .change_tracking_mixin import ChangeTrackingMixin
 from .database import (
+    AsyncPostgresConnectionManager,
     PostgresConnectionManager,
     PostgresMemoryConnectionManager,
     PostgresMemoryRefreshConnectionManager
 )
-from .file_system import FileSystemConnectionManager
-from .memory import MemoryConnectionManager
+from .file_system import AsyncFileSystemConnectionManager, FileSystemConnectionManager
+from .key_value import (
+    BaseKeyValueStore,
+    KeyValueConnectionManager,
+    MemoryKeyValueStore,
+    RedisKeyValueStore
+)
+from .memory import AsyncMemoryConnectionManager, MemoryConnectionManager
+from .sqlite import SqliteConnectionManager
 
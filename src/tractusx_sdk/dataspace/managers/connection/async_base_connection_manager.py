@@ -0,0 +1,134 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from .base_connection_manager import BaseConnectionManager
+
+class AsyncBaseConnectionManager(ABC):
+    """
+    Awaitable counterpart of the BaseConnectionManager, for consumers running in an event loop.
+
+    Cache hits are answered without leaving the event loop, only the blocking work of each backend
+    (database queries, file locks) is awaited.
+    """
+    TRANSFER_ID_KEY = BaseConnectionManager.TRANSFER_ID_KEY
+
+    @abstractmethod
+    def __init__(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry:dict) -> str | None:
+        """
+        Adds a connection to the open connections.
+
+        :param counter_party_id: The ID of the counter party.
+        :param counter_party_address: The address of the counter party.
+        :param query_checksum: The checksum of the filter expression query.
+        :param policy_checksum: The checksum of the policy.
+        :param connection_entry: The EDR entry of the connection.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    async def get_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> dict | None:
+        """
+        Gets a connection from the open connections.
+
+        :param counter_party_id: The ID of the counter party.
+        :param counter_party_address: The address of the counter party.
+        :param query_checksum: The checksum of the filter expression query.
+        :param policy_checksum: The checksum of the policy.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    async def get_connection_transfer_id(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> str | None:
+        """
+        Gets a connection transfer ID from the open connections.
+
+        :param counter_party_id: The ID of the counter party.
+        :param counter_party_address: The address of the counter party.
+        :param query_checksum: The checksum of the filter expression query.
+        :param policy_checksum: The checksum of the policy.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    async def delete_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> bool:
+        """
+        Deletes a connection from the open connections.
+
+        :param counter_party_id: The ID of the counter party.
+        :param counter_party_address: The address of the counter party.
+        :param query_checksum: The checksum of the filter expression query.
+        :param policy_checksum: The checksum of the policy.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    async def get_connections_many(self, keys: list[tuple[str, str, str, str]]) -> dict[tuple[str, str, str, str], dict]:
+        """
+        Gets several connections at once.
+
+        :param keys: The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples of the connections.
+        :return: The connection data by key, an empty dict for the connections not found.
+        """
+        return {tuple(key): await self.get_connection(*key) or {} for key in keys}
+
+    async def add_connections_many(self, connections: list[tuple[str, str, str, str, dict]]) -> list[str | None]:
+        """
+        Adds several connections at once.
+
+        :param connections: The (counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry) tuples to add.
+        :return: The transfer IDs of the added connections, in the same order.
+        """
+        return [await self.add_connection(*connection) for connection in connections]
+
+    async def delete_connections_many(self, keys: list[tuple[str, str, str, str]]) -> int:
+        """
+        Deletes several connections at once.
+
+        :param keys: The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples of the connections.
+        :return: The number of deleted connections.
+        """
+        deleted = 0
+        for key in keys:
+            if await self.delete_connection(*key):
+                deleted += 1
+        return deleted
+
+    def negotiation_lock(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str):
+        """
+        Asynchronous context manager held while a new connection is negotiated.
+
+        The default implementation does not lock. Inside the lock the connection must be looked up again,
+        since another task or process may have added it meanwhile.
+
+        :param counter_party_id: The ID of the counter party.
+        :param counter_party_address: The address of the counter party.
+        :param query_checksum: The checksum of the filter expression query.
+        :param policy_checksum: The checksum of the policy.
+        """
+        return nullcontext()
+
+    get_negotiation_key = staticmethod(BaseConnectionManager.get_negotiation_key)
@@ -20,7 +20,9 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+import hashlib
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 
 class BaseConnectionManager(ABC):
     TRANSFER_ID_KEY = "transferProcessId"
@@ -79,4 +81,56 @@ class BaseConnectionManager(ABC):
         :param policy_checksum: The checksum of the policy.
         :param transfer_id: The ID of the transfer.
         """
-        raise NotImplementedError("This method should be implemented by subclasses.")
\ No newline at end of file
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    def get_connections_many(self, keys: list[tuple[str, str, str, str]]) -> dict[tuple[str, str, str, str], dict]:
+        """
+        Gets several connections at once.
+
+        The default implementation looks the connections up one by one, managers backed by a database can override it
+        to retrieve them in a single query.
+
+        :param keys: The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples of the connections.
+        :return: The connection data by key, an empty dict for the connections not found.
+        """
+        return {tuple(key): self.get_connection(*key) or {} for key in keys}
+
+    def add_connections_many(self, connections: list[tuple[str, str, str, str, dict]]) -> list[str | None]:
+        """
+        Adds several connections at once.
+
+        :param connections: The (counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry) tuples to add.
+        :return: The transfer IDs of the added connections, in the same order.
+        """
+        return [self.add_connection(*connection) for connection in connections]
+
+    def delete_connections_many(self, keys: list[tuple[str, str, str, str]]) -> int:
+        """
+        Deletes several connections at once.
+
+        :param keys: The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples of the connections.
+        :return: The number of deleted connections.
+        """
+        return sum(1 for key in keys if self.delete_connection(*key))
+
+    def negotiation_lock(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str):
+        """
+        Context manager held while a new connection is negotiated, so that only one process negotiates the same connection.
+
+        The default implementation does not lock, managers sharing their connections between processes can override it.
+        Inside the lock the connection must be looked up again, since another process may have added it meanwhile.
+
+        :param counter_party_id: The ID of the counter party.
+        :param counter_party_address: The address of the counter party.
+        :param query_checksum: The checksum of the filter expression query.
+        :param policy_checksum: The checksum of the policy.
+        """
+        return nullcontext()
+
+    @staticmethod
+    def get_negotiation_key(counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> str:
+        """
+        Builds a stable key identifying a connection, usable as a lock name across processes.
+        """
+        base_string = f"{counter_party_id}:{counter_party_address}:{query_checksum}:{policy_checksum}"
+        return hashlib.sha256(base_string.encode()).hexdigest()
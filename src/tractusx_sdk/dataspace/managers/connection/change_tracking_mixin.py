@@ -0,0 +1,56 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+class ChangeTrackingMixin:
+    """
+    Version counter telling the persistence loops whether the connections changed since the last save.
+
+    The writers bump the version with _mark_changed while holding their lock, and the savers take the version
+    together with the changes and mark it saved once they are persisted. Checking for unsaved changes compares
+    two integers, so idle persistence ticks neither lock nor walk the cache.
+    """
+
+    _version: int = 0
+    _saved_version: int = 0
+
+    @property
+    def change_version(self) -> int:
+        """
+        Number of changes made to the connections so far.
+        """
+        return self._version
+
+    def has_unsaved_changes(self) -> bool:
+        """
+        Whether the connections changed since the last successful save.
+        """
+        return self._version != self._saved_version
+
+    def _mark_changed(self):
+        self._version += 1
+
+    def _mark_saved(self, version: int):
+        """
+        Records that the changes up to the version were persisted, changes made meanwhile stay unsaved.
+        """
+        if version > self._saved_version:
+            self._saved_version = version
@@ -31,6 +31,7 @@ This module contains utility functions and classes for working with the Eclipse
 __author__ = 'Eclipse Tractus-X Contributors'
 __license__ = "Apache License, Version 2.0"
 
+from .async_postgres_connection_manager import AsyncPostgresConnectionManager
 from .postgres_connection_manager import PostgresConnectionManager
 from .postgres_memory_refresh_connection_manager import PostgresMemoryRefreshConnectionManager
 from .postgres_memory_connection_manager import PostgresMemoryConnectionManager
\ No newline at end of file
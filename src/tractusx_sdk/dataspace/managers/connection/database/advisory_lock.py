@@ -0,0 +1,101 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import hashlib
+from contextlib import asynccontextmanager, contextmanager
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session as S
+
+
+def get_advisory_lock_id(key: str) -> int:
+    """
+    Maps a key to the signed 64 bit integer used by the Postgres advisory locks.
+    """
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], byteorder="big", signed=True)
+
+
+@contextmanager
+def postgres_advisory_lock(engine, key: str):
+    """
+    Holds a Postgres session-level advisory lock for the key, shared by all the processes using the database.
+
+    Databases other than Postgres have no advisory locks, for them the context does not lock.
+
+    Args:
+        engine (Engine | Session): SQLAlchemy engine or session of the database.
+        key (str): The name of the lock.
+    """
+    bind = engine.get_bind() if isinstance(engine, S) else engine
+    if bind.dialect.name != "postgresql":
+        yield
+        return
+
+    lock_id = get_advisory_lock_id(key)
+    ## The lock belongs to the database session, so the same connection must be kept until it is released
+    with bind.connect() as connection:
+        connection.execute(text("SELECT pg_advisory_lock(:lock_id)"), {"lock_id": lock_id})
+        connection.commit()
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": lock_id})
+            connection.commit()
+
+
+@asynccontextmanager
+async def async_postgres_advisory_lock(engine, key: str):
+    """
+    Awaitable version of postgres_advisory_lock, for SQLAlchemy async engines.
+
+    Args:
+        engine (AsyncEngine): SQLAlchemy async engine of the database.
+        key (str): The name of the lock.
+    """
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+
+    lock_id = get_advisory_lock_id(key)
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT pg_advisory_lock(:lock_id)"), {"lock_id": lock_id})
+        await connection.commit()
+        try:
+            yield
+        finally:
+            await connection.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": lock_id})
+            await connection.commit()
+
+
+def postgres_transaction_advisory_lock(session, key: str):
+    """
+    Holds a Postgres transaction-level advisory lock for the key, released when the session transaction ends.
+
+    Databases other than Postgres have no advisory locks, for them nothing is locked.
+
+    Args:
+        session (Session): SQLAlchemy session with the open transaction.
+        key (str): The name of the lock.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    session.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": get_advisory_lock_id(key)})
@@ -0,0 +1,249 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+import logging
+from contextlib import nullcontext
+from sqlalchemy import select, delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from ..async_base_connection_manager import AsyncBaseConnectionManager
+from ....models.connection.database.edr_base import EDRBase
+from ....constants import JSONLDKeys
+from .advisory_lock import async_postgres_advisory_lock
+
+class AsyncPostgresConnectionManager(AsyncBaseConnectionManager):
+    """
+    Stores the EDR connections in a database through a SQLAlchemy async engine (i.e. postgresql+asyncpg).
+
+    The table and statements are the ones of the PostgresConnectionManager, so both managers can share a table.
+    The engine is only used through its connections, the SQLAlchemy asyncio extension is needed to create it.
+    """
+
+    def __init__(self, engine, provider_id_key: str = "providerId", table_name: str = "edr_connections", logger:logging.Logger=None, verbose: bool = False,
+                 negotiation_locking: bool = False, batch_size: int = 500):
+        """
+        Initialize the AsyncPostgresConnectionManager, the table is created on its first use.
+
+        Args:
+            engine (AsyncEngine): SQLAlchemy async engine to interact with the database.
+            provider_id_key (str): The key used to identify the provider ID in the connection data.
+            table_name (str): The name of the table to store EDR connections.
+            logger (logging.Logger, optional): Logger instance for outputting messages.
+            verbose (bool): Whether to output verbose log messages.
+            negotiation_locking (bool): Whether to lock the negotiations with Postgres advisory locks,
+                so that only one process sharing the database negotiates the same connection.
+            batch_size (int): Maximum number of connections read or written per statement by the bulk methods.
+        """
+        self.engine = engine
+        self.provider_id_key = provider_id_key
+        self.table_name = table_name
+        self.logger = logger
+        self.verbose = verbose
+        self.negotiation_locking = negotiation_locking
+        self.batch_size = batch_size
+
+        class DynamicEDRConnection(EDRBase, table=True):
+            __tablename__ = table_name
+            __table_args__ = {"extend_existing": True}
+
+        self.EDRConnection = DynamicEDRConnection
+        self.table = DynamicEDRConnection.__table__
+        self._connection_key_index = DynamicEDRConnection.connection_key_index(unique=True)
+        self._native_upsert = False
+        self._table_ready = False
+        self._setup_lock = asyncio.Lock()
+
+    async def _ensure_table(self):
+        """
+        Creates the table and its connection key index once, before the first statement.
+        """
+        if self._table_ready:
+            return
+        async with self._setup_lock:
+            if self._table_ready:
+                return
+            async with self.engine.begin() as connection:
+                await connection.run_sync(self._create_table)
+            self._table_ready = True
+
+    def _create_table(self, connection):
+        self.EDRConnection.metadata.create_all(connection, tables=[self.table])
+        try:
+            ## In a savepoint, a failed index creation must not abort the table creation
+            with connection.begin_nested():
+                self._connection_key_index.create(connection, checkfirst=True)
+            self._native_upsert = True
+        except SQLAlchemyError as e:
+            if self.logger:
+                self.logger.warning(f"[Async Postgres Connection Manager] The index [{self._connection_key_index.name}] could not be created, upserts will not use it: {e}")
+
+    def _build_row(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry: dict) -> dict:
+        """
+        Builds the row stored for an EDR connection, without the metadata fields that are not needed for storage.
+        """
+        transfer_process_id: str = connection_entry.get(JSONLDKeys.AT_ID, None)
+        if not transfer_process_id:
+            raise Exception("[Async Postgres Connection Manager] The transfer id key was not found or is empty! Not able to do the contract negotiation!")
+
+        saved_edr = connection_entry.copy()
+        saved_edr.pop(JSONLDKeys.AT_TYPE, None)
+        saved_edr.pop(self.provider_id_key, None)
+        saved_edr.pop(JSONLDKeys.AT_CONTEXT, None)
+        return {
+            "transfer_id": transfer_process_id,
+            "counter_party_id": counter_party_id,
+            "counter_party_address": counter_party_address,
+            "query_checksum": query_checksum,
+            "policy_checksum": policy_checksum,
+            "edr_data": saved_edr
+        }
+
+    async def _upsert_rows(self, connection, rows: list[dict]):
+        """
+        Inserts the rows, replacing the connections already stored with the same key.
+        See PostgresConnectionManager._upsert_rows.
+        """
+        dialect = self.engine.dialect.name
+        if self._native_upsert and dialect in ("postgresql", "sqlite"):
+            stmt = (postgresql if dialect == "postgresql" else sqlite).insert(self.table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(self.EDRConnection.CONNECTION_KEY_COLUMNS),
+                set_={"transfer_id": stmt.excluded.transfer_id, "edr_data": stmt.excluded.edr_data}
+            )
+            try:
+                async with connection.begin_nested():
+                    await connection.execute(stmt, rows)
+                return
+            except IntegrityError:
+                ## A transfer id is already stored for another key, replace the rows instead
+                pass
+
+        await connection.execute(delete(self.table).where(self.EDRConnection.connection_key_filter(
+            [[row[column] for column in self.EDRConnection.CONNECTION_KEY_COLUMNS] for row in rows])))
+        await connection.execute(delete(self.table).where(self.table.c.transfer_id.in_([row["transfer_id"] for row in rows])))
+        await connection.execute(insert(self.table), rows)
+
+    async def add_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry: dict) -> str | None:
+        """
+        Adds a new EDR connection to the database, replacing the previous one stored for the same keys.
+
+        Returns:
+            str | None: The transfer process ID of the added connection, or None if not added.
+        """
+        row = self._build_row(counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry)
+        await self._ensure_table()
+        async with self.engine.begin() as connection:
+            await self._upsert_rows(connection, [row])
+        if self.logger and self.verbose:
+            self.logger.info("[Async Postgres Connection Manager] A new EDR entry was saved in the database.")
+        return row["transfer_id"]
+
+    async def _select_first(self, column, key: tuple):
+        await self._ensure_table()
+        async with self.engine.connect() as connection:
+            result = await connection.execute(select(column).where(self.EDRConnection.connection_key_filter([key])).limit(1))
+            return result.scalar_one_or_none()
+
+    async def get_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> dict:
+        """
+        Retrieves the EDR connection data for the given parameters.
+
+        Returns:
+            dict: The EDR connection data or an empty dict if not found.
+        """
+        edr_data = await self._select_first(self.table.c.edr_data, (counter_party_id, counter_party_address, query_checksum, policy_checksum))
+        return edr_data if edr_data else {}
+
+    async def get_connection_transfer_id(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> str | None:
+        """
+        Retrieves the transfer process ID for the given parameters.
+
+        Returns:
+            str | None: The transfer process ID if found, otherwise None.
+        """
+        return await self._select_first(self.table.c.transfer_id, (counter_party_id, counter_party_address, query_checksum, policy_checksum))
+
+    async def delete_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> bool:
+        """
+        Deletes the EDR connection matching the given parameters from the database.
+
+        Returns:
+            bool: True if the connection was deleted, False if not found.
+        """
+        return await self.delete_connections_many([(counter_party_id, counter_party_address, query_checksum, policy_checksum)]) > 0
+
+    async def get_connections_many(self, keys: list[tuple[str, str, str, str]]) -> dict[tuple[str, str, str, str], dict]:
+        """
+        Retrieves the EDR connection data of several connections, with one query per batch.
+        """
+        keys = list(dict.fromkeys(tuple(key) for key in keys))
+        connections = {key: {} for key in keys}
+        columns = [self.table.c[column] for column in self.EDRConnection.CONNECTION_KEY_COLUMNS]
+        await self._ensure_table()
+        async with self.engine.connect() as connection:
+            for i in range(0, len(keys), self.batch_size):
+                result = await connection.execute(select(*columns, self.table.c.edr_data)
+                                                  .where(self.EDRConnection.connection_key_filter(keys[i:i + self.batch_size])))
+                for row in result.all():
+                    connections[tuple(row[:4])] = row[4]
+        return connections
+
+    async def add_connections_many(self, connections: list[tuple[str, str, str, str, dict]]) -> list[str | None]:
+        """
+        Adds several EDR connections in one transaction, with one INSERT ... ON CONFLICT per batch.
+        """
+        rows = [self._build_row(*connection) for connection in connections]
+        ## A statement can only write a connection once, the last entry of a key wins
+        unique_rows = list({tuple(row[column] for column in self.EDRConnection.CONNECTION_KEY_COLUMNS): row for row in rows}.values())
+        unique_rows = list({row["transfer_id"]: row for row in unique_rows}.values())
+        await self._ensure_table()
+        async with self.engine.begin() as connection:
+            for i in range(0, len(unique_rows), self.batch_size):
+                await self._upsert_rows(connection, unique_rows[i:i + self.batch_size])
+        if self.logger and self.verbose:
+            self.logger.info(f"[Async Postgres Connection Manager] {len(unique_rows)} EDR entries were saved in the database.")
+        return [row["transfer_id"] for row in rows]
+
+    async def delete_connections_many(self, keys: list[tuple[str, str, str, str]]) -> int:
+        """
+        Deletes several EDR connections in one transaction, with one statement per batch.
+        """
+        keys = list(dict.fromkeys(tuple(key) for key in keys))
+        deleted = 0
+        await self._ensure_table()
+        async with self.engine.begin() as connection:
+            for i in range(0, len(keys), self.batch_size):
+                result = await connection.execute(delete(self.table).where(self.EDRConnection.connection_key_filter(keys[i:i + self.batch_size])))
+                deleted += result.rowcount
+        if self.logger and self.verbose:
+            self.logger.info(f"[Async Postgres Connection Manager] Deleted {deleted} EDR entries.")
+        return deleted
+
+    def negotiation_lock(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str):
+        """
+        Holds a Postgres advisory lock for the connection while it is negotiated, if the negotiation locking is enabled.
+        """
+        if not self.negotiation_locking:
+            return nullcontext()
+        key = self.get_negotiation_key(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        return async_postgres_advisory_lock(self.engine, f"{self.table_name}:{key}")
@@ -21,16 +21,21 @@
 #################################################################################
 ## Code created partially using a LLM (GPT 4o) and reviewed by a human committer
 
-from sqlmodel import Session, select
+from sqlmodel import Session, select, delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from ..base_connection_manager import BaseConnectionManager
 from ....models.connection.database.edr_base import EDRBase
 from sqlalchemy.engine import Engine as E
 from sqlalchemy.orm import Session as S
 from ....constants import JSONLDKeys
+from .advisory_lock import postgres_advisory_lock
+from contextlib import nullcontext
 import logging
 
 class PostgresConnectionManager(BaseConnectionManager):
-    def __init__(self, engine: E | S, provider_id_key: str = "providerId", table_name: str = "edr_connections", logger:logging.Logger=None, verbose: bool = False):
+    def __init__(self, engine: E | S, provider_id_key: str = "providerId", table_name: str = "edr_connections", logger:logging.Logger=None, verbose: bool = False,
+                 negotiation_locking: bool = False, batch_size: int = 500):
         """
         Initialize the PostgresConnectionManager.
 
@@ -40,6 +45,9 @@ class PostgresConnectionManager(BaseConnectionManager):
             table_name (str): The name of the table to store EDR connections.
             logger (logging.Logger, optional): Logger instance for outputting messages.
             verbose (bool): Whether to output verbose log messages.
+            negotiation_locking (bool): Whether to lock the negotiations with Postgres advisory locks,
+                so that only one process sharing the database negotiates the same connection.
+            batch_size (int): Maximum number of connections read or written per statement by the bulk methods.
         """
         # Store the provided engine and configuration details
         self.engine = engine
@@ -47,6 +55,8 @@ class PostgresConnectionManager(BaseConnectionManager):
         self.table_name = table_name
         self.logger = logger
         self.verbose = verbose
+        self.negotiation_locking = negotiation_locking
+        self.batch_size = batch_size
 
         # Define a dynamic SQLModel class tied to the specified table name for storing EDR connections
         class DynamicEDRConnection(EDRBase, table=True):
@@ -55,51 +65,103 @@ class PostgresConnectionManager(BaseConnectionManager):
 
         self.EDRConnection = DynamicEDRConnection
         # Ensure the database table exists based on the dynamic class definition
+        # The connections are looked up and upserted by their key, so the key columns get a unique index
+        connection_key_index = DynamicEDRConnection.connection_key_index(unique=True)
         DynamicEDRConnection.metadata.create_all(engine)
+        self._native_upsert = self._create_index(connection_key_index)
 
-    def add_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry: dict) -> str | None:
+    def _create_index(self, index) -> bool:
         """
-        Adds a new EDR connection to the database if it doesn't already exist.
-
-        Args:
-            counter_party_id (str): The ID of the counter party.
-            counter_party_address (str): The address of the counter party.
-            query_checksum (str): A checksum identifying the query.
-            policy_checksum (str): A checksum identifying the policy.
-            connection_entry (dict): The EDR connection data.
+        Creates the index in the database if it does not exist yet, as tables created by older versions lack it.
 
         Returns:
-            str | None: The transfer process ID of the added connection, or None if not added.
+            bool: True if the index exists, False if it could not be created (i.e. duplicated connections are stored).
+        """
+        try:
+            index.create(self.engine, checkfirst=True)
+            return True
+        except SQLAlchemyError as e:
+            if self.logger:
+                self.logger.warning(f"[Postgres Connection Manager] The index [{index.name}] could not be created, upserts will not use it: {e}")
+            return False
+
+    def _key_filter(self, keys):
+        """
+        Builds the filter matching the rows of the given connection keys.
+        """
+        return self.EDRConnection.connection_key_filter(keys)
+
+    def _build_row(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry: dict) -> dict:
+        """
+        Builds the row stored for an EDR connection, without the metadata fields that are not needed for storage.
         """
         # Extract transfer process ID from the EDR entry and validate it exists
         transfer_process_id: str = connection_entry.get(JSONLDKeys.AT_ID, None)
         if not transfer_process_id:
             raise Exception("[Postgres Connection Manager] The transfer id key was not found or is empty! Not able to do the contract negotiation!")
 
-        # Remove metadata fields that are not needed for storage
         saved_edr = connection_entry.copy()
         saved_edr.pop(JSONLDKeys.AT_TYPE, None)
         saved_edr.pop(self.provider_id_key, None)
         saved_edr.pop(JSONLDKeys.AT_CONTEXT, None)
+        return {
+            "transfer_id": transfer_process_id,
+            "counter_party_id": counter_party_id,
+            "counter_party_address": counter_party_address,
+            "query_checksum": query_checksum,
+            "policy_checksum": policy_checksum,
+            "edr_data": saved_edr
+        }
 
-        # Prepare the ORM model instance for insertion
-        new_entry = self.EDRConnection(
-            counter_party_id=counter_party_id,
-            counter_party_address=counter_party_address,
-            query_checksum=query_checksum,
-            policy_checksum=policy_checksum,
-            transfer_id=transfer_process_id,
-            edr_data=saved_edr
-        )
+    def _upsert_rows(self, session, rows: list[dict]):
+        """
+        Inserts the rows, replacing the connections already stored with the same key.
+
+        Postgres and SQLite use a native INSERT ... ON CONFLICT on the connection key index,
+        other databases and tables without the index delete the previous rows first.
+        """
+        dialect = self.engine.dialect.name
+        if self._native_upsert and dialect in ("postgresql", "sqlite"):
+            stmt = (postgresql if dialect == "postgresql" else sqlite).insert(self.EDRConnection)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(self.EDRConnection.CONNECTION_KEY_COLUMNS),
+                set_={"transfer_id": stmt.excluded.transfer_id, "edr_data": stmt.excluded.edr_data}
+            )
+            try:
+                with session.begin_nested():
+                    session.execute(stmt, rows)
+                return
+            except IntegrityError:
+                ## A transfer id is already stored for another key, replace the rows instead
+                pass
 
-        # Check for existing connection with the same transfer_id to avoid duplicates
+        session.exec(delete(self.EDRConnection).where(
+            self._key_filter([[row[column] for column in self.EDRConnection.CONNECTION_KEY_COLUMNS] for row in rows])))
+        session.exec(delete(self.EDRConnection).where(self.EDRConnection.transfer_id.in_([row["transfer_id"] for row in rows])))
+        session.execute(insert(self.EDRConnection), rows)
+
+    def add_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry: dict) -> str | None:
+        """
+        Adds a new EDR connection to the database, replacing the previous one stored for the same keys.
+
+        Args:
+            counter_party_id (str): The ID of the counter party.
+            counter_party_address (str): The address of the counter party.
+            query_checksum (str): A checksum identifying the query.
+            policy_checksum (str): A checksum identifying the policy.
+            connection_entry (dict): The EDR connection data.
+
+        Returns:
+            str | None: The transfer process ID of the added connection, or None if not added.
+        """
+        # Store the connection with a single INSERT ... ON CONFLICT, replacing a previous transfer for the same key
+        row = self._build_row(counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry)
         with Session(self.engine) as session:
-            if not session.get(self.EDRConnection, transfer_process_id):
-                session.add(new_entry)
-                session.commit()
-                if self.logger and self.verbose:
-                    self.logger.info("[Postgres Connection Manager] A new EDR entry was saved in the database.")
-        return transfer_process_id
+            self._upsert_rows(session, [row])
+            session.commit()
+        if self.logger and self.verbose:
+            self.logger.info("[Postgres Connection Manager] A new EDR entry was saved in the database.")
+        return row["transfer_id"]
 
     def get_connection(self, counter_party_id, counter_party_address, query_checksum, policy_checksum):
         """
@@ -164,25 +226,91 @@ class PostgresConnectionManager(BaseConnectionManager):
         Returns:
             bool: True if the connection was deleted, False if not found.
         """
-        # Build a query to find the specific EDR connection for deletion
-        stmt = select(self.EDRConnection).where(
-            self.EDRConnection.counter_party_id == counter_party_id,
-            self.EDRConnection.counter_party_address == counter_party_address,
-            self.EDRConnection.query_checksum == query_checksum,
-            self.EDRConnection.policy_checksum == policy_checksum
-        )
-        # If found, delete the connection and commit the transaction
+        # Delete the connection with a single statement
         # Log the action if verbose logging is enabled
         # Return True if deleted, False if not found
         with Session(self.engine) as session:
-            result = session.exec(stmt).first()
-            if result:
-                session.delete(result)
-                session.commit()
-                if self.logger and self.verbose:
-                    self.logger.info(f"[Postgres Connection Manager] Deleted EDR entry for policy checksum '{policy_checksum}'.")
-                return True
-            else:
-                if self.logger and self.verbose:
-                    self.logger.info(f"[Postgres Connection Manager] No EDR found to delete for the provided keys.")
-                return False
\ No newline at end of file
+            result = session.exec(delete(self.EDRConnection).where(self._key_filter([(counter_party_id, counter_party_address, query_checksum, policy_checksum)])))
+            session.commit()
+        if result.rowcount:
+            if self.logger and self.verbose:
+                self.logger.info(f"[Postgres Connection Manager] Deleted EDR entry for policy checksum '{policy_checksum}'.")
+            return True
+        if self.logger and self.verbose:
+            self.logger.info(f"[Postgres Connection Manager] No EDR found to delete for the provided keys.")
+        return False
+
+    def get_connections_many(self, keys: list[tuple[str, str, str, str]]) -> dict[tuple[str, str, str, str], dict]:
+        """
+        Retrieves the EDR connection data of several connections, with one query per batch.
+
+        Args:
+            keys (list[tuple]): The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples of the connections.
+
+        Returns:
+            dict: The EDR connection data by key, an empty dict for the connections not found.
+        """
+        keys = list(dict.fromkeys(tuple(key) for key in keys))
+        connections = {key: {} for key in keys}
+        with Session(self.engine) as session:
+            for i in range(0, len(keys), self.batch_size):
+                for row in session.exec(select(self.EDRConnection).where(self._key_filter(keys[i:i + self.batch_size]))).all():
+                    connections[(row.counter_party_id, row.counter_party_address, row.query_checksum, row.policy_checksum)] = row.edr_data
+        return connections
+
+    def add_connections_many(self, connections: list[tuple[str, str, str, str, dict]]) -> list[str | None]:
+        """
+        Adds several EDR connections in one transaction, with one INSERT ... ON CONFLICT per batch.
+
+        Args:
+            connections (list[tuple]): The (counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry) tuples to add.
+
+        Returns:
+            list[str | None]: The transfer process IDs of the added connections, in the same order.
+        """
+        rows = [self._build_row(*connection) for connection in connections]
+        ## A statement can only write a connection once, the last entry of a key wins
+        unique_rows = list({tuple(row[column] for column in self.EDRConnection.CONNECTION_KEY_COLUMNS): row for row in rows}.values())
+        unique_rows = list({row["transfer_id"]: row for row in unique_rows}.values())
+        with Session(self.engine) as session:
+            for i in range(0, len(unique_rows), self.batch_size):
+                self._upsert_rows(session, unique_rows[i:i + self.batch_size])
+            session.commit()
+        if self.logger and self.verbose:
+            self.logger.info(f"[Postgres Connection Manager] {len(unique_rows)} EDR entries were saved in the database.")
+        return [row["transfer_id"] for row in rows]
+
+    def delete_connections_many(self, keys: list[tuple[str, str, str, str]]) -> int:
+        """
+        Deletes several EDR connections in one transaction, with one statement per batch.
+
+        Args:
+            keys (list[tuple]): The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples of the connections.
+
+        Returns:
+            int: The number of deleted connections.
+        """
+        keys = list(dict.fromkeys(tuple(key) for key in keys))
+        deleted = 0
+        with Session(self.engine) as session:
+            for i in range(0, len(keys), self.batch_size):
+                deleted += session.exec(delete(self.EDRConnection).where(self._key_filter(keys[i:i + self.batch_size]))).rowcount
+            session.commit()
+        if self.logger and self.verbose:
+            self.logger.info(f"[Postgres Connection Manager] Deleted {deleted} EDR entries.")
+        return deleted
+
+    def negotiation_lock(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str):
+        """
+        Holds a Postgres advisory lock for the connection while it is negotiated, if the negotiation locking is enabled.
+
+        Args:
+            counter_party_id (str): The ID of the counter party.
+            counter_party_address (str): The address of the counter party.
+            query_checksum (str): A checksum identifying the query.
+            policy_checksum (str): A checksum identifying the policy.
+        """
+        if not self.negotiation_locking:
+            return nullcontext()
+        key = self.get_negotiation_key(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        return postgres_advisory_lock(self.engine, f"{self.table_name}:{key}")
@@ -23,22 +23,36 @@
 
 import threading
 import hashlib
-import json
-from ....models.connection.database.edr_base import EDRBase
-from sqlmodel import select, delete, Session, SQLModel
+from ....models.connection.database.edr_revision_base import EDRRevisionBase
+from sqlmodel import select, delete, insert, update, func, Session, SQLModel
+from sqlalchemy import Index, inspect, text
 from sqlalchemy.exc import SQLAlchemyError
+from ..change_tracking_mixin import ChangeTrackingMixin
 from ..memory.memory_connection_manager import MemoryConnectionManager
 import logging
 from ....constants import JSONLDKeys  
+from .advisory_lock import postgres_advisory_lock, postgres_transaction_advisory_lock
+from contextlib import contextmanager, nullcontext
 
 
-class PostgresMemoryConnectionManager(MemoryConnectionManager):
+class PostgresMemoryConnectionManager(ChangeTrackingMixin, MemoryConnectionManager):
     """
     Connection manager for storing and synchronizing EDR connections between memory and a Postgres database.
     Inherits from MemoryConnectionManager to maintain an in-memory cache and extends it with persistent storage functionality.
+
+    Only the connections added or deleted since the last save are written to the database.
+    Every save gets a new revision, and deleted connections are kept as tombstones for a number of revisions,
+    so that after the first load only the rows changed since the last sync are read from the database.
     """
 
-    def __init__(self, engine, provider_id_key="providerId", table_name="edr_connections", edrs_key="edrs", logger:logging.Logger=None, verbose:bool=False):
+    UPSERT = "upsert"
+    DELETE = "delete"
+    ## Columns missing in the tables created by older versions, with the values of their existing rows
+    REVISION_COLUMNS = {"revision": "INTEGER NOT NULL DEFAULT 0", "deleted": "BOOLEAN NOT NULL DEFAULT FALSE"}
+
+    def __init__(self, engine, provider_id_key="providerId", table_name="edr_connections", edrs_key="edrs", logger:logging.Logger=None, verbose:bool=False,
+                 negotiation_locking:bool=False, save_batch_size:int=500,
+                 tombstone_retention:int=10000):
         """
         Initialize the Postgres memory-backed connection manager.
 
@@ -49,6 +63,10 @@ class PostgresMemoryConnectionManager(MemoryConnectionManager):
             edrs_key: Key used to store EDR counts within open_connections.
             logger: Optional logger instance for debug output.
             verbose: Flag for enabling verbose logging.
+            negotiation_locking: Flag for locking the negotiations with Postgres advisory locks across processes.
+            save_batch_size: Maximum number of changed EDRs written per database statement.
+            tombstone_retention: Number of revisions the deleted connections are kept in the database,
+                replicas syncing less often than this may miss deletions.
         """
         # Initialize base memory connection manager and configure database.
         # Dynamically define the SQLModel table for EDR connections.
@@ -57,20 +75,52 @@ class PostgresMemoryConnectionManager(MemoryConnectionManager):
         self.engine = engine
         self.provider_id_key = provider_id_key
         self.table_name = table_name
-        self.open_connections = {}
         self._stop_event = threading.Event()
         self.edrs_key = edrs_key
         self._save_thread = None
-        self._last_saved_hash = None
+        ## Keys changed since the last save, mapped to their pending operation
+        self._dirty = {}
+        self._flush_lock = threading.Lock()
+        self.save_batch_size = save_batch_size
+        self.tombstone_retention = tombstone_retention
+        ## Highest revision read from the database, None until the first load
+        self._last_revision = None
+        self.negotiation_locking = negotiation_locking
         SQLModel.metadata.create_all(engine)
-        class DynamicEDRConnection(EDRBase, table=True):
+        class DynamicEDRConnection(EDRRevisionBase, table=True):
             __tablename__ = table_name
             __table_args__ = {"extend_existing": True}
 
         self.EDRConnection = DynamicEDRConnection
+        ## The changes are read by revision, the table may already have the index when redefined
+        table = DynamicEDRConnection.__table__
+        if not any(index.name == f"ix_{table_name}_revision" for index in table.indexes):
+            Index(f"ix_{table_name}_revision", table.c.revision)
         DynamicEDRConnection.metadata.create_all(engine)
+        self._migrate_table()
         self._load_from_db()
 
+    def _migrate_table(self):
+        """
+        Adds the revision columns and index to a table created by an older version, since create_all() skips the
+        existing tables. Without them the connections could neither be loaded nor saved, so failing is an error.
+        """
+        preparer = self.engine.dialect.identifier_preparer
+        table = preparer.quote(self.table_name)
+        ## Several replicas may start at the same time, Postgres can skip the columns added meanwhile
+        if_not_exists = "IF NOT EXISTS " if self.engine.dialect.name == "postgresql" else ""
+        try:
+            columns = {column["name"] for column in inspect(self.engine).get_columns(self.table_name)}
+            with self.engine.begin() as connection:
+                for name, definition in self.REVISION_COLUMNS.items():
+                    if name not in columns:
+                        connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {if_not_exists}{name} {definition}"))
+                        if self.logger and self.verbose:
+                            self.logger.info(f"[PostgresMemoryConnectionManager] Added the column [{name}] to the table [{self.table_name}].")
+                connection.execute(text(f"CREATE INDEX IF NOT EXISTS {preparer.quote(f'ix_{self.table_name}_revision')} ON {table} (revision)"))
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"[PostgresMemoryConnectionManager] The table [{self.table_name}] could not be migrated to the revision schema: {e}") from e
+
     def add_connection(self, counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry) -> str:
         """
         Add a new EDR connection and trigger database persistence.
@@ -85,8 +135,11 @@ class PostgresMemoryConnectionManager(MemoryConnectionManager):
         Returns:
             The transfer process ID of the added connection.
         """
-        # Delegate to the base memory manager and trigger persistence in the background.
-        response = super().add_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry)
+        # Delegate to the base memory manager, record the change and trigger persistence in the background.
+        with self._lock:
+            response = super().add_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry)
+            self._dirty[(counter_party_id, counter_party_address, query_checksum, policy_checksum)] = self.UPSERT
+            self._mark_changed()
         self._trigger_save()
         return response
 
@@ -103,12 +156,35 @@ class PostgresMemoryConnectionManager(MemoryConnectionManager):
         Returns:
             True if the connection was deleted successfully.
         """
-        # Delegate to the base memory manager and trigger persistence in the background.
-        super().delete_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        # Delegate to the base memory manager, record the change and trigger persistence in the background.
+        with self._lock:
+            if super().delete_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum):
+                self._dirty[(counter_party_id, counter_party_address, query_checksum, policy_checksum)] = self.DELETE
+                self._mark_changed()
 
         self._trigger_save()
         return True
 
+    def negotiation_lock(self, counter_party_id, counter_party_address, query_checksum, policy_checksum):
+        """
+        Holds a Postgres advisory lock for the connection while it is negotiated, if the negotiation locking is enabled.
+        The connections are reloaded once the lock is acquired and saved before it is released,
+        so that the other processes see the negotiated connection.
+        """
+        if not self.negotiation_locking:
+            return nullcontext()
+        key = self.get_negotiation_key(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        return self._synchronized_negotiation(f"{self.table_name}:{key}")
+
+    @contextmanager
+    def _synchronized_negotiation(self, key):
+        with postgres_advisory_lock(self.engine, key):
+            self._load_from_db()
+            try:
+                yield
+            finally:
+                self._save_to_db()
+
     def _trigger_save(self):
         """
         Trigger a background thread to persist current connections to the database.
@@ -121,97 +197,167 @@ class PostgresMemoryConnectionManager(MemoryConnectionManager):
         
     def _load_from_db(self):
         """
-        Reload connections from the DB if any hashes have changed compared to memory.
+        Load the connections from the DB, fully on the first call and afterwards only the rows changed since the last sync.
         """
-        # Calculate current hashes and skip if unchanged.
-        # Rebuild in-memory connections from DB rows.
-        with self._lock:
+        # Do not interleave with the saves, so that the changes being saved are not lost from memory.
+        with self._flush_lock:
             try:
-                with Session(self.engine) as session:
-                    db_hashes = {
-                        hash for hash in session.exec(select(self.EDRConnection.edr_hash)).all()
-                    }
-                    current_hashes = {
-                        self._calculate_connection_hash(provider_id, endpoint, query_checksum, policy_checksum)
-                        for provider_id, endpoints in self.open_connections.items() if provider_id != self.edrs_key
-                        for endpoint, queries in endpoints.items() if endpoint != self.edrs_key
-                        for query_checksum in queries
-                        for policy_checksum in queries[query_checksum]
-                    }
-                    if current_hashes == db_hashes:
-                        return
-
-                    _loaded_edrs = 0
-                    self.open_connections = {}
-                    result = session.exec(select(self.EDRConnection)).all()
-                    for row in result:
-                        provider_id = row.counter_party_id
-                        endpoint = row.counter_party_address
-                        query_checksum = row.query_checksum
-                        policy_checksum = row.policy_checksum
-                        edr_data = row.edr_data
-
-                        if provider_id not in self.open_connections:
-                            self.open_connections[provider_id] = {}
-                        if endpoint not in self.open_connections[provider_id]:
-                            self.open_connections[provider_id][endpoint] = {}
-                        if query_checksum not in self.open_connections[provider_id][endpoint]:
-                            self.open_connections[provider_id][endpoint][query_checksum] = {}
-                        self.open_connections[provider_id][endpoint][query_checksum][policy_checksum] = edr_data
-                        _loaded_edrs += 1
-
-                    self.open_connections[self.edrs_key] = _loaded_edrs
-                if self.logger and self.verbose:
-                    self.logger.info(f"[PostgresMemoryConnectionManager] Loaded {_loaded_edrs} edrs from the database.")
-                self._last_saved_hash = hashlib.sha256(json.dumps(self.open_connections, sort_keys=True, default=str).encode()).hexdigest()
+                if self._last_revision is None:
+                    self._load_all_from_db()
+                else:
+                    self._load_changes_from_db()
             except SQLAlchemyError as e:
                 if self.logger and self.verbose:
                     self.logger.error(f"[PostgresMemoryConnectionManager] Error loading from db: {e}")
-    
+
+    def _load_all_from_db(self):
+        """
+        Rebuild the in-memory connections from all the DB rows, keeping the changes not yet saved.
+        """
+        with Session(self.engine) as session:
+            rows = session.exec(select(self.EDRConnection)).all()
+
+        connections = {
+            (row.counter_party_id, row.counter_party_address, row.query_checksum, row.policy_checksum): row.edr_data
+            for row in rows if not row.deleted
+        }
+        with self._lock:
+            ## Keep the changes which were not saved yet on top of the loaded connections
+            self._apply_pending_changes(connections)
+            self._replace_entries(connections)
+            _loaded_edrs = len(connections)
+            self._last_revision = max((row.revision for row in rows), default=0)
+        if self.logger and self.verbose:
+            self.logger.info(f"[PostgresMemoryConnectionManager] Loaded {_loaded_edrs} edrs from the database.")
+
+    def _load_changes_from_db(self):
+        """
+        Apply the DB rows changed since the last sync to the in-memory connections.
+        Connections with changes not yet saved keep their in-memory value.
+        """
+        # Within a revision the tombstones are applied first, a connection may be replaced in the same save.
+        with Session(self.engine) as session:
+            rows = session.exec(
+                select(self.EDRConnection)
+                .where(self.EDRConnection.revision > self._last_revision)
+                .order_by(self.EDRConnection.revision, self.EDRConnection.deleted.desc())
+            ).all()
+        if not rows:
+            return
+
+        with self._lock:
+            for row in rows:
+                key = (row.counter_party_id, row.counter_party_address, row.query_checksum, row.policy_checksum)
+                if key in self._dirty:
+                    continue
+                if row.deleted:
+                    ## Only remove the connection if it was not replaced by another transfer
+                    stored = self._connections.get(key)
+                    if stored is not None and stored.get(JSONLDKeys.AT_ID) == row.transfer_id:
+                        self._pop_entry(key)
+                    continue
+                self._set_entry(key, row.edr_data)
+            self._last_revision = rows[-1].revision
+        if self.logger and self.verbose:
+            self.logger.info(f"[PostgresMemoryConnectionManager] Loaded {len(rows)} changed edrs from the database.")
+
     def _calculate_connection_hash(self, provider_id, endpoint, query_checksum, policy_checksum):
         """
         Generate a SHA256 hash based on connection keys for change detection.
         """
         base_string = f"{provider_id}:{endpoint}:{query_checksum}:{policy_checksum}"
         return hashlib.sha256(base_string.encode()).hexdigest()
-          
-    def _save_to_db(self):
+
+    def _apply_pending_changes(self, connections: dict):
         """
-        Persist current in-memory connections to the DB only if changes are detected.
+        Apply the changes not yet saved to the database from the stored connections to the loaded ones.
+        Must be called while holding the lock.
+        """
+        for key, operation in self._dirty.items():
+            if operation == self.DELETE:
+                connections.pop(key, None)
+            elif key in self._connections:
+                connections[key] = self._connections[key]
+
+    def _take_changes(self):
+        """
+        Take the pending changes out of the dirty set, together with a snapshot of the changed connections.
+
+        Returns:
+            A tuple with the change version, the pending changes, the rows to upsert and the hashes of the rows to delete.
         """
-        # Clear table and repopulate from in-memory state.
-        # Update saved hash after committing changes.
         with self._lock:
-            current_hash = hashlib.sha256(json.dumps(self.open_connections, sort_keys=True, default=str).encode()).hexdigest()
-            if current_hash == self._last_saved_hash:
+            version = self.change_version
+            changes = self._dirty
+            self._dirty = {}
+            rows = []
+            deleted_hashes = []
+            for key, operation in changes.items():
+                provider_id, endpoint, query_checksum, policy_checksum = key
+                hash_value = self._calculate_connection_hash(provider_id, endpoint, query_checksum, policy_checksum)
+                edr_data = self._connections.get(key)
+                if operation == self.DELETE or edr_data is None:
+                    deleted_hashes.append(hash_value)
+                    continue
+                rows.append({
+                    "transfer_id": edr_data.get(JSONLDKeys.AT_ID),
+                    "counter_party_id": provider_id,
+                    "counter_party_address": endpoint,
+                    "query_checksum": query_checksum,
+                    "policy_checksum": policy_checksum,
+                    "edr_data": dict(edr_data),
+                    "edr_hash": hash_value
+                })
+        return version, changes, rows, deleted_hashes
+
+    def _save_to_db(self):
+        """
+        Persist the connections added or deleted since the last save to the DB, under a new revision.
+        The lock is only held while taking the changes, not during the database operations.
+        """
+        # Idle ticks only compare the change version with the saved one.
+        if not self.has_unsaved_changes():
+            return
+        # Serialize the flushes so that the changes are written in the order they were taken.
+        with self._flush_lock:
+            version, changes, rows, deleted_hashes = self._take_changes()
+            if not changes:
+                self._mark_saved(version)
                 return
             try:
-                _saved_edrs=0
                 with Session(self.engine) as session:
-                    session.exec(delete(self.EDRConnection))
-                    for provider_id, endpoints in self.open_connections.items():
-                        if provider_id == self.edrs_key:
-                            continue
-                        for endpoint, queries in endpoints.items():
-                            for query_checksum, policies in queries.items():
-                                for policy_checksum, edr_data in policies.items():
-                                    hash_value = self._calculate_connection_hash(provider_id, endpoint, query_checksum, policy_checksum)
-                                    session.add(self.EDRConnection(
-                                        transfer_id=edr_data.get(JSONLDKeys.AT_ID),
-                                        counter_party_id=provider_id,
-                                        counter_party_address=endpoint,
-                                        query_checksum=query_checksum,
-                                        policy_checksum=policy_checksum,
-                                        edr_data=edr_data,
-                                        edr_hash=hash_value
-                                    ))
-                                    _saved_edrs+=1
-                                    
+                    # The writers are serialized, so the revisions are committed in increasing order.
+                    postgres_transaction_advisory_lock(session, f"{self.table_name}:revision")
+                    revision = (session.exec(select(func.max(self.EDRConnection.revision))).one() or 0) + 1
+                    tombstone = dict(deleted=True, revision=revision)
+
+                    # Replace the stored rows of the changed keys in batches, within a single transaction.
+                    for i in range(0, len(deleted_hashes), self.save_batch_size):
+                        batch = deleted_hashes[i:i + self.save_batch_size]
+                        session.exec(update(self.EDRConnection).where(
+                            self.EDRConnection.edr_hash.in_(batch), self.EDRConnection.deleted == False).values(**tombstone))
+                    for i in range(0, len(rows), self.save_batch_size):
+                        batch = [dict(row, revision=revision, deleted=False) for row in rows[i:i + self.save_batch_size]]
+                        session.exec(delete(self.EDRConnection).where(
+                            self.EDRConnection.transfer_id.in_([row["transfer_id"] for row in batch])))
+                        session.exec(update(self.EDRConnection).where(
+                            self.EDRConnection.edr_hash.in_([row["edr_hash"] for row in batch]),
+                            self.EDRConnection.deleted == False).values(**tombstone))
+                        session.execute(insert(self.EDRConnection), batch)
+
+                    # Drop the tombstones every replica had the time to see.
+                    session.exec(delete(self.EDRConnection).where(
+                        self.EDRConnection.deleted == True,
+                        self.EDRConnection.revision <= revision - self.tombstone_retention))
                     session.commit()
-                    self._last_saved_hash = current_hash
-                    if self.logger and self.verbose:
-                        self.logger.info(f"[PostgresMemoryConnectionManager] Saved {_saved_edrs} edrs to the database.")
+                self._mark_saved(version)
+                if self.logger and self.verbose:
+                    self.logger.info(f"[PostgresMemoryConnectionManager] Saved {len(rows)} and deleted {len(deleted_hashes)} edrs in the database at revision {revision}.")
             except SQLAlchemyError as e:
+                # Put the changes back, unless the keys were changed again in the meantime.
+                with self._lock:
+                    for key, operation in changes.items():
+                        self._dirty.setdefault(key, operation)
                 if self.logger and self.verbose:
                     self.logger.error(f"[PostgresMemoryConnectionManager] Error saving to db: {e}")
 
@@ -32,8 +32,10 @@ class PostgresMemoryRefreshConnectionManager(PostgresMemoryConnectionManager):
     """
     Manages EDR connections using an in-memory cache synchronized with a Postgres database.
     Periodically persists changes and reloads updates from the database to ensure consistency.
+    Only the rows changed since the last sync are reloaded, so a refresh costs in proportion to the changes.
     """
-    def __init__(self, engine: E | S, persist_interval: int = 5, provider_id_key: str = "providerId", table_name: str = "edr_connections", edrs_key: str = "edrs", logger:logging.Logger=None, verbose: bool = False):
+    def __init__(self, engine: E | S, persist_interval: int = 5, provider_id_key: str = "providerId", table_name: str = "edr_connections", edrs_key: str = "edrs", logger:logging.Logger=None, verbose: bool = False,
+                 negotiation_locking: bool = False, save_batch_size: int = 500, tombstone_retention: int = 10000):
         """
         Initialize the connection manager with persistence and reload functionality.
 
@@ -45,8 +47,13 @@ class PostgresMemoryRefreshConnectionManager(PostgresMemoryConnectionManager):
             edrs_key (str): Key used for storing EDR counts.
             logger (Logger, optional): Logger instance for debug output.
             verbose (bool): Enable verbose logging.
+            negotiation_locking (bool): Lock the negotiations with Postgres advisory locks across processes.
+            save_batch_size (int): Maximum number of changed EDRs written per database statement.
+            tombstone_retention (int): Number of revisions the deleted connections are kept in the database.
         """
-        super().__init__(engine=engine, provider_id_key=provider_id_key, edrs_key=edrs_key, logger=logger, verbose=verbose)
+        super().__init__(engine=engine, provider_id_key=provider_id_key, edrs_key=edrs_key, logger=logger, verbose=verbose,
+                         negotiation_locking=negotiation_locking, save_batch_size=save_batch_size,
+                         tombstone_retention=tombstone_retention)
         self.persist_interval = persist_interval
         self._stop_event = threading.Event()
         self._start_background_tasks()
@@ -59,7 +66,7 @@ class PostgresMemoryRefreshConnectionManager(PostgresMemoryConnectionManager):
 
     def _persistence_loop(self):
         """
-        Periodically save current in-memory connections to DB and reload any changes.
+        Periodically save the changed in-memory connections to DB and reload the rows changed by the other replicas.
         """
         while not self._stop_event.is_set():
             time.sleep(self.persist_interval)
@@ -32,3 +32,4 @@ __author__ = 'Eclipse Tractus-X Contributors'
 __license__ = "Apache License, Version 2.0"
 
 from .file_system_connection_manager import FileSystemConnectionManager
+from .async_file_system_connection_manager import AsyncFileSystemConnectionManager
@@ -0,0 +1,87 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+FileSystem-based connection manager for event loops, keeping the file access out of the loop.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager, nullcontext
+from filelock import FileLock, Timeout
+from ..memory import AsyncMemoryConnectionManager
+from .file_system_connection_manager import FileSystemConnectionManager
+
+class AsyncFileSystemConnectionManager(AsyncMemoryConnectionManager):
+    """
+    Awaitable wrapper of the FileSystemConnectionManager.
+
+    The connections are served from memory and the journal is written by the background thread of the wrapped manager.
+    The negotiation lock waits for its lock file without blocking the event loop, and reloads and saves the journal
+    in a worker thread.
+    """
+
+    manager: FileSystemConnectionManager
+
+    def __init__(self, path: str = "./data/connection_cache.jsonl", persist_interval: int = 5, negotiation_locking: bool = False,
+                 compact_min_records: int = 1000, lock_poll_interval: float = 0.05, logger: logging.Logger = None,
+                 verbose: bool = False):
+        """
+        Initializes the AsyncFileSystemConnectionManager, see the FileSystemConnectionManager for the journal arguments.
+
+        Args:
+            lock_poll_interval (float): Seconds between the attempts to acquire a negotiation lock file held by another process.
+        """
+        self._setup(FileSystemConnectionManager(path=path, persist_interval=persist_interval, negotiation_locking=negotiation_locking,
+                                                compact_min_records=compact_min_records, logger=logger, verbose=verbose),
+                    negotiation_locking)
+        self.lock_poll_interval = lock_poll_interval
+
+    def negotiation_lock(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str):
+        """
+        Holds a lock file for the connection while it is negotiated, if the negotiation locking is enabled.
+        The connections are reloaded once the lock is acquired and saved before it is released.
+        """
+        if not self.negotiation_locking:
+            return nullcontext()
+        key = self.get_negotiation_key(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        return self._synchronized_negotiation(key)
+
+    @asynccontextmanager
+    async def _synchronized_negotiation(self, key: str):
+        ## The tasks of this process queue on the local lock, only one of them polls the lock file
+        async with self._local_negotiation_lock(key):
+            negotiation_lock = FileLock(f"{self.manager.file_path}.{key}.lock")
+            while True:
+                try:
+                    negotiation_lock.acquire(timeout=0)
+                    break
+                except Timeout:
+                    await asyncio.sleep(self.lock_poll_interval)
+            try:
+                await asyncio.to_thread(self.manager._load_if_updated)
+                yield
+            finally:
+                try:
+                    await asyncio.to_thread(self.manager._save_to_file)
+                finally:
+                    negotiation_lock.release()
@@ -21,46 +21,118 @@
 #################################################################################
 """
 FileSystem-based connection manager for persisting EDR connections to disk.
-Extends MemoryConnectionManager to support persistence using JSON files with file-based locking.
+Extends MemoryConnectionManager to support persistence using an append-only JSON Lines journal with file-based locking.
 """
 ## Code created partially using a LLM (GPT 4o) and reviewed by a human committer
 
 import json
+import logging
 import os
+import shutil
 import threading
 import time
+from contextlib import contextmanager, nullcontext
 from filelock import FileLock
+from ..change_tracking_mixin import ChangeTrackingMixin
 from ..memory import MemoryConnectionManager
-import hashlib
-class FileSystemConnectionManager(MemoryConnectionManager):
+
+class FileSystemConnectionManager(ChangeTrackingMixin, MemoryConnectionManager):
     """
-    Manages EDR connections with persistence to the filesystem using JSON files.
-    Periodically saves and reloads data from disk to keep in-memory cache synchronized.
+    Manages EDR connections with persistence to the filesystem using an append-only JSON Lines journal.
+
+    Every added or deleted connection is appended as a record, and the other processes sharing the file
+    only read the records appended since their last read. The file is skipped when its size and modification
+    time did not change. Once the journal holds too many outdated records it is compacted into a new file,
+    which atomically replaces the journal.
     """
     
     file_path: str
     lock: FileLock
     persist_interval: int
     _stop_event: threading.Event
+
+    PUT = "put"
+    DELETE = "del"
+    JOURNAL_EXTENSION = ".jsonl"
     
-    def __init__(self, path: str = "./data/connection_cache.json", persist_interval: int = 5):
+    def __init__(self, path: str = "./data/connection_cache.jsonl", persist_interval: int = 5, negotiation_locking: bool = False,
+                 compact_min_records: int = 1000, logger: logging.Logger = None, verbose: bool = False):
         """
         Initialize the file system connection manager with periodic persistence.
 
         Args:
-            path (str): Path to the JSON file used for persisting connections.
+            path (str): Path to the JSON Lines journal used for persisting connections. If the journal does not exist yet,
+                the file of older versions with the same path but the ".json" extension is migrated into it.
             persist_interval (int): Time interval in seconds for saving and reloading connections.
+            negotiation_locking (bool): Whether to lock the negotiations with lock files, so that only one
+                process sharing the journal negotiates the same connection.
+            compact_min_records (int): Minimum number of records in the journal before it is compacted,
+                it is compacted once it holds more than twice the records of the stored connections.
+            logger (logging.Logger): Logger for the persistence errors, they are printed if not given.
+            verbose (bool): Whether the cache operations are logged.
         """
         # Set up the file path, file lock, and background persistence thread.
-        super().__init__()
+        super().__init__(logger=logger, verbose=verbose)
         self.file_path = path
         self.lock = FileLock(f"{self.file_path}.lock")
         self.persist_interval = persist_interval
+        self.negotiation_locking = negotiation_locking
+        self.compact_min_records = compact_min_records
         self._stop_event = threading.Event()
-        self._last_loaded_hash = None
+        ## Records not yet appended to the journal
+        self._pending = []
+        ## Identity, size and modification time of the journal when it was last read, and the offset read up to
+        self._file_state = None
+        self._offset = 0
+        self._records = 0
+        self._file_access = threading.Lock()
+        self._migrate_legacy_file()
         self._load_if_updated()
         self._start_background_tasks()
 
+    def add_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry: dict) -> str | None:
+        """
+        Adds a new EDR connection to the cache and records it for the journal.
+        """
+        key = (counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        with self._lock:
+            transfer_process_id = super().add_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry)
+            if key in self._connections:
+                self._pending.append({"op": self.PUT, "key": list(key), "edr": self._connections[key]})
+                self._mark_changed()
+        return transfer_process_id
+
+    def delete_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> bool:
+        """
+        Deletes an EDR connection from the cache and records the deletion for the journal.
+        """
+        with self._lock:
+            deleted = super().delete_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+            if deleted:
+                self._pending.append({"op": self.DELETE, "key": [counter_party_id, counter_party_address, query_checksum, policy_checksum]})
+                self._mark_changed()
+        return deleted
+
+    def negotiation_lock(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str):
+        """
+        Holds a lock file for the connection while it is negotiated, if the negotiation locking is enabled.
+        The connections are reloaded once the lock is acquired and saved before it is released,
+        so that the other processes see the negotiated connection.
+        """
+        if not self.negotiation_locking:
+            return nullcontext()
+        key = self.get_negotiation_key(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        return self._synchronized_negotiation(FileLock(f"{self.file_path}.{key}.lock"))
+
+    @contextmanager
+    def _synchronized_negotiation(self, negotiation_lock: FileLock):
+        with negotiation_lock:
+            self._load_if_updated()
+            try:
+                yield
+            finally:
+                self._save_to_file()
+
     def _start_background_tasks(self):
         """
         Start the background thread for periodic persistence.
@@ -69,7 +141,7 @@ class FileSystemConnectionManager(MemoryConnectionManager):
 
     def _persistence_loop(self):
         """
-        Background thread loop to periodically save to and load from the JSON file.
+        Background thread loop to periodically save to and load from the journal.
         """
         while not self._stop_event.is_set():
             time.sleep(self.persist_interval)
@@ -78,45 +150,214 @@ class FileSystemConnectionManager(MemoryConnectionManager):
 
     def _save_to_file(self):
         """
-        Save current in-memory connections to a JSON file with file locking if it differs from the last saved state.
+        Append the pending records to the journal, compacting it if it holds too many outdated records.
+        The records appended by other processes meanwhile are read first.
         """
+        if not self.has_unsaved_changes() and not self._needs_compaction():
+            return
+        with self._lock:
+            version = self.change_version
+            records = self._pending
+            self._pending = []
         try:
-            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-            current_hash = self._calculate_hash(self.open_connections)
-            if current_hash == self._last_loaded_hash:
-                return
-            with self.lock:
-                with open(self.file_path, "w") as f:
-                    json.dump(self.open_connections, f)
-                self._last_loaded_hash = current_hash
+            with self._file_access:
+                if not records and not self._needs_compaction():
+                    self._mark_saved(version)
+                    return
+                directory = os.path.dirname(self.file_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with self.lock:
+                    self._read_journal(skipped_records=records)
+                    if records:
+                        self._append(records)
+                    if self._needs_compaction():
+                        self._compact()
+            self._mark_saved(version)
         except Exception as e:
-            print(f"[FileSystemConnectionManager] Error saving to file: {e}")
+            # Keep the records to append them on the next save.
+            with self._lock:
+                self._pending = records + self._pending
+            self._log_error(f"[FileSystemConnectionManager] Error saving to file: {e}")
 
     def _load_if_updated(self):
         """
-        Load connections from the JSON file if the content differs from the current in-memory state.
+        Read the records appended to the journal since the last read, skipping the read if the file did not change.
         """
         try:
-            if not os.path.exists(self.file_path):
-                return
+            with self._file_access:
+                self._read_journal()
+        except Exception as e:
+            self._log_error(f"[FileSystemConnectionManager] Error loading from file: {e}")
+
+    def _read_journal(self, skipped_records: list = None):
+        """
+        Apply the new records of the journal to the cache. The whole journal is read again if it was replaced.
+        The connections with records not yet appended keep their in-memory value.
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return
+        file_state = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if file_state == self._file_state:
+            return
+
+        ## A compaction by another process replaces the file, which is then read from the start
+        replaced = self._file_state is None or stat.st_ino != self._file_state[0] or stat.st_size < self._offset
+        with open(self.file_path, "rb") as f:
+            f.seek(0 if replaced else self._offset)
+            data = f.read()
+        legacy_content = self._read_legacy_file(data) if replaced else None
+        if legacy_content is not None:
+            end = len(data)
+            records = [legacy_content]
+        else:
+            # Only complete lines are read, a record may still be being written.
+            end = data.rfind(b"\n") + 1
+            records = []
+            for line in data[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    self._log_error("[FileSystemConnectionManager] Skipped a corrupted record of the journal.")
+
+        with self._lock:
+            skipped = {tuple(record["key"]) for record in self._pending + (skipped_records or []) if "key" in record}
+            if replaced:
+                connections = {}
+                for record in records:
+                    self._apply_record(connections, record)
+                ## Keep the changes which were not saved yet
+                for key in skipped:
+                    if key in self._connections:
+                        connections[key] = self._connections[key]
+                    else:
+                        connections.pop(key, None)
+                self._replace_entries(connections)
+                ## Files written by older versions are rewritten in the journal format on the next save
+                self._records = float("inf") if any(record.get("op") is None for record in records) else len(records)
+            else:
+                for record in records:
+                    if tuple(record.get("key", ())) in skipped:
+                        continue
+                    if record.get("op") == self.DELETE:
+                        self._pop_entry(tuple(record["key"]))
+                    elif record.get("op") == self.PUT:
+                        self._set_entry(tuple(record["key"]), record["edr"])
+                self._records += len(records)
+        self._offset = (0 if replaced else self._offset) + end
+        self._file_state = file_state
+
+    @staticmethod
+    def _read_legacy_file(data: bytes) -> dict | None:
+        """
+        Returns the content of a file written by older versions, a single JSON object with all the nested connections,
+        or None if the data is a journal. A journal with several records is not a valid JSON document.
+        """
+        try:
+            content = json.loads(data)
+        except ValueError:
+            return None
+        if not isinstance(content, dict) or "op" in content:
+            return None
+        return content
+
+    def _migrate_legacy_file(self):
+        """
+        Copies the file of older versions (same path with the ".json" extension) to the journal path if there is no
+        journal yet. It is read as a snapshot and rewritten in the journal format on the next save, the old file is kept.
+        """
+        if not self.file_path.endswith(self.JOURNAL_EXTENSION):
+            return
+        legacy_path = self.file_path[:-len(self.JOURNAL_EXTENSION)] + ".json"
+        if os.path.exists(self.file_path) or not os.path.exists(legacy_path):
+            return
+        try:
             with self.lock:
-                with open(self.file_path, "r") as f:
-                    file_connections = json.load(f)
-                file_hash = self._calculate_hash(file_connections)
-                if file_hash != self._last_loaded_hash:
-                    self.open_connections = file_connections
-                    self._last_loaded_hash = file_hash
+                if os.path.exists(self.file_path):
+                    return
+                temporary_path = f"{self.file_path}.tmp"
+                shutil.copyfile(legacy_path, temporary_path)
+                os.replace(temporary_path, self.file_path)
         except Exception as e:
-            print(f"[FileSystemConnectionManager] Error loading from file: {e}")
+            self._log_error(f"[FileSystemConnectionManager] Error migrating the file [{legacy_path}]: {e}")
+
+    def _log_error(self, message: str):
+        """
+        Logs a persistence error with the logger if given, or prints it.
+        """
+        if self.logger:
+            self.logger.error(message)
+        else:
+            print(message)
+
+    def _apply_record(self, connections: dict, record: dict):
+        """
+        Apply a journal record to the connections by key. Files written by older versions hold a single
+        JSON object with all the nested connections, which is read as a snapshot.
+        """
+        operation = record.get("op")
+        if operation == self.PUT:
+            connections[tuple(record["key"])] = record["edr"]
+        elif operation == self.DELETE:
+            connections.pop(tuple(record["key"]), None)
+        elif operation is None:
+            connections.clear()
+            connections.update(self._flatten(record))
+
+    def _append(self, records: list):
+        """
+        Append the records to the journal. Must be called while holding the file lock, after reading the journal.
+        """
+        with open(self.file_path, "ab") as f:
+            ## A process stopped while writing may have left an incomplete record, which must not be continued
+            if f.tell() > 0 and not self._ends_with_new_line():
+                f.write(b"\n")
+            f.write(b"".join(json.dumps(record, default=str).encode() + b"\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        stat = os.stat(self.file_path)
+        self._offset = stat.st_size
+        self._file_state = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        self._records += len(records)
+
+    def _ends_with_new_line(self) -> bool:
+        """
+        Whether the last record of the journal is complete.
+        """
+        with open(self.file_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _needs_compaction(self) -> bool:
+        """
+        Whether the journal holds too many outdated records compared to the stored connections.
+        """
+        return self._records > max(self.compact_min_records, 2 * len(self._connections))
 
-    def _calculate_hash(self, data):
+    def _compact(self):
         """
-        Generate a hash from the current connections data for change detection.
+        Write the stored connections to a new journal, which atomically replaces the current one.
+        Must be called while holding the file lock, after reading the journal.
         """
-        return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+        with self._lock:
+            records = [{"op": self.PUT, "key": list(key), "edr": edr} for key, edr in self._connections.items()]
+        temporary_path = f"{self.file_path}.tmp"
+        with open(temporary_path, "wb") as f:
+            f.write(b"".join(json.dumps(record, default=str).encode() + b"\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, self.file_path)
+        stat = os.stat(self.file_path)
+        self._offset = stat.st_size
+        self._file_state = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        self._records = len(records)
 
     def stop(self):
         """
         Stop the background persistence thread.
         """
-        self._stop_event.set()
\ No newline at end of file
+        self._stop_event.set()
@@ -0,0 +1,200 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Key-value store based connection manager, sharing the EDR connections between replicas through a store like Redis.
+"""
+
+import json
+import logging
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from ..base_connection_manager import BaseConnectionManager
+from ....constants import JSONLDKeys
+from .key_value_store import BaseKeyValueStore, MemoryKeyValueStore
+
+
+class KeyValueConnectionManager(BaseConnectionManager):
+    """
+    Manages EDR connections in a shared key-value store, one key per connection.
+
+    Every replica reads and writes the store directly, so a negotiated EDR is visible to all of them as soon as it is added.
+    The connections can expire after a TTL, several connections are read and written in one round trip,
+    and the negotiations can be locked across replicas with an atomic set-if-absent.
+    """
+
+    def __init__(self, store: BaseKeyValueStore = None, key_prefix: str = "edr-connection:", ttl: float | None = None,
+                 provider_id_key: str = "providerId", logger: logging.Logger = None, verbose: bool = False,
+                 negotiation_locking: bool = False, lock_ttl: float = 120, lock_timeout: float = 120, lock_poll_interval: float = 0.05):
+        """
+        Initialize the key-value connection manager.
+
+        Args:
+            store (BaseKeyValueStore): The shared store, an in-process MemoryKeyValueStore by default.
+            key_prefix (str): Prefix of the keys of the connections in the store.
+            ttl (float, optional): Seconds after which the stored connections expire.
+            provider_id_key (str): Key used to identify the provider ID in the connection data.
+            logger (logging.Logger, optional): Logger instance for outputting messages.
+            verbose (bool): Whether to output verbose log messages.
+            negotiation_locking (bool): Whether to lock the negotiations in the store, so that only one replica
+                negotiates the same connection.
+            lock_ttl (float): Seconds after which a negotiation lock expires, in case its owner stopped.
+            lock_timeout (float): Seconds to wait for a negotiation lock before failing.
+            lock_poll_interval (float): Seconds between the attempts to take a negotiation lock.
+        """
+        self.store = store if store is not None else MemoryKeyValueStore()
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+        self.provider_id_key = provider_id_key
+        self.logger = logger
+        self.verbose = verbose
+        self.negotiation_locking = negotiation_locking
+        self.lock_ttl = lock_ttl
+        self.lock_timeout = lock_timeout
+        self.lock_poll_interval = lock_poll_interval
+
+    def _get_key(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> str:
+        """
+        Builds the store key of a connection.
+        """
+        return self.key_prefix + self.get_negotiation_key(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+
+    def _build_value(self, connection_entry: dict) -> str:
+        """
+        Builds the stored value of an EDR connection, without the metadata fields that are not needed for storage.
+        """
+        transfer_process_id: str = connection_entry.get(self.TRANSFER_ID_KEY, None)
+        if not transfer_process_id:
+            raise Exception("[KeyValue Connection Manager] The transfer id key was not found or is empty! Not able to do the contract negotiation!")
+
+        saved_edr = connection_entry.copy()
+        saved_edr.pop(JSONLDKeys.AT_TYPE, None)
+        saved_edr.pop(self.provider_id_key, None)
+        saved_edr.pop(JSONLDKeys.AT_CONTEXT, None)
+        return json.dumps(saved_edr)
+
+    def add_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry: dict) -> str | None:
+        """
+        Adds a new EDR connection to the store, replacing the previous one stored for the same keys.
+
+        Returns:
+            str | None: The transfer process ID of the added connection.
+        """
+        return self.add_connections_many([(counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry)])[0]
+
+    def get_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> dict:
+        """
+        Retrieves the EDR connection data for the given parameters.
+
+        Returns:
+            dict: The EDR connection data or an empty dict if not found or expired.
+        """
+        value = self.store.get(self._get_key(counter_party_id, counter_party_address, query_checksum, policy_checksum))
+        return json.loads(value) if value is not None else {}
+
+    def get_connection_transfer_id(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> str | None:
+        """
+        Retrieves the transfer process ID for the given parameters.
+
+        Returns:
+            str | None: The transfer process ID if found, otherwise None.
+        """
+        return self.get_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum).get(self.TRANSFER_ID_KEY, None)
+
+    def delete_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> bool:
+        """
+        Deletes the EDR connection matching the given parameters from the store.
+
+        Returns:
+            bool: True if the connection was deleted, False if not found.
+        """
+        return self.delete_connections_many([(counter_party_id, counter_party_address, query_checksum, policy_checksum)]) > 0
+
+    def get_connections_many(self, keys: list[tuple[str, str, str, str]]) -> dict[tuple[str, str, str, str], dict]:
+        """
+        Retrieves the EDR connection data of several connections in one round trip.
+
+        Args:
+            keys (list[tuple]): The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples of the connections.
+
+        Returns:
+            dict: The EDR connection data by key, an empty dict for the connections not found.
+        """
+        keys = list(dict.fromkeys(tuple(key) for key in keys))
+        values = self.store.get_many([self._get_key(*key) for key in keys])
+        return {key: json.loads(value) if value is not None else {} for key, value in zip(keys, values)}
+
+    def add_connections_many(self, connections: list[tuple[str, str, str, str, dict]]) -> list[str | None]:
+        """
+        Adds several EDR connections in one round trip.
+
+        Args:
+            connections (list[tuple]): The (counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry) tuples to add.
+
+        Returns:
+            list[str | None]: The transfer process IDs of the added connections, in the same order.
+        """
+        items = {self._get_key(*connection[:4]): self._build_value(connection[4]) for connection in connections}
+        self.store.set_many(items, ttl=self.ttl)
+        if self.logger and self.verbose:
+            self.logger.info(f"[KeyValue Connection Manager] {len(items)} EDR entries were saved in the store.")
+        return [connection[4].get(self.TRANSFER_ID_KEY) for connection in connections]
+
+    def delete_connections_many(self, keys: list[tuple[str, str, str, str]]) -> int:
+        """
+        Deletes several EDR connections in one round trip.
+
+        Args:
+            keys (list[tuple]): The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples of the connections.
+
+        Returns:
+            int: The number of deleted connections.
+        """
+        deleted = self.store.delete_many(list(dict.fromkeys(self._get_key(*key) for key in keys)))
+        if self.logger and self.verbose:
+            self.logger.info(f"[KeyValue Connection Manager] Deleted {deleted} EDR entries.")
+        return deleted
+
+    def negotiation_lock(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str):
+        """
+        Holds a lock key in the store while the connection is negotiated, if the negotiation locking is enabled.
+        """
+        if not self.negotiation_locking:
+            return nullcontext()
+        return self._store_lock(self._get_key(counter_party_id, counter_party_address, query_checksum, policy_checksum) + ":lock")
+
+    @contextmanager
+    def _store_lock(self, lock_key: str):
+        """
+        Takes the lock with set-if-absent, retrying until the lock timeout, and releases it only if still owned.
+        """
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.lock_timeout
+        while not self.store.set_if_absent(lock_key, token, ttl=self.lock_ttl):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"[KeyValue Connection Manager] The negotiation lock [{lock_key}] could not be acquired!")
+            time.sleep(self.lock_poll_interval)
+        try:
+            yield
+        finally:
+            self.store.delete_if_value(lock_key, token)
@@ -0,0 +1,231 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+from abc import ABC, abstractmethod
+
+
+class BaseKeyValueStore(ABC):
+    """
+    Minimal interface of a shared key-value store (i.e. Redis) with per-key expiration, used by the KeyValueConnectionManager.
+    The values are strings.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """
+        Returns the value of the key, or None if it does not exist or expired.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> list[str | None]:
+        """
+        Returns the values of the keys in one round trip, None for the missing ones.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    def set_many(self, items: dict[str, str], ttl: float | None = None) -> None:
+        """
+        Sets the values of several keys in one round trip, expiring after ttl seconds if given.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    def set_if_absent(self, key: str, value: str, ttl: float | None = None) -> bool:
+        """
+        Atomically sets the value of the key only if it does not exist.
+
+        Returns:
+            bool: True if the value was set.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    def delete_many(self, keys: list[str]) -> int:
+        """
+        Deletes the keys in one round trip.
+
+        Returns:
+            int: The number of deleted keys.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    @abstractmethod
+    def delete_if_value(self, key: str, value: str) -> bool:
+        """
+        Atomically deletes the key only if it holds the value, i.e. to release a lock only by its owner.
+
+        Returns:
+            bool: True if the key was deleted.
+        """
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """
+        Sets the value of the key, expiring after ttl seconds if given.
+        """
+        self.set_many({key: value}, ttl=ttl)
+
+    def delete(self, key: str) -> bool:
+        """
+        Deletes the key.
+
+        Returns:
+            bool: True if the key existed.
+        """
+        return self.delete_many([key]) > 0
+
+
+class MemoryKeyValueStore(BaseKeyValueStore):
+    """
+    In-process key-value store with the semantics of the shared stores, to run the KeyValueConnectionManager
+    in tests and single process deployments. Instances sharing the same store see each other's keys immediately.
+    """
+
+    def __init__(self):
+        ## Values by key, with their expiration time on the monotonic clock or None
+        self._values: dict[str, tuple[str, float | None]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: str, now: float) -> str | None:
+        """
+        Returns the value of the key, removing it if expired. Must be called while holding the lock.
+        """
+        item = self._values.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= now:
+            del self._values[key]
+            return None
+        return value
+
+    @staticmethod
+    def _expires_at(ttl: float | None, now: float) -> float | None:
+        return None if ttl is None else now + ttl
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            return self._get(key, time.monotonic())
+
+    def get_many(self, keys: list[str]) -> list[str | None]:
+        now = time.monotonic()
+        with self._lock:
+            return [self._get(key, now) for key in keys]
+
+    def set_many(self, items: dict[str, str], ttl: float | None = None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key, value in items.items():
+                self._values[key] = (value, self._expires_at(ttl, now))
+
+    def set_if_absent(self, key: str, value: str, ttl: float | None = None) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._get(key, now) is not None:
+                return False
+            self._values[key] = (value, self._expires_at(ttl, now))
+            return True
+
+    def delete_many(self, keys: list[str]) -> int:
+        now = time.monotonic()
+        with self._lock:
+            deleted = 0
+            for key in keys:
+                if self._get(key, now) is not None:
+                    del self._values[key]
+                    deleted += 1
+            return deleted
+
+    def delete_if_value(self, key: str, value: str) -> bool:
+        with self._lock:
+            if self._get(key, time.monotonic()) != value:
+                return False
+            del self._values[key]
+            return True
+
+    def purge_expired(self) -> int:
+        """
+        Removes the expired keys, which are otherwise only removed when accessed.
+
+        Returns:
+            int: The number of removed keys.
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (_, expires_at) in self._values.items() if expires_at is not None and expires_at <= now]
+            for key in expired:
+                del self._values[key]
+            return len(expired)
+
+
+class RedisKeyValueStore(BaseKeyValueStore):
+    """
+    Key-value store backed by a Redis client (i.e. redis.Redis), which is not a dependency of the SDK and must be provided.
+    Multiple keys are read and written with MGET and pipelines, and set-if-absent uses SET NX.
+    """
+
+    ## Deletes the key only if it holds the value, atomically within Redis
+    DELETE_IF_VALUE_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+
+    def __init__(self, client):
+        """
+        Args:
+            client: A Redis client instance.
+        """
+        self.client = client
+
+    @staticmethod
+    def _decode(value) -> str | None:
+        return value.decode() if isinstance(value, bytes) else value
+
+    @staticmethod
+    def _milliseconds(ttl: float | None) -> int | None:
+        return None if ttl is None else max(1, int(ttl * 1000))
+
+    def get(self, key: str) -> str | None:
+        return self._decode(self.client.get(key))
+
+    def get_many(self, keys: list[str]) -> list[str | None]:
+        if not keys:
+            return []
+        return [self._decode(value) for value in self.client.mget(keys)]
+
+    def set_many(self, items: dict[str, str], ttl: float | None = None) -> None:
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipeline.set(key, value, px=self._milliseconds(ttl))
+        pipeline.execute()
+
+    def set_if_absent(self, key: str, value: str, ttl: float | None = None) -> bool:
+        return bool(self.client.set(key, value, px=self._milliseconds(ttl), nx=True))
+
+    def delete_many(self, keys: list[str]) -> int:
+        if not keys:
+            return 0
+        return int(self.client.delete(*keys))
+
+    def delete_if_value(self, key: str, value: str) -> bool:
+        return bool(self.client.eval(self.DELETE_IF_VALUE_SCRIPT, 1, key, value))
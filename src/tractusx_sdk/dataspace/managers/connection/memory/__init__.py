@@ -32,3 +32,4 @@ __author__ = 'Eclipse Tractus-X Contributors'
 __license__ = "Apache License, Version 2.0"
 
 from .memory_connection_manager import MemoryConnectionManager
+from .async_memory_connection_manager import AsyncMemoryConnectionManager
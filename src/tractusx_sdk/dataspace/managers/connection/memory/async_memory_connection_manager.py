@@ -0,0 +1,122 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+Memory-based connection manager for event loops, answering every lookup without leaving the loop.
+"""
+
+import logging
+import warnings
+import weakref
+import asyncio
+from contextlib import asynccontextmanager, nullcontext
+from typing import Callable
+from tractusx_sdk.dataspace.managers.connection.async_base_connection_manager import AsyncBaseConnectionManager
+from .memory_connection_manager import MemoryConnectionManager
+
+class AsyncMemoryConnectionManager(AsyncBaseConnectionManager):
+    """
+    Awaitable wrapper of the MemoryConnectionManager.
+
+    The in-memory cache never blocks, so the connections are read and written directly in the event loop.
+    With negotiation locking enabled, concurrent tasks negotiating the same connection wait for each other.
+    """
+
+    manager: MemoryConnectionManager
+
+    def __init__(self, provider_id_key: str = "providerId", edrs_key: str = "edrs", logger:logging.Logger=None, verbose: bool = False,
+                 max_entries: int | None = None, max_age: float | None = None, sweep_interval: float | None = None,
+                 on_evict: Callable[[str, str, str, str, dict], None] | None = None, negotiation_locking: bool = False):
+        """
+        Initializes the AsyncMemoryConnectionManager, see the MemoryConnectionManager for the cache arguments.
+
+        Args:
+            negotiation_locking (bool): Whether the tasks negotiating the same connection are serialized.
+        """
+        self._setup(MemoryConnectionManager(provider_id_key=provider_id_key, edrs_key=edrs_key, logger=logger, verbose=verbose,
+                                            max_entries=max_entries, max_age=max_age, sweep_interval=sweep_interval,
+                                            on_evict=on_evict),
+                    negotiation_locking)
+
+    def _setup(self, manager: MemoryConnectionManager, negotiation_locking: bool):
+        self.manager = manager
+        self.negotiation_locking = negotiation_locking
+        ## Locks of the connections being negotiated, dropped once no task holds or waits for them
+        self._negotiation_locks = weakref.WeakValueDictionary()
+
+    @property
+    def open_connections(self) -> dict:
+        """
+        Deprecated: use get_connections() instead.
+        """
+        warnings.warn("open_connections is deprecated and returns a read-only snapshot, use get_connections() instead",
+                      DeprecationWarning, stacklevel=2)
+        return self.manager._nested_connections()
+
+    def get_connections(self) -> dict[tuple[str, str, str, str], dict]:
+        return self.manager.get_connections()
+
+    async def add_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry: dict) -> str | None:
+        return self.manager.add_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry)
+
+    async def get_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> dict | None:
+        return self.manager.get_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+
+    async def get_connection_transfer_id(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> str | None:
+        return self.manager.get_connection_transfer_id(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+
+    async def delete_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> bool:
+        return self.manager.delete_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+
+    async def get_connections_many(self, keys: list[tuple[str, str, str, str]]) -> dict[tuple[str, str, str, str], dict]:
+        return self.manager.get_connections_many(keys)
+
+    async def add_connections_many(self, connections: list[tuple[str, str, str, str, dict]]) -> list[str | None]:
+        return self.manager.add_connections_many(connections)
+
+    async def delete_connections_many(self, keys: list[tuple[str, str, str, str]]) -> int:
+        return self.manager.delete_connections_many(keys)
+
+    def negotiation_lock(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str):
+        """
+        Serializes the tasks negotiating the same connection, if the negotiation locking is enabled.
+        """
+        if not self.negotiation_locking:
+            return nullcontext()
+        return self._local_negotiation_lock(self.get_negotiation_key(counter_party_id, counter_party_address, query_checksum, policy_checksum))
+
+    @asynccontextmanager
+    async def _local_negotiation_lock(self, key: str):
+        lock = self._negotiation_locks.get(key)
+        if lock is None:
+            lock = self._negotiation_locks[key] = asyncio.Lock()
+        async with lock:
+            yield
+
+    def get_eviction_stats(self) -> dict:
+        return self.manager.get_eviction_stats()
+
+    def stop(self):
+        """
+        Stops the background tasks of the wrapped manager.
+        """
+        self.manager.stop()
@@ -25,33 +25,118 @@ Memory-based connection manager for storing EDR connections in an in-memory cach
 Provides thread-safe methods for adding, retrieving, and deleting EDR connections.
 """
 
-import copy
 from tractusx_sdk.dataspace.managers.connection.base_connection_manager import BaseConnectionManager
 from tractusx_sdk.dataspace.constants import JSONLDKeys
+import copy
 import threading
 import logging
+import time
+import warnings
+from collections import OrderedDict
+from itertools import islice
+from typing import Callable
 
 class MemoryConnectionManager(BaseConnectionManager):
     """
     Manages EDR connections in an in-memory cache with thread-safe operations.
+
+    The connections are stored in a flat dictionary keyed by the
+    (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuple, with a secondary index
+    of the keys by counter party. Lookups read the dictionary without locking, the lock only guards the writes.
+
+    The cache can be bounded by a maximum number of entries, evicting the least recently used ones,
+    and by a maximum age, evicting the entries added longer ago on access or by a background sweeper.
     """
 
-    def __init__(self, provider_id_key: str = "providerId", edrs_key: str = "edrs", logger:logging.Logger=None, verbose: bool = False):
+    def __init__(self, provider_id_key: str = "providerId", edrs_key: str = "edrs", logger:logging.Logger=None, verbose: bool = False,
+                 max_entries: int | None = None, max_age: float | None = None, sweep_interval: float | None = None,
+                 on_evict: Callable[[str, str, str, str, dict], None] | None = None):
         """
         Initializes the MemoryConnectionManager with specified keys for provider ID and EDR count.
 
         Args:
             provider_id_key (str): Key used to identify the provider ID in the connection data.
             edrs_key (str): Key used to store the EDR count within the open_connections dictionary.
+            max_entries (int, optional): Maximum number of EDRs kept, the least recently used ones are evicted above it.
+            max_age (float, optional): Seconds after which an EDR is evicted.
+            sweep_interval (float, optional): Seconds between the background sweeps of the EDRs older than max_age.
+            on_evict (Callable, optional): Called in the background with the keys and the EDR of every evicted connection,
+                i.e. the consumer's release_evicted_edr to delete the EDR in the connector.
         """
         # Initialize the connection cache and thread lock for concurrency.
         self.provider_id_key = provider_id_key
         self.edrs_key = edrs_key
-        self.open_connections=dict()
+        self._connections = {}
+        self._counter_parties = {}
         self._lock = threading.RLock()
         self.logger = logger
         self.verbose = verbose
-        
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.on_evict = on_evict
+        ## Time the connections were added, ordered from the least to the most recently used
+        self._usage = OrderedDict()
+        self._evictions = {"capacity": 0, "expired": 0}
+        self._sweeper_stop = threading.Event()
+        if sweep_interval:
+            threading.Thread(target=self._sweep_loop, args=(sweep_interval,), daemon=True).start()
+
+    @property
+    def open_connections(self) -> dict:
+        """
+        Deprecated: use get_connections() or get_counter_party_connections() instead.
+
+        Read-only snapshot of the connections nested by counter party, address, query checksum and policy checksum,
+        with the number of EDRs stored under the edrs key. The snapshot is built and deep-copied on every access,
+        changing it does not change the stored connections.
+        """
+        warnings.warn("open_connections is deprecated and returns a read-only snapshot, use get_connections() instead",
+                      DeprecationWarning, stacklevel=2)
+        return self._nested_connections()
+
+    @open_connections.setter
+    def open_connections(self, open_connections: dict):
+        """
+        Deprecated: replaces all the connections with the ones of a nested view.
+        """
+        warnings.warn("open_connections is deprecated, use add_connection() instead", DeprecationWarning, stacklevel=2)
+        self._replace_entries(copy.deepcopy(self._flatten(open_connections)))
+
+    def _nested_connections(self) -> dict:
+        """
+        Builds the nested snapshot of the connections returned by open_connections.
+        """
+        open_connections = {}
+        connections = self.get_connections()
+        for (counter_party_id, counter_party_address, query_checksum, policy_checksum), edr in connections.items():
+            open_connections.setdefault(counter_party_id, {}).setdefault(counter_party_address, {}) \
+                .setdefault(query_checksum, {})[policy_checksum] = edr
+        open_connections[self.edrs_key] = len(connections)
+        return open_connections
+
+    def get_connections(self) -> dict[tuple[str, str, str, str], dict]:
+        """
+        Retrieves a copy of all the EDR connections.
+
+        Returns:
+            dict: The EDR connection data by (counter_party_id, counter_party_address, query_checksum, policy_checksum).
+        """
+        with self._lock:
+            connections = dict(self._connections)
+        return copy.deepcopy(connections)
+
+    def _flatten(self, open_connections: dict) -> dict:
+        """
+        Converts a nested view of the connections into the flat connections by key.
+        """
+        return {
+            (counter_party_id, counter_party_address, query_checksum, policy_checksum): edr
+            for counter_party_id, addresses in open_connections.items() if counter_party_id != self.edrs_key
+            for counter_party_address, queries in addresses.items()
+            for query_checksum, policies in queries.items()
+            for policy_checksum, edr in policies.items()
+        }
+
     def add_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry:dict) -> str | None:
         """
         Adds a new EDR connection to the in-memory cache.
@@ -67,47 +152,27 @@ class MemoryConnectionManager(BaseConnectionManager):
             str | None: The transfer process ID of the added connection.
         """
         # Verify the transfer process ID exists.
+        transfer_process_id: str = connection_entry.get(self.TRANSFER_ID_KEY, None)
+        if transfer_process_id is None or transfer_process_id == "":
+            raise Exception(
+                "[Memory Connection Manager] The transfer id key was not found or is empty! Not able to do the contract negotiation!")
+
+        # Remove metadata fields and store the cleaned EDR, copied before taking the lock.
+        saved_edr = dict(connection_entry)
+        del saved_edr[JSONLDKeys.AT_TYPE], saved_edr[self.provider_id_key], saved_edr[JSONLDKeys.AT_CONTEXT]
+
+        key = (counter_party_id, counter_party_address, query_checksum, policy_checksum)
         with self._lock:
-            transfer_process_id: str = connection_entry.get(self.TRANSFER_ID_KEY, None)
-            if transfer_process_id is None or transfer_process_id == "":
-                raise Exception(
-                    "[Memory Connection Manager] The transfer id key was not found or is empty! Not able to do the contract negotiation!")
-            
-            # Initialize nested dictionaries as needed.
-            if counter_party_id not in self.open_connections:
-                self.open_connections[counter_party_id] = {}
-
-            cached_edcs = self.open_connections[counter_party_id]
-
-            if counter_party_address not in cached_edcs:
-                cached_edcs[counter_party_address] = {}
-
-            cached_oids = cached_edcs[counter_party_address]
-
-            if query_checksum not in cached_oids:
-                cached_oids[query_checksum] = {}
-
-            cached_details = cached_oids[query_checksum]
-            
-            if policy_checksum not in cached_details:
-                cached_details[policy_checksum] = {}
-
-            # Remove metadata fields and store the cleaned EDR.
-            saved_edr = copy.deepcopy(connection_entry)
-            del saved_edr[JSONLDKeys.AT_TYPE], saved_edr[self.provider_id_key], saved_edr[JSONLDKeys.AT_CONTEXT]
-
-            # Store edr in cache
-            cached_details[policy_checksum] = saved_edr
-            
-            # Increment the count of stored EDRs.
-            if self.edrs_key not in self.open_connections:
-                self.open_connections[self.edrs_key] = 0
-
-            self.open_connections[self.edrs_key] += 1
+            self._set_entry(key, saved_edr)
             if self.logger and self.verbose:
                 self.logger.info(
-                    f"[Memory Connection Manager] A new EDR entry was saved in the memory cache! [{self.open_connections[self.edrs_key]}] EDRs Available")
-            return transfer_process_id
+                    f"[Memory Connection Manager] A new EDR entry was saved in the memory cache! [{len(self._connections)}] EDRs Available")
+
+            self._usage[key] = time.monotonic()
+            self._usage.move_to_end(key)
+            if self.max_entries is not None and len(self._usage) > self.max_entries:
+                self._evict(list(islice(self._usage, len(self._usage) - self.max_entries)), "capacity")
+        return transfer_process_id
     
     def get_connection(self, counter_party_id, counter_party_address, query_checksum, policy_checksum):
         """
@@ -122,13 +187,13 @@ class MemoryConnectionManager(BaseConnectionManager):
         Returns:
             dict: The EDR connection data, or an empty dict if not found.
         """
-        # Safely navigate the nested dictionaries to retrieve the stored connection.
-        with self._lock:
-            counterparty_data: dict = self.open_connections.get(counter_party_id, {})
-            edc_data: dict = counterparty_data.get(counter_party_address, {})
-            oid_data: dict = edc_data.get(query_checksum, {})
-            cached_entry: dict = oid_data.get(policy_checksum, {})
-        
+        # Read the stored connection without locking, the lock is only needed to track its usage for the eviction.
+        key = (counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        cached_entry: dict = self._connections.get(key, {})
+        if cached_entry and (self.max_entries is not None or self.max_age is not None):
+            with self._lock:
+                cached_entry = self._use(key, cached_entry)
+
         return cached_entry
     
     def get_connection_transfer_id(self, counter_party_id, counter_party_address, query_checksum, policy_checksum):
@@ -144,12 +209,21 @@ class MemoryConnectionManager(BaseConnectionManager):
         Returns:
             str | None: The transfer process ID if found, else None.
         """
+        cached_entry: dict = self.get_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        return cached_entry.get(self.TRANSFER_ID_KEY, None)
+
+    def get_counter_party_connections(self, counter_party_id: str) -> dict[tuple[str, str, str, str], dict]:
+        """
+        Retrieves all the EDR connections of a counter party.
+
+        Args:
+            counter_party_id (str): The ID of the counter party.
+
+        Returns:
+            dict: The EDR connection data by (counter_party_id, counter_party_address, query_checksum, policy_checksum).
+        """
         with self._lock:
-            cached_entry: dict = self.get_connection(counter_party_id, counter_party_address, query_checksum, policy_checksum)
-            transfer_id: str | None = cached_entry.get(self.TRANSFER_ID_KEY, None)
-        
-        return transfer_id
-    
+            return {key: self._connections[key] for key in self._counter_parties.get(counter_party_id, ())}
     
     def delete_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> bool:
         """
@@ -165,19 +239,139 @@ class MemoryConnectionManager(BaseConnectionManager):
             bool: True if the connection was deleted, False otherwise.
         """
         # Safely attempt to remove the specified connection.
-        # Decrement the EDR count if successful.
         with self._lock:
+            deleted = self._pop_entry((counter_party_id, counter_party_address, query_checksum, policy_checksum)) is not None
+        if self.logger and self.verbose:
+            if deleted:
+                self.logger.info(f"[Memory Connection Manager] Deleted EDR entry for policy checksum '{policy_checksum}'.")
+            else:
+                self.logger.error("[Memory Connection Manager] No EDR found to delete for the provided keys.")
+        return deleted
+
+    def _set_entry(self, key: tuple, edr: dict):
+        """
+        Stores a connection and indexes it by counter party. Must be called while holding the lock.
+        """
+        self._connections[key] = edr
+        self._counter_parties.setdefault(key[0], set()).add(key)
+
+    def _pop_entry(self, key: tuple) -> dict | None:
+        """
+        Removes a connection from the storage and the indexes. Must be called while holding the lock.
+
+        Returns:
+            dict | None: The removed connection, None if it was not stored.
+        """
+        edr = self._connections.pop(key, None)
+        if edr is None:
+            return None
+        keys = self._counter_parties.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._counter_parties[key[0]]
+        self._usage.pop(key, None)
+        return edr
+
+    def _replace_entries(self, connections: dict):
+        """
+        Replaces all the stored connections, rebuilding the indexes.
+        """
+        counter_parties = {}
+        for key in connections:
+            counter_parties.setdefault(key[0], set()).add(key)
+        with self._lock:
+            self._connections = connections
+            self._counter_parties = counter_parties
+            for key in [key for key in self._usage if key not in connections]:
+                del self._usage[key]
+
+    def _use(self, key: tuple, cached_entry: dict) -> dict:
+        """
+        Marks a connection as recently used, evicting it if it is older than the maximum age.
+        Must be called while holding the lock.
+
+        Returns:
+            dict: The connection, or an empty dict if it was evicted.
+        """
+        if key not in self._connections:
+            return {}
+        added_at = self._usage.get(key)
+        if added_at is None:
+            ## Connections loaded by the persistent managers are tracked from their first use
+            self._usage[key] = time.monotonic()
+        elif self.max_age is not None and time.monotonic() - added_at > self.max_age:
+            self._evict([key], "expired")
+            return {}
+        else:
+            self._usage.move_to_end(key)
+        return cached_entry
+
+    def _evict(self, keys: list[tuple], reason: str):
+        """
+        Deletes the connections, counting them in the eviction statistics, and notifies the eviction hook in the background.
+        Must be called while holding the lock.
+        """
+        evicted = []
+        for key in keys:
+            cached_entry = self._connections.get(key)
+            ## Deleted through the subclass, so that the persistent managers also remove it from their storage
+            if cached_entry is not None and self.delete_connection(*key):
+                self._evictions[reason] += 1
+                evicted.append((key, cached_entry))
+            self._usage.pop(key, None)
+
+        if self.logger and self.verbose and evicted:
+            self.logger.info(f"[Memory Connection Manager] Evicted {len(evicted)} EDR entries [{reason}].")
+        if self.on_evict and evicted:
+            threading.Thread(target=self._notify_evicted, args=(evicted,), daemon=True).start()
+
+    def _notify_evicted(self, evicted: list[tuple]):
+        """
+        Calls the eviction hook for every evicted connection.
+        """
+        for key, cached_entry in evicted:
             try:
-                cached_details = self.open_connections[counter_party_id][counter_party_address][query_checksum]
-                if policy_checksum in cached_details:
-                    del cached_details[policy_checksum]
-                    if self.edrs_key in self.open_connections:
-                        self.open_connections[self.edrs_key] -= 1
-                    if self.logger and self.verbose:
-                        self.logger.info(f"[Memory Connection Manager] Deleted EDR entry for policy checksum '{policy_checksum}'.")
-                    return True
-                return False
-            except KeyError:
-                if self.logger and self.verbose:
-                    self.logger.error("[Memory Connection Manager] No EDR found to delete for the provided keys.")
-                return False
\ No newline at end of file
+                self.on_evict(*key, cached_entry)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"[Memory Connection Manager] The eviction hook failed for the transfer [{cached_entry.get(self.TRANSFER_ID_KEY)}]: {e}")
+
+    def sweep(self) -> int:
+        """
+        Evicts the connections older than the maximum age.
+
+        Returns:
+            int: The number of evicted connections.
+        """
+        if self.max_age is None:
+            return 0
+        with self._lock:
+            expired_before = self._evictions["expired"]
+            limit = time.monotonic() - self.max_age
+            self._evict([key for key, added_at in self._usage.items() if added_at < limit], "expired")
+            return self._evictions["expired"] - expired_before
+
+    def _sweep_loop(self, sweep_interval: float):
+        """
+        Sweeps the expired connections periodically until the manager is stopped.
+        """
+        while not self._sweeper_stop.wait(sweep_interval):
+            self.sweep()
+
+    def get_eviction_stats(self) -> dict:
+        """
+        Returns the number of stored connections and of connections evicted by capacity and by age.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._connections),
+                "evicted_capacity": self._evictions["capacity"],
+                "evicted_expired": self._evictions["expired"]
+            }
+
+    def stop(self):
+        """
+        Stops the background sweeper.
+        """
+        self._sweeper_stop.set()
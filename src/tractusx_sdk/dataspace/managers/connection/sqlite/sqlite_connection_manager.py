@@ -0,0 +1,318 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+"""
+SQLite-based connection manager for persisting EDR connections in a local database file.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager, nullcontext
+from filelock import FileLock
+from ..base_connection_manager import BaseConnectionManager
+from ....constants import JSONLDKeys
+
+
+class _ThreadConnection:
+    """
+    Holds the database connection of a thread in the thread-local storage, the connection is closed once the
+    thread ends and the holder is collected.
+    """
+    __slots__ = ("connection", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+
+def _close_thread_connection(connection: sqlite3.Connection, opened: set, opened_lock: threading.Lock):
+    with opened_lock:
+        ## Already closed by close()
+        if connection not in opened:
+            return
+        opened.discard(connection)
+    connection.close()
+
+
+class SqliteConnectionManager(BaseConnectionManager):
+    """
+    Manages EDR connections in a SQLite database, for single node deployments which need durable connections without Postgres.
+
+    The connections are stored in a table keyed by (counter_party_id, counter_party_address, query_checksum, policy_checksum),
+    so every operation is an indexed lookup. The database runs in WAL mode, so that the readers do not block the writer,
+    and can be shared by several processes of the same node. Every thread uses its own database connection,
+    closed when the thread ends.
+    """
+
+    def __init__(self, path: str = "./data/connection_cache.db", table_name: str = "edr_connections", provider_id_key: str = "providerId",
+                 logger: logging.Logger = None, verbose: bool = False, negotiation_locking: bool = False,
+                 batch_size: int = 200, timeout: float = 30):
+        """
+        Initialize the SQLite connection manager, creating the database and the table if needed.
+
+        Args:
+            path (str): Path to the SQLite database file.
+            table_name (str): The name of the table to store EDR connections.
+            provider_id_key (str): The key used to identify the provider ID in the connection data.
+            logger (logging.Logger, optional): Logger instance for outputting messages.
+            verbose (bool): Whether to output verbose log messages.
+            negotiation_locking (bool): Whether to lock the negotiations with lock files, so that only one
+                process sharing the database negotiates the same connection.
+            batch_size (int): Maximum number of connections read or written per statement by the bulk methods.
+            timeout (float): Seconds to wait for the database while another process writes to it.
+        """
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table_name):
+            raise ValueError(f"[Sqlite Connection Manager] The table name [{table_name}] is not a valid identifier!")
+
+        self.path = path
+        self.table_name = table_name
+        self.provider_id_key = provider_id_key
+        self.logger = logger
+        self.verbose = verbose
+        self.negotiation_locking = negotiation_locking
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._local = threading.local()
+        self._opened = set()
+        self._opened_lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # The composite primary key is the index of the lookups, the rows are stored within it.
+        connection = self._get_connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+            "counter_party_id TEXT NOT NULL, "
+            "counter_party_address TEXT NOT NULL, "
+            "query_checksum TEXT NOT NULL, "
+            "policy_checksum TEXT NOT NULL, "
+            "transfer_id TEXT NOT NULL, "
+            "edr_data TEXT NOT NULL, "
+            "PRIMARY KEY (counter_party_id, counter_party_address, query_checksum, policy_checksum)"
+            ") WITHOUT ROWID"
+        )
+
+        ## Statements are kept as constants, so that SQLite reuses them from its statement cache
+        key_filter = "counter_party_id = ? AND counter_party_address = ? AND query_checksum = ? AND policy_checksum = ?"
+        self._upsert_statement = (
+            f"INSERT INTO {self.table_name} "
+            "(counter_party_id, counter_party_address, query_checksum, policy_checksum, transfer_id, edr_data) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (counter_party_id, counter_party_address, query_checksum, policy_checksum) "
+            "DO UPDATE SET transfer_id = excluded.transfer_id, edr_data = excluded.edr_data"
+        )
+        self._select_statement = f"SELECT edr_data FROM {self.table_name} WHERE {key_filter}"
+        self._select_transfer_id_statement = f"SELECT transfer_id FROM {self.table_name} WHERE {key_filter}"
+        self._delete_statement = f"DELETE FROM {self.table_name} WHERE {key_filter}"
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Returns the database connection of the current thread, opening it on first use.
+        The connection is closed when the thread ends.
+        """
+        holder: _ThreadConnection = getattr(self._local, "holder", None)
+        if holder is not None:
+            return holder.connection
+        ## Autocommit mode, the batches open their own transactions
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        holder = _ThreadConnection(connection)
+        ## The finalizer must not reference the manager, so that it can still be collected
+        weakref.finalize(holder, _close_thread_connection, connection, self._opened, self._opened_lock)
+        with self._opened_lock:
+            self._opened.add(connection)
+        self._local.holder = holder
+        return connection
+
+    def _build_row(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry: dict) -> tuple:
+        """
+        Builds the row stored for an EDR connection, without the metadata fields that are not needed for storage.
+        """
+        transfer_process_id: str = connection_entry.get(JSONLDKeys.AT_ID, None)
+        if not transfer_process_id:
+            raise Exception("[Sqlite Connection Manager] The transfer id key was not found or is empty! Not able to do the contract negotiation!")
+
+        saved_edr = connection_entry.copy()
+        saved_edr.pop(JSONLDKeys.AT_TYPE, None)
+        saved_edr.pop(self.provider_id_key, None)
+        saved_edr.pop(JSONLDKeys.AT_CONTEXT, None)
+        return counter_party_id, counter_party_address, query_checksum, policy_checksum, transfer_process_id, json.dumps(saved_edr)
+
+    def add_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str, connection_entry: dict) -> str | None:
+        """
+        Adds a new EDR connection to the database, replacing the previous one stored for the same keys.
+
+        Args:
+            counter_party_id (str): The ID of the counter party.
+            counter_party_address (str): The address of the counter party.
+            query_checksum (str): A checksum identifying the query.
+            policy_checksum (str): A checksum identifying the policy.
+            connection_entry (dict): The EDR connection data.
+
+        Returns:
+            str | None: The transfer process ID of the added connection.
+        """
+        row = self._build_row(counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry)
+        self._get_connection().execute(self._upsert_statement, row)
+        if self.logger and self.verbose:
+            self.logger.info("[Sqlite Connection Manager] A new EDR entry was saved in the database.")
+        return row[4]
+
+    def get_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> dict:
+        """
+        Retrieves the EDR connection data for the given parameters.
+
+        Returns:
+            dict: The EDR connection data or an empty dict if not found.
+        """
+        result = self._get_connection().execute(
+            self._select_statement, (counter_party_id, counter_party_address, query_checksum, policy_checksum)).fetchone()
+        return json.loads(result[0]) if result else {}
+
+    def get_connection_transfer_id(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> str | None:
+        """
+        Retrieves the transfer process ID for the given parameters.
+
+        Returns:
+            str | None: The transfer process ID if found, otherwise None.
+        """
+        result = self._get_connection().execute(
+            self._select_transfer_id_statement, (counter_party_id, counter_party_address, query_checksum, policy_checksum)).fetchone()
+        return result[0] if result else None
+
+    def delete_connection(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str) -> bool:
+        """
+        Deletes the EDR connection matching the given parameters from the database.
+
+        Returns:
+            bool: True if the connection was deleted, False if not found.
+        """
+        cursor = self._get_connection().execute(
+            self._delete_statement, (counter_party_id, counter_party_address, query_checksum, policy_checksum))
+        if cursor.rowcount:
+            if self.logger and self.verbose:
+                self.logger.info(f"[Sqlite Connection Manager] Deleted EDR entry for policy checksum '{policy_checksum}'.")
+            return True
+        if self.logger and self.verbose:
+            self.logger.info("[Sqlite Connection Manager] No EDR found to delete for the provided keys.")
+        return False
+
+    def get_connections_many(self, keys: list[tuple[str, str, str, str]]) -> dict[tuple[str, str, str, str], dict]:
+        """
+        Retrieves the EDR connection data of several connections, with one query per batch.
+
+        Args:
+            keys (list[tuple]): The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples of the connections.
+
+        Returns:
+            dict: The EDR connection data by key, an empty dict for the connections not found.
+        """
+        keys = list(dict.fromkeys(tuple(key) for key in keys))
+        connections = {key: {} for key in keys}
+        connection = self._get_connection()
+        for i in range(0, len(keys), self.batch_size):
+            batch = keys[i:i + self.batch_size]
+            values = ", ".join(["(?, ?, ?, ?)"] * len(batch))
+            rows = connection.execute(
+                f"SELECT counter_party_id, counter_party_address, query_checksum, policy_checksum, edr_data FROM {self.table_name} "
+                f"WHERE (counter_party_id, counter_party_address, query_checksum, policy_checksum) IN (VALUES {values})",
+                [value for key in batch for value in key]
+            ).fetchall()
+            for *key, edr_data in rows:
+                connections[tuple(key)] = json.loads(edr_data)
+        return connections
+
+    def add_connections_many(self, connections: list[tuple[str, str, str, str, dict]]) -> list[str | None]:
+        """
+        Adds several EDR connections in one transaction.
+
+        Args:
+            connections (list[tuple]): The (counter_party_id, counter_party_address, query_checksum, policy_checksum, connection_entry) tuples to add.
+
+        Returns:
+            list[str | None]: The transfer process IDs of the added connections, in the same order.
+        """
+        rows = [self._build_row(*connection) for connection in connections]
+        connection = self._get_connection()
+        with self._transaction(connection):
+            connection.executemany(self._upsert_statement, rows)
+        if self.logger and self.verbose:
+            self.logger.info(f"[Sqlite Connection Manager] {len(rows)} EDR entries were saved in the database.")
+        return [row[4] for row in rows]
+
+    def delete_connections_many(self, keys: list[tuple[str, str, str, str]]) -> int:
+        """
+        Deletes several EDR connections in one transaction.
+
+        Args:
+            keys (list[tuple]): The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples of the connections.
+
+        Returns:
+            int: The number of deleted connections.
+        """
+        connection = self._get_connection()
+        with self._transaction(connection):
+            deleted = connection.executemany(self._delete_statement, list(dict.fromkeys(tuple(key) for key in keys))).rowcount
+        if self.logger and self.verbose:
+            self.logger.info(f"[Sqlite Connection Manager] Deleted {deleted} EDR entries.")
+        return deleted
+
+    @contextmanager
+    def _transaction(self, connection: sqlite3.Connection):
+        """
+        Runs the statements in a single write transaction, taking the write lock upfront so it does not fail midway.
+        """
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def negotiation_lock(self, counter_party_id: str, counter_party_address: str, query_checksum: str, policy_checksum: str):
+        """
+        Holds a lock file for the connection while it is negotiated, if the negotiation locking is enabled.
+        """
+        if not self.negotiation_locking:
+            return nullcontext()
+        key = self.get_negotiation_key(counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        return FileLock(f"{self.path}.{self.table_name}.{key}.lock")
+
+    def close(self):
+        """
+        Closes the database connections opened by all the threads.
+        """
+        with self._opened_lock:
+            opened = list(self._opened)
+            self._opened.clear()
+        for connection in opened:
+            connection.close()
+        self._local = threading.local()
+
@@ -0,0 +1,161 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from ..tools.encoding_tools import decode_base64_url_safe
+
+
+class BaseEdrCacheManager(ABC):
+    """
+    Caches the data addresses (dataplane endpoint + authorization) of the EDRs, by transfer id.
+
+    A data address is served until shortly before its token expires, after that a refresh is due.
+    Implementations can keep the entries anywhere, as long as they follow this interface.
+    """
+
+    refresh_margin: int
+
+    def __init__(self, refresh_margin: int = 30):
+        """
+        :param refresh_margin: Seconds before the token expiration in which the data address must be refreshed.
+        """
+        self.refresh_margin = refresh_margin
+
+    @abstractmethod
+    def get(self, transfer_id: str) -> tuple[dict, bool] | None:
+        """
+        Returns the cached data address and if it is due for a refresh, or None if it is missing or expired.
+        Only one caller gets a due refresh, until put() or release_refresh() is called for the transfer id.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, transfer_id: str, edr: dict) -> bool:
+        """
+        Stores a data address, returns False if it can not be cached because its expiration is unknown.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def release_refresh(self, transfer_id: str) -> None:
+        """
+        Allows a new refresh of the data address after a failed one.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, transfer_id: str = None) -> None:
+        """
+        Removes the data address of the transfer id, or all of them if no transfer id is given.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def get_expiration(edr: dict) -> float | None:
+        """
+        Reads the "exp" claim (epoch seconds) of the authorization token of a data address, without validating it.
+
+        :return: The expiration time or None if the token is not a JWT with an "exp" claim.
+        """
+        authorization = edr.get("authorization") if isinstance(edr, dict) else None
+        if not isinstance(authorization, str):
+            return None
+        token = authorization.split(" ")[-1]
+        parts = token.split(".")
+        if len(parts) != 3:
+            return None
+        try:
+            exp = json.loads(decode_base64_url_safe(parts[1])).get("exp")
+        except (ValueError, AttributeError):
+            return None
+        if isinstance(exp, bool) or not isinstance(exp, (int, float)):
+            return None
+        return float(exp)
+
+
+class MemoryEdrCacheManager(BaseEdrCacheManager):
+    """
+    In-memory EDR data address cache, with a bounded amount of entries (least recently used are evicted).
+    """
+
+    max_entries: int
+
+    def __init__(self, refresh_margin: int = 30, max_entries: int = 10000):
+        """
+        :param refresh_margin: Seconds before the token expiration in which the data address must be refreshed.
+        :param max_entries: Maximum amount of data addresses kept in memory.
+        """
+        super().__init__(refresh_margin=refresh_margin)
+        self.max_entries = max_entries
+        ## transfer_id -> (edr, refresh_at, expires_at)
+        self._entries: OrderedDict[str, tuple[dict, float, float]] = OrderedDict()
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, transfer_id: str) -> tuple[dict, bool] | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(transfer_id)
+            if entry is None:
+                return None
+            edr, refresh_at, expires_at = entry
+            if now >= expires_at:
+                del self._entries[transfer_id]
+                return None
+            self._entries.move_to_end(transfer_id)
+            if now < refresh_at or transfer_id in self._refreshing:
+                return edr, False
+            self._refreshing.add(transfer_id)
+            return edr, True
+
+    def put(self, transfer_id: str, edr: dict) -> bool:
+        expires_at = self.get_expiration(edr)
+        with self._lock:
+            self._refreshing.discard(transfer_id)
+            if expires_at is None or time.time() >= expires_at:
+                self._entries.pop(transfer_id, None)
+                return False
+            ## Short lived tokens are refreshed in the second half of their lifetime at the latest
+            margin = min(self.refresh_margin, (expires_at - time.time()) / 2)
+            self._entries[transfer_id] = (edr, expires_at - margin, expires_at)
+            self._entries.move_to_end(transfer_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def release_refresh(self, transfer_id: str) -> None:
+        with self._lock:
+            self._refreshing.discard(transfer_id)
+
+    def invalidate(self, transfer_id: str = None) -> None:
+        with self._lock:
+            if transfer_id is None:
+                self._entries.clear()
+                self._refreshing.clear()
+                return
+            self._entries.pop(transfer_id, None)
+            self._refreshing.discard(transfer_id)
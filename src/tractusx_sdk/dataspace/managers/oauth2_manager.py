@@ -22,10 +22,18 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from jwcrypto import jwk, jwt
 from keycloak.keycloak_openid import KeycloakOpenID
 from .auth_manager_interface import AuthManagerInterface
 from fastapi import Request, HTTPException
 from starlette.status import HTTP_401_UNAUTHORIZED
+from ..tools.encoding_tools import decode_base64_url_safe
+from ..tools.single_flight import SingleFlight
 
 class OAuth2Manager(AuthManagerInterface):
     
@@ -41,7 +49,49 @@ class OAuth2Manager(AuthManagerInterface):
     clientid:str
     clientsecret:str
 
-    def __init__(self, auth_url, realm, clientid, clientsecret):
+    ## Token cache configuration
+    token_cache_enabled:bool = True
+    token_refresh_margin:int = 30
+    background_refresh:bool = True
+
+    ## Token validation configuration
+    VALIDATION_USERINFO:str = "userinfo"
+    VALIDATION_LOCAL:str = "local"
+    validation_mode:str = VALIDATION_USERINFO
+    audience:str | list[str] | None = None
+    issuer:str | None = None
+    jwks_cache_ttl:int = 3600
+    jwks_min_refresh_interval:int = 30
+    validated_tokens_cache_size:int = 1024
+
+    ## Guards the lazy creation of the token cache for instances created without connect()
+    _cache_init_lock = threading.Lock()
+
+    def __init__(self, auth_url, realm, clientid, clientsecret, token_cache_enabled:bool=True, token_refresh_margin:int=30, background_refresh:bool=True,
+                 validation_mode:str=VALIDATION_USERINFO, audience:str | list[str] | None=None, jwks_cache_ttl:int=3600,
+                 jwks_min_refresh_interval:int=30, validated_tokens_cache_size:int=1024):
+        """
+        :param token_cache_enabled: If True the access tokens are cached per scope until shortly before they expire.
+        :param token_refresh_margin: Seconds before the expiration of a token in which it is already refreshed.
+        :param background_refresh: If True tokens inside the refresh margin are still served while a background thread refreshes them.
+        :param validation_mode: "userinfo" validates inbound tokens against the Keycloak userinfo endpoint,
+            "local" verifies signature, expiration and audience offline with the cached realm JWKS.
+        :param audience: Audience (or list of accepted audiences) required in "local" mode, if None the audience is not checked.
+        :param jwks_cache_ttl: Seconds the realm JWKS is kept before it is fetched again.
+        :param jwks_min_refresh_interval: Minimum seconds between two JWKS fetches triggered by an unknown key id.
+        :param validated_tokens_cache_size: Amount of recently validated token digests kept in "local" mode, 0 disables it.
+        """
+        if(validation_mode not in (self.VALIDATION_USERINFO, self.VALIDATION_LOCAL)):
+            raise ValueError(f"Invalid validation mode [{validation_mode}]. Use [{self.VALIDATION_USERINFO}] or [{self.VALIDATION_LOCAL}].")
+
+        self.token_cache_enabled = token_cache_enabled
+        self.token_refresh_margin = token_refresh_margin
+        self.background_refresh = background_refresh
+        self.validation_mode = validation_mode
+        self.audience = audience
+        self.jwks_cache_ttl = jwks_cache_ttl
+        self.jwks_min_refresh_interval = jwks_min_refresh_interval
+        self.validated_tokens_cache_size = validated_tokens_cache_size
 
         ## Connect to the server
         self.connect(auth_url=auth_url, realm=realm, clientid=clientid, clientsecret=clientsecret)
@@ -55,6 +105,10 @@ class OAuth2Manager(AuthManagerInterface):
         self.clientid = clientid
         self.clientsecret = clientsecret
 
+        ## Tokens and keys from another client or realm must not be reused
+        self._reset_token_cache()
+        self._reset_validation_cache()
+
         # Configure client
         self.keycloak_openid = KeycloakOpenID(server_url=auth_url,
                                         client_id=clientid,
@@ -62,8 +116,12 @@ class OAuth2Manager(AuthManagerInterface):
                                         client_secret_key=clientsecret)
 
         # Get WellKnown and if not connected it will not work
-        if (not self.keycloak_openid.well_known()):
+        well_known = self.keycloak_openid.well_known()
+        if (not well_known):
             raise ConnectionError("Unable to access the Keycloak instance. Check the server URL, realm, and network connectivity.")
+
+        ## The issuer is checked when validating tokens locally
+        self.issuer = well_known.get("issuer") if isinstance(well_known, dict) else None
         
         self.connected=True
     
@@ -73,13 +131,119 @@ class OAuth2Manager(AuthManagerInterface):
         if(not self.connected):
             raise RuntimeError("Not connected. Please call the connect() method before requesting a token.")
 
+        if(not self.token_cache_enabled):
+            return self._request_token(scope=scope)["access_token"]
+
+        self._ensure_caches()
+
+        ## Serve the cached token while it is fresh
+        entry = self._token_cache.get(scope)
+        now = time.monotonic()
+        if(entry is not None):
+            token, refresh_at, expires_at = entry
+            if(now < refresh_at):
+                return token["access_token"]
+            ## Inside the refresh margin the token is still valid, refresh it without blocking the caller
+            if(self.background_refresh and now < expires_at):
+                self._schedule_background_refresh(scope=scope)
+                return token["access_token"]
+
+        ## Missing or expired token, only one caller per scope requests a new one, the others wait for it
+        with self._get_scope_lock(scope=scope):
+            entry = self._token_cache.get(scope)
+            if(entry is not None and time.monotonic() < entry[1]):
+                return entry[0]["access_token"]
+            token = self._refresh_token(scope=scope)
+        return token["access_token"]
+
+    def invalidate_token(self, scope:str=None):
+        """
+        Removes cached tokens so that the next call to get_token() requests a new one.
+
+        :param scope: The scope of the token to remove, if None all cached tokens are removed.
+        """
+        self._ensure_caches()
+        with self._token_cache_lock:
+            if(scope is None):
+                self._token_cache.clear()
+            else:
+                self._token_cache.pop(scope, None)
+
+    def _request_token(self, scope:str) -> dict:
         ## Get the token from the keycloak instance
         token:dict=self.keycloak_openid.token(self.clientid, self.clientsecret, grant_type=["client_credentials"], scope=scope)
         if(token is None):
             raise ValueError("Failed to retrieve token from IAM instance. The credentials might be incorrect.")
         ## Store the token
         self.token = token
-        return self.token["access_token"]
+        return token
+
+    def _refresh_token(self, scope:str) -> dict:
+        ## The expiration is counted from the moment the request was sent to stay on the safe side
+        requested_at = time.monotonic()
+        token = self._request_token(scope=scope)
+        expires_in = token.get("expires_in")
+        if(not isinstance(expires_in, (int, float)) or expires_in <= 0):
+            ## Without a known lifetime the token can not be cached safely
+            return token
+        ## Short lived tokens are refreshed at the latest at the half of their lifetime
+        margin = min(self.token_refresh_margin, expires_in / 2)
+        with self._token_cache_lock:
+            self._token_cache[scope] = (token, requested_at + expires_in - margin, requested_at + expires_in)
+        return token
+
+    def _schedule_background_refresh(self, scope:str):
+        with self._token_cache_lock:
+            if(scope in self._refreshing_scopes):
+                return
+            self._refreshing_scopes.add(scope)
+        threading.Thread(target=self._background_refresh, args=(scope,), daemon=True).start()
+
+    def _background_refresh(self, scope:str):
+        try:
+            with self._get_scope_lock(scope=scope):
+                entry = self._token_cache.get(scope)
+                if(entry is None or time.monotonic() >= entry[1]):
+                    self._refresh_token(scope=scope)
+        except Exception:
+            ## The cached token is still valid, the next caller after the expiration retries synchronously
+            pass
+        finally:
+            with self._token_cache_lock:
+                self._refreshing_scopes.discard(scope)
+
+    def _get_scope_lock(self, scope:str) -> threading.Lock:
+        with self._token_cache_lock:
+            lock = self._scope_locks.get(scope)
+            if(lock is None):
+                lock = threading.Lock()
+                self._scope_locks[scope] = lock
+            return lock
+
+    def _reset_token_cache(self):
+        self._token_cache_lock = threading.Lock()
+        self._scope_locks:dict[str, threading.Lock] = dict()
+        self._refreshing_scopes:set[str] = set()
+        ## Scope -> (token, refresh at, expires at) in monotonic time
+        self._token_cache:dict[str, tuple[dict, float, float]] = dict()
+
+    def _reset_validation_cache(self):
+        self._validation_lock = threading.Lock()
+        self._jwks:jwk.JWKSet | None = None
+        self._jwks_fetched_at:float | None = None
+        ## Token digest -> verified claims, in least recently used order
+        self._validated_tokens:OrderedDict[str, dict] = OrderedDict()
+        ## Concurrent refreshes of the JWKS share a single request to the IdP
+        self._jwks_fetches = SingleFlight()
+
+    def _ensure_caches(self):
+        if("_token_cache" in self.__dict__ and "_validated_tokens" in self.__dict__):
+            return
+        with self._cache_init_lock:
+            if("_token_cache" not in self.__dict__):
+                self._reset_token_cache()
+            if("_validated_tokens" not in self.__dict__):
+                self._reset_validation_cache()
     
     def add_auth_header(self, headers:dict=None):
         ## Check if connected
@@ -107,7 +271,77 @@ class OAuth2Manager(AuthManagerInterface):
             raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Missing or invalid Authorization header.")
         token = authorization.split(" ")[1]
         try:
+            if(self.validation_mode == self.VALIDATION_LOCAL):
+                return bool(self.validate_token(token=token))
             user_info = self.keycloak_openid.userinfo(token)
             return bool(user_info)
         except Exception:
             raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
+
+    def validate_token(self, token:str) -> dict:
+        """
+        Verifies a bearer token offline against the cached JWKS of the realm.
+
+        The signature, the expiration, the issuer (if known) and the audience (if configured) are checked.
+        Tokens which were already validated are served from a digest LRU until they expire.
+
+        :param token: The encoded JWT.
+        :return: The claims of the token.
+        :raises Exception: If the token is not valid.
+        """
+        self._ensure_caches()
+        digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+        ## Fast path for tokens validated recently
+        with self._validation_lock:
+            cached_claims = self._validated_tokens.get(digest)
+            if(cached_claims is not None):
+                if(time.time() < cached_claims["exp"]):
+                    self._validated_tokens.move_to_end(digest)
+                    return cached_claims
+                del self._validated_tokens[digest]
+
+        ## A key id unknown to the cached JWKS means the realm keys were rotated
+        header:dict = json.loads(decode_base64_url_safe(token.split(".")[0]))
+        key_id = header.get("kid")
+        jwks = self._get_jwks()
+        if(key_id is not None and jwks.get_key(key_id) is None):
+            jwks = self._get_jwks(force=True)
+
+        check_claims:dict = {"exp": None}
+        if(self.audience is not None):
+            check_claims["aud"] = self.audience
+        if(self.issuer is not None):
+            check_claims["iss"] = self.issuer
+
+        verified = jwt.JWT(jwt=token, key=jwks, check_claims=check_claims, expected_type="JWS")
+        claims:dict = json.loads(verified.claims)
+
+        if(self.validated_tokens_cache_size > 0):
+            with self._validation_lock:
+                self._validated_tokens[digest] = claims
+                self._validated_tokens.move_to_end(digest)
+                while(len(self._validated_tokens) > self.validated_tokens_cache_size):
+                    self._validated_tokens.popitem(last=False)
+        return claims
+
+    def _get_jwks(self, force:bool=False) -> jwk.JWKSet:
+        with self._validation_lock:
+            if(self._jwks is not None):
+                age = time.monotonic() - self._jwks_fetched_at
+                if(not force and age < self.jwks_cache_ttl):
+                    return self._jwks
+                ## Avoid hammering the IdP with tokens signed by unknown keys
+                if(force and age < self.jwks_min_refresh_interval):
+                    return self._jwks
+        ## The IdP is called without holding the lock, so the validated tokens stay served meanwhile
+        return self._jwks_fetches.do("jwks", self._fetch_jwks)
+
+    def _fetch_jwks(self) -> jwk.JWKSet:
+        jwks = jwk.JWKSet.from_json(json.dumps(self.keycloak_openid.certs()))
+        with self._validation_lock:
+            self._jwks = jwks
+            self._jwks_fetched_at = time.monotonic()
+            ## Keys might have been revoked, tokens have to be checked again
+            self._validated_tokens.clear()
+        return jwks
@@ -20,4 +20,5 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from .database.edr_base import EDRBase
\ No newline at end of file
+from .database.edr_base import EDRBase
+from .database.edr_revision_base import EDRRevisionBase
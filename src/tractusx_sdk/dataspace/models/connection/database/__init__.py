@@ -20,4 +20,5 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from .edr_base import EDRBase
\ No newline at end of file
+from .edr_base import EDRBase
+from .edr_revision_base import EDRRevisionBase
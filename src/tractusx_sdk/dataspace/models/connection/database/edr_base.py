@@ -20,15 +20,46 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+from typing import ClassVar
+
 from sqlmodel import SQLModel, Field
-from sqlalchemy import JSON, String
-from sqlmodel import Column
+from sqlalchemy import JSON, String, Index, tuple_
 
 class EDRBase(SQLModel):
+    ## Columns identifying a connection, looked up together
+    CONNECTION_KEY_COLUMNS: ClassVar[tuple[str, ...]] = ("counter_party_id", "counter_party_address", "query_checksum", "policy_checksum")
+
     transfer_id: str = Field(primary_key=True)
     counter_party_id: str
     counter_party_address: str
     query_checksum: str
     policy_checksum: str
-    edr_data: dict = Field(sa_column=Column(JSON))
-    edr_hash: str = Field(default=None, sa_column=Column(String))
\ No newline at end of file
+    ## Column types instead of columns, so that every table defined from the base gets its own columns
+    edr_data: dict = Field(sa_type=JSON, nullable=True)
+    edr_hash: str = Field(default=None, sa_type=String, nullable=True)
+
+    @classmethod
+    def connection_key_index(cls, unique: bool = False) -> Index:
+        """
+        Returns the composite index of the connection key columns of the table, adding it to the table if missing.
+
+        Args:
+            unique (bool): Whether a connection key may only be stored once.
+        """
+        table = cls.__table__
+        name = f"ix_{table.name}_connection_key"
+        for index in table.indexes:
+            if index.name == name:
+                return index
+        return Index(name, *(table.c[column] for column in cls.CONNECTION_KEY_COLUMNS), unique=unique)
+
+    @classmethod
+    def connection_key_filter(cls, keys):
+        """
+        Returns the filter matching the rows of the given connection keys.
+
+        Args:
+            keys (list[tuple]): The (counter_party_id, counter_party_address, query_checksum, policy_checksum) tuples.
+        """
+        table = cls.__table__
+        return tuple_(*(table.c[column] for column in cls.CONNECTION_KEY_COLUMNS)).in_([tuple(key) for key in keys])
@@ -0,0 +1,34 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from sqlmodel import Field
+
+from .edr_base import EDRBase
+
+
+class EDRRevisionBase(EDRBase):
+    """
+    EDR connection row with a change feed: every saved change gets a revision higher than the previous ones,
+    and deleted connections are kept as tombstones, so that the readers can pull only the changes since their last sync.
+    """
+    revision: int = Field(default=0)
+    deleted: bool = Field(default=False)
@@ -27,4 +27,5 @@ __license__ = "Apache License, Version 2.0"
 from .base_connector_service import BaseConnectorService
 from .base_connector_consumer import BaseConnectorConsumerService
 from .base_connector_provider import BaseConnectorProviderService
+from .polling_strategy import PollingStrategy, NegotiationEventListener
 from .service_factory import ServiceFactory
@@ -21,9 +21,12 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+import asyncio
 import hashlib
 import threading
 import logging
+import weakref
+from typing import Callable, Iterator
 
 from requests import Response
 
@@ -32,12 +35,16 @@ from ...adapters.connector.adapter_factory import AdapterFactory
 from ...controllers.connector.base_dma_controller import BaseDmaController
 from ...controllers.connector.controller_factory import ControllerType, ControllerFactory
 from ...managers.connection.base_connection_manager import BaseConnectionManager
+from ...managers.connection.async_base_connection_manager import AsyncBaseConnectionManager
 from ...managers.connection.memory import MemoryConnectionManager
+from ...managers.edr_cache_manager import BaseEdrCacheManager, MemoryEdrCacheManager
+from ...managers.catalog_cache_manager import BaseCatalogCacheManager, CatalogCacheKey
 from ...models.connector.model_factory import ModelFactory
 from ...models.connector.base_catalog_model import BaseCatalogModel
 from ...models.connector.base_contract_negotiation_model import BaseContractNegotiationModel
 from ...models.connector.base_queryspec_model import BaseQuerySpecModel
-from ...tools import HttpTools, DspTools, op
+from ...tools import HttpTools, AsyncHttpTools, BoundedExecutor, DspTools, SingleFlight
+from .polling_strategy import PollingStrategy
 
 
 class BaseConnectorConsumerService(BaseService):
@@ -47,12 +54,28 @@ class BaseConnectorConsumerService(BaseService):
     _transfer_process_controller: BaseDmaController
 
     connection_manager: BaseConnectionManager
+    async_connection_manager: AsyncBaseConnectionManager | None
+    edr_cache_manager: BaseEdrCacheManager | None
+    catalog_cache_manager: BaseCatalogCacheManager | None
+    polling_strategy: PollingStrategy
     dataspace_version: str
 
     NEGOTIATION_ID_KEY = "contractNegotiationId"
+    ## Defaults for requesting the catalogs of several EDCs in parallel
+    catalog_max_concurrency: int | None = 10
+    catalog_deadline: float | None = None
+    ASYNC_CONTROLLER_TYPES: list[ControllerType] = [
+        ControllerType.CATALOG,
+        ControllerType.EDR,
+        ControllerType.CONTRACT_NEGOTIATION,
+        ControllerType.TRANSFER_PROCESS
+    ]
 
     def __init__(self, dataspace_version: str, base_url: str, dma_path: str, headers: dict = None,
-                 connection_manager: BaseConnectionManager = None, verbose: bool = True, logger: logging.Logger = None):
+                 connection_manager: BaseConnectionManager = None, verbose: bool = True, logger: logging.Logger = None,
+                 edr_cache_manager: BaseEdrCacheManager = None, edr_cache_enabled: bool = False,
+                 polling_strategy: PollingStrategy = None, catalog_cache_manager: BaseCatalogCacheManager = None,
+                 async_connection_manager: AsyncBaseConnectionManager = None):
         self.dataspace_version = dataspace_version
         self.verbose = verbose
         self.logger = logger
@@ -84,6 +107,29 @@ class BaseConnectorConsumerService(BaseService):
         self._transfer_process_controller = self.controllers.get(ControllerType.TRANSFER_PROCESS)
 
         self.connection_manager = connection_manager if connection_manager is not None else MemoryConnectionManager()
+        ## Concurrent requests for the same connection wait for a single negotiation
+        self._negotiations = SingleFlight()
+        self.polling_strategy = polling_strategy if polling_strategy is not None else PollingStrategy()
+
+        ## The data addresses of the EDRs are served from the cache until shortly before their tokens expire.
+        ## The cache is opt-in (a manager given or enabled), the connections deleted directly in the connection manager
+        ## do not invalidate their cached data addresses, only delete_connection() and invalidate_edr() do
+        if edr_cache_manager is not None:
+            self.edr_cache_manager = edr_cache_manager
+        elif edr_cache_enabled:
+            self.edr_cache_manager = MemoryEdrCacheManager()
+        else:
+            self.edr_cache_manager = None
+        ## The catalogs are only cached if a catalog cache manager is given, since the providers may change their offers
+        self.catalog_cache_manager = catalog_cache_manager
+
+        ## The asynchronous adapter and controllers are only built when an async method is used
+        self._async_dma_config: dict = {"base_url": base_url, "dma_path": dma_path, "headers": headers}
+        self._async_controllers: dict | None = None
+        self._catalog_revalidations: set[asyncio.Task] = set()
+        ## The awaitable methods look the connections up in the event loop if an async connection manager is given
+        self.async_connection_manager = async_connection_manager
+        self._async_negotiation_locks = weakref.WeakValueDictionary()
 
     class _Builder(BaseService._Builder):
         def dma_path(self, dma_path: str):
@@ -94,6 +140,22 @@ class BaseConnectorConsumerService(BaseService):
             self._data["connection_manager"] = connection_manager
             return self
 
+        def edr_cache_manager(self, edr_cache_manager: BaseEdrCacheManager):
+            self._data["edr_cache_manager"] = edr_cache_manager
+            return self
+
+        def polling_strategy(self, polling_strategy: PollingStrategy):
+            self._data["polling_strategy"] = polling_strategy
+            return self
+
+        def catalog_cache_manager(self, catalog_cache_manager: BaseCatalogCacheManager):
+            self._data["catalog_cache_manager"] = catalog_cache_manager
+            return self
+
+        def async_connection_manager(self, async_connection_manager: AsyncBaseConnectionManager):
+            self._data["async_connection_manager"] = async_connection_manager
+            return self
+
     @property
     def catalogs(self):
         return self._catalog_controller
@@ -110,6 +172,39 @@ class BaseConnectorConsumerService(BaseService):
     def transfer_processes(self):
         return self._transfer_process_controller
 
+    @property
+    def async_controllers(self) -> dict:
+        """
+        DMA controllers built on the asynchronous adapter, all their methods return awaitables.
+        """
+        if self._async_controllers is None:
+            self.async_dma_adapter = AdapterFactory.get_async_dma_adapter(
+                dataspace_version=self.dataspace_version,
+                **self._async_dma_config
+            )
+            self._async_controllers = ControllerFactory.get_dma_controllers_for_version(
+                dataspace_version=self.dataspace_version,
+                adapter=self.async_dma_adapter,
+                controller_types=self.ASYNC_CONTROLLER_TYPES
+            )
+        return self._async_controllers
+
+    @property
+    def async_catalogs(self):
+        return self.async_controllers.get(ControllerType.CATALOG)
+
+    @property
+    def async_edrs(self):
+        return self.async_controllers.get(ControllerType.EDR)
+
+    @property
+    def async_contract_negotiations(self):
+        return self.async_controllers.get(ControllerType.CONTRACT_NEGOTIATION)
+
+    @property
+    def async_transfer_processes(self):
+        return self.async_controllers.get(ControllerType.TRANSFER_PROCESS)
+
     def get_data_plane_headers(self, access_token, content_type=None):
         ## Build the headers needed for the edc the app to communicate with the edc data plane
         headers = {
@@ -138,12 +233,62 @@ class BaseConnectorConsumerService(BaseService):
         Raises:
         Exception: If the EDC response is not successful (status code is not 200).
         """
+        ## Serve the cached data address while its token is valid, refreshing it in the background when it is about to expire
+        if self.edr_cache_manager is not None:
+            cached = self.edr_cache_manager.get(transfer_id)
+            if cached is not None:
+                edr, refresh_due = cached
+                if refresh_due:
+                    threading.Thread(target=self._refresh_edr, args=(transfer_id,), daemon=True).start()
+                return edr
+
         ## Build edr transfer url
         response: Response = self.edrs.get_data_address(oid=transfer_id, params={"auto_refresh": True})
         if (response is None or response.status_code != 200):
             raise ConnectionError(
                 "Connector Service It was not possible to get the edr because the EDC response was not successful!")
-        return response.json()
+        edr = response.json()
+        if self.edr_cache_manager is not None:
+            self.edr_cache_manager.put(transfer_id, edr)
+        return edr
+
+    def _refresh_edr(self, transfer_id: str) -> None:
+        """
+        Refreshes the EDR token of a transfer proactively and updates the cached data address.
+        """
+        try:
+            response: Response = self.edrs.refresh(oid=transfer_id)
+            if (response is not None and response.status_code == 200):
+                self.edr_cache_manager.put(transfer_id, response.json())
+                return
+            if self.verbose and self.logger:
+                self.logger.warning(f"Connector Service It was not possible to refresh the EDR of the transfer [{transfer_id}]")
+        except Exception as e:
+            if self.verbose and self.logger:
+                self.logger.warning(f"Connector Service Error refreshing the EDR of the transfer [{transfer_id}]: {e}")
+        ## The cached data address stays valid until it expires, the next call tries to refresh it again
+        self.edr_cache_manager.release_refresh(transfer_id)
+
+    def invalidate_edr(self, transfer_id: str = None) -> None:
+        """
+        Removes the cached data address of a transfer (or all of them), e.g. when the dataplane rejects its token.
+        """
+        if self.edr_cache_manager is not None:
+            self.edr_cache_manager.invalidate(transfer_id)
+
+    def release_evicted_edr(self, counter_party_id: str, counter_party_address: str, query_checksum: str,
+                            policy_checksum: str, connection_entry: dict) -> None:
+        """
+        Deletes the EDR of a connection evicted from the connection manager in the connector, so that the provider
+        side state is reclaimed too. Intended as the on_evict hook of the MemoryConnectionManager.
+        """
+        transfer_id: str = connection_entry.get(BaseConnectionManager.TRANSFER_ID_KEY, None)
+        if transfer_id is None:
+            return
+        self.invalidate_edr(transfer_id)
+        response: Response = self.edrs.delete(oid=transfer_id)
+        if response is None or response.status_code not in (200, 204):
+            raise ConnectionError(f"Connector Service The EDR of the transfer [{transfer_id}] could not be deleted!")
 
     def get_endpoint_with_token(self, transfer_id: str) -> tuple[str, str]:
         """
@@ -175,6 +320,30 @@ class BaseConnectorConsumerService(BaseService):
                     "Connector Service Either request or counter_party_id and counter_party_address are required to build a catalog request")
             request = self.get_catalog_request(counter_party_id=counter_party_id,
                                                counter_party_address=counter_party_address)
+
+        if self.catalog_cache_manager is None or not isinstance(request, BaseCatalogModel):
+            return self._request_catalog(request=request, timeout=timeout)
+
+        ## Serve the cached catalog, revalidating it in the background once its ttl has passed
+        key: CatalogCacheKey = self._get_catalog_cache_key(request=request)
+        cached = self.catalog_cache_manager.get(key)
+        if cached is not None:
+            catalog, revalidate = cached
+            if revalidate:
+                threading.Thread(target=self._revalidate_catalog, args=(key, request, timeout), daemon=True).start()
+            return catalog
+
+        catalog = self._request_catalog(request=request, timeout=timeout)
+        self.catalog_cache_manager.put(key, catalog)
+        return catalog
+
+    def _get_catalog_cache_key(self, request: BaseCatalogModel) -> CatalogCacheKey:
+        return self.catalog_cache_manager.get_key(counter_party_id=request.counter_party_id,
+                                                  counter_party_address=request.counter_party_address,
+                                                  protocol=request.protocol,
+                                                  request_data=request.to_data())
+
+    def _request_catalog(self, request: BaseCatalogModel, timeout=60) -> dict:
         ## Get catalog with configurable timeout
         response: Response = self.catalogs.get_catalog(obj=request, timeout=timeout)
         ## In case the response code is not successfull or the response is null
@@ -183,6 +352,25 @@ class BaseConnectorConsumerService(BaseService):
                 f"Connector Service It was not possible to get the catalog from the EDC provider! Response code: [{response.status_code}]")
         return response.json()
 
+    def _revalidate_catalog(self, key: CatalogCacheKey, request: BaseCatalogModel, timeout=60) -> None:
+        try:
+            self.catalog_cache_manager.put(key, self._request_catalog(request=request, timeout=timeout))
+            return
+        except Exception as e:
+            if self.verbose and self.logger:
+                self.logger.warning(f"Connector Service [{key.counter_party_address}] Error revalidating the catalog: {e}")
+        ## The stale catalog is served until it expires, the next call tries to revalidate it again
+        self.catalog_cache_manager.release_revalidation(key)
+
+    def invalidate_catalogs(self, counter_party_id: str = None, counter_party_address: str = None) -> None:
+        """
+        Removes the cached catalogs of a counter party and/or address (or all of them), e.g. when the provider
+        has changed its offers.
+        """
+        if self.catalog_cache_manager is not None:
+            self.catalog_cache_manager.invalidate(counter_party_id=counter_party_id,
+                                                  counter_party_address=counter_party_address)
+
     ## Simple catalog request with filter
 
     def get_filter_expression(self, key: str, value: str, operator: str = "=") -> dict:
@@ -322,36 +510,54 @@ class BaseConnectorConsumerService(BaseService):
         )
 
     def get_catalogs_by_dct_type(self, counter_party_id: str, edcs: list, dct_type: str,
-                                 dct_type_key: str = "'http://purl.org/dc/terms/type'.'@id'", timeout: int = None):
+                                 dct_type_key: str = "'http://purl.org/dc/terms/type'.'@id'", timeout: int = None,
+                                 max_concurrency: int = None, deadline: float = None):
         return self.get_catalogs_with_filter(counter_party_id=counter_party_id, edcs=edcs, 
                                              filter_expression=[self.get_filter_expression(key=dct_type_key, value=dct_type, operator="=")],
-                                             timeout=timeout)
+                                             timeout=timeout, max_concurrency=max_concurrency, deadline=deadline)
 
     def get_catalogs_with_filter(self, counter_party_id: str, edcs: list, filter_expression: list[dict],
-                                 timeout: int = None):
-
-        ## Where the catalogs get stored
-        catalogs: dict = {}
-        threads: list[threading.Thread] = []
+                                 timeout: int = None, max_concurrency: int = None, deadline: float = None) -> dict:
+        """
+        Requests the catalogs of several EDCs in parallel, in the shared bounded worker pool.
 
-        for edc_url in edcs:
-            thread = threading.Thread(target=self.get_catalog_with_filter_parallel, kwargs=
-            {
-                'counter_party_id': counter_party_id,
-                'counter_party_address': edc_url,
-                'filter_expression': filter_expression,
-                'timeout': timeout,
-                'catalogs': catalogs
-            }
-                                      )
-            thread.start()  ## Start thread
-            threads.append(thread)
+        @param max_concurrency: Maximum amount of catalogs requested at the same time. Defaults to catalog_max_concurrency.
+        @param deadline: Maximum seconds to wait for all the catalogs. Defaults to catalog_deadline.
+        @returns: dict with the catalogs by EDC url, the failed or late EDCs are not included.
+        """
+        return dict(self.iter_catalogs_with_filter(counter_party_id=counter_party_id, edcs=edcs,
+                                                   filter_expression=filter_expression, timeout=timeout,
+                                                   max_concurrency=max_concurrency, deadline=deadline))
 
-        ## Allow the threads to process
-        for thread in threads:
-            thread.join()  ## Waiting until they process
+    def iter_catalogs_with_filter(self, counter_party_id: str, edcs: list, filter_expression: list[dict],
+                                  timeout: int = None, max_concurrency: int = None,
+                                  deadline: float = None) -> Iterator[tuple[str, dict]]:
+        """
+        Same as get_catalogs_with_filter, but yields (edc_url, catalog) as soon as each catalog is received,
+        so that the first usable catalog can be used before the slowest EDC answers.
+        """
+        return self._iter_catalogs(
+            edcs=edcs,
+            fetch_catalog=lambda edc_url: self.get_catalog_with_filter(counter_party_id=counter_party_id,
+                                                                       counter_party_address=edc_url,
+                                                                       filter_expression=filter_expression,
+                                                                       timeout=timeout),
+            max_concurrency=max_concurrency,
+            deadline=deadline
+        )
 
-        return catalogs
+    def _iter_catalogs(self, edcs: list, fetch_catalog: Callable[[str], dict], max_concurrency: int = None,
+                       deadline: float = None) -> Iterator[tuple[str, dict]]:
+        concurrency: int | None = max_concurrency if max_concurrency is not None else self.catalog_max_concurrency
+        call_deadline: float | None = deadline if deadline is not None else self.catalog_deadline
+        ## Each EDC is requested once, even if it is listed several times
+        for edc_url, future in BoundedExecutor.as_completed(function=fetch_catalog, items=list(dict.fromkeys(edcs)),
+                                                            max_concurrency=concurrency, deadline=call_deadline):
+            try:
+                yield edc_url, future.result()
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Connector Service [{edc_url}] It was not possible to retrieve the catalog! Reason: [{str(e)}]")
 
     def get_catalog_by_dct_type(self, counter_party_id: str, counter_party_address: str, dct_type: str,
                                 dct_type_key="'http://purl.org/dc/terms/type'.'@id'", operator="=", timeout=None):
@@ -437,7 +643,8 @@ class BaseConnectorConsumerService(BaseService):
         return data.pop()  ## Return last entry of the list (should be just one entry because of the filter)
 
     def negotiate_and_transfer(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
-                               policies: list = None, max_retries: int = 6, timeout: int = 10) -> dict:
+                               policies: list = None, max_retries: int = None, timeout: int = None,
+                               polling_strategy: PollingStrategy = None) -> dict:
         """
         This method checks if there is a transfer process ID available, or if it needs to be negotiated.
 
@@ -445,6 +652,9 @@ class BaseConnectorConsumerService(BaseService):
         @param counter_party_address: The URL of the EDC provider.
         @param policies: The policies to be used for the transfer. Defaults to None.
         @param dct_type: The DCT type to be used for the transfer. Defaults to "IndustryFlagService".
+        @param max_retries: If given (or the timeout), the EDR entry is polled this amount of times every timeout seconds.
+        @param timeout: If given (or the max_retries), the seconds waited between the polls of the EDR entry.
+        @param polling_strategy: The strategy for polling the EDR entry. Defaults to the one of the service.
         @returns: edr_entry:dict, if fails Exception
         """
         ##### 1. Get Catalog
@@ -484,23 +694,18 @@ class BaseConnectorConsumerService(BaseService):
                 break
 
         if (negotiation_id is None):
+            ## The offers of a cached catalog may be outdated
+            self.invalidate_catalogs(counter_party_id=counter_party_id, counter_party_address=counter_party_address)
             raise RuntimeError(
                 f"Connector Service [{counter_party_address}] It was not possible to start the EDR Negotiation! The negotiation id is empty!")
 
         ##### 3. Get EDC Entry (details)
 
-        retries: int = 0
-        edr_entry: dict | None = None
-        while edr_entry is None and retries < max_retries:
-            edr_entry = self.get_edr_entry(negotiation_id=negotiation_id)
-            if edr_entry is not None:  ## If edr is found skip retry
-                break
-            ## Wait until the timeout has reached to retry again
-            if self.logger:
-                self.logger.info(
-                    f"Connector Service Attempt [{retries + 1}]/[{max_retries}]: [{counter_party_address}] The EDR Negotiation [{negotiation_id}] entry was not found! Waiting {timeout} seconds and retrying...")
-            op.wait(seconds=timeout)
-            retries += 1
+        edr_entry: dict | None = self.wait_for_edr_entry(negotiation_id=negotiation_id,
+                                                         counter_party_address=counter_party_address,
+                                                         polling_strategy=self._get_polling_strategy(
+                                                             polling_strategy=polling_strategy,
+                                                             max_retries=max_retries, timeout=timeout))
 
         if edr_entry is None:
             raise TimeoutError(
@@ -508,6 +713,45 @@ class BaseConnectorConsumerService(BaseService):
 
         return edr_entry
 
+    def _get_polling_strategy(self, polling_strategy: PollingStrategy = None, max_retries: int = None,
+                              timeout: int = None) -> PollingStrategy:
+        if polling_strategy is not None:
+            return polling_strategy
+        ## Explicit retries or timeout keep the fixed interval polling
+        if max_retries is not None or timeout is not None:
+            return PollingStrategy.fixed(interval=timeout if timeout is not None else 10,
+                                         max_attempts=max_retries if max_retries is not None else 6,
+                                         event_listener=self.polling_strategy.event_listener)
+        return self.polling_strategy
+
+    def wait_for_edr_entry(self, negotiation_id: str, counter_party_address: str = None,
+                           polling_strategy: PollingStrategy = None) -> dict | None:
+        """
+        Polls the EDR entry of a negotiation until it is available.
+
+        @param negotiation_id: The unique identifier for the negotiation process.
+        @param counter_party_address: The URL of the EDC provider, used for logging.
+        @param polling_strategy: The strategy for polling the EDR entry. Defaults to the one of the service.
+        @returns: EndpointDataReferenceEntry:dict or None if it was not available in time
+        """
+        strategy = polling_strategy if polling_strategy is not None else self.polling_strategy
+
+        def on_retry(attempt: int, delay: float):
+            if self.logger:
+                self.logger.info(
+                    f"Connector Service Attempt [{attempt}]: [{counter_party_address}] The EDR Negotiation [{negotiation_id}] entry was not found! Waiting {delay:.2f} seconds and retrying...")
+
+        return strategy.poll(fetch=lambda: self.get_edr_entry(negotiation_id=negotiation_id),
+                             key=negotiation_id, on_retry=on_retry)
+
+    def handle_negotiation_event(self, event: dict) -> None:
+        """
+        Forwards a connector event (e.g. received by a webhook of the EDC event subscriber) to the polling strategy,
+        so that the negotiations waiting for their EDR entry poll it right away.
+        """
+        if self.polling_strategy.event_listener is not None:
+            self.polling_strategy.event_listener.handle_event(event)
+
     def get_transfer_id(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
                         policies: list = None) -> str:
 
@@ -528,8 +772,8 @@ class BaseConnectorConsumerService(BaseService):
         """
 
         ## Hash the policies to get checksum. 
-        current_policies_checksum = hashlib.sha3_256(str(policies).encode('utf-8')).hexdigest()
-        filter_expression_checksum = hashlib.sha3_256(str(filter_expression).encode('utf-8')).hexdigest()
+        filter_expression_checksum, current_policies_checksum = self.get_connection_checksums(
+            filter_expression=filter_expression, policies=policies)
         ## If the countrer party id is already available and also the dct type is in the counter_party_id and the transfer key is also present
         transfer_process_id: str = self.connection_manager.get_connection_transfer_id(counter_party_id=counter_party_id,
                                                                                       counter_party_address=counter_party_address,
@@ -543,29 +787,106 @@ class BaseConnectorConsumerService(BaseService):
                     counter_party_address, transfer_process_id, counter_party_id, filter_expression)
             return transfer_process_id
 
-        if self.logger:
-            self.logger.info(
-                "Connector Service The EDR was not found in the cache for counter_party_address=[%s], counter_party_id=[%s], filter=[%s] and selected policies, starting new contract negotiation!",
-                counter_party_address, counter_party_id, filter_expression)
+        ## If not the contract negotiation MUST be done, only once for all the concurrent requests of the same connection!
+        return self._negotiate_transfer_id(
+            counter_party_id=counter_party_id,
+            counter_party_address=counter_party_address,
+            filter_expression=filter_expression,
+            query_checksum=filter_expression_checksum,
+            policy_checksum=current_policies_checksum,
+            negotiate=lambda: self.negotiate_and_transfer(counter_party_id=counter_party_id,
+                                                          counter_party_address=counter_party_address, policies=policies,
+                                                          filter_expression=filter_expression)
+        )
+
+    @staticmethod
+    def get_connection_checksums(filter_expression: list[dict], policies: list = None) -> tuple[str, str]:
+        """
+        Builds the query and policy checksums identifying a connection in the connection manager.
 
-        ## If not the contract negotiation MUST be done!
-        edr_entry: dict = self.negotiate_and_transfer(counter_party_id=counter_party_id,
-                                                      counter_party_address=counter_party_address, policies=policies,
-                                                      filter_expression=filter_expression)
+        @returns: tuple[query_checksum:str, policy_checksum:str]
+        """
+        query_checksum = hashlib.sha3_256(str(filter_expression).encode('utf-8')).hexdigest()
+        policy_checksum = hashlib.sha3_256(str(policies).encode('utf-8')).hexdigest()
+        return query_checksum, policy_checksum
+
+    def delete_connection(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
+                          policies: list = None) -> bool:
+        """
+        Deletes a connection from the connection manager, together with the cached data address of its EDR,
+        so that the next request negotiates it again.
+
+        @returns: True if the connection was deleted, False if it was not found.
+        """
+        query_checksum, policy_checksum = self.get_connection_checksums(filter_expression=filter_expression,
+                                                                        policies=policies)
+        transfer_id: str | None = self.connection_manager.get_connection_transfer_id(counter_party_id=counter_party_id,
+                                                                                     counter_party_address=counter_party_address,
+                                                                                     query_checksum=query_checksum,
+                                                                                     policy_checksum=policy_checksum)
+        deleted = self.connection_manager.delete_connection(counter_party_id=counter_party_id,
+                                                            counter_party_address=counter_party_address,
+                                                            query_checksum=query_checksum,
+                                                            policy_checksum=policy_checksum)
+        if transfer_id is not None:
+            self.invalidate_edr(transfer_id)
+        return deleted
+
+    def _negotiate_transfer_id(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
+                               query_checksum: str, policy_checksum: str, negotiate) -> str:
+        """
+        Negotiates a new connection and stores it in the connection manager.
 
-        ## Check if the edr entry is not none
-        if (edr_entry is None):
-            raise RuntimeError("Connector Service Failed to get edr entry! Response was none!")
+        The negotiation is single-flight: concurrent callers asking for the same connection wait for the first one
+        and get its transfer id. The connection manager lock is held during the negotiation, so managers shared between
+        processes can also avoid duplicated negotiations.
 
-        if self.logger:
-            self.logger.info(f"Connector Service The EDR Entry was found! Transfer Process ID: [{transfer_process_id}]")
+        @param negotiate: Callable doing the negotiation and returning the edr entry.
+        @returns: The transfer process id of the new connection.
+        """
+        key = (counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        return self._negotiations.do(key, self._negotiate_and_add_connection, counter_party_id, counter_party_address,
+                                     filter_expression, query_checksum, policy_checksum, negotiate)
 
-        ## Check if the transfer id is available and return the transfer process id
-        return self.connection_manager.add_connection(counter_party_id=counter_party_id,
+    def _negotiate_and_add_connection(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
+                                      query_checksum: str, policy_checksum: str, negotiate) -> str:
+        with self.connection_manager.negotiation_lock(counter_party_id=counter_party_id,
                                                       counter_party_address=counter_party_address,
-                                                      query_checksum=filter_expression_checksum,
-                                                      policy_checksum=current_policies_checksum,
-                                                      connection_entry=edr_entry)
+                                                      query_checksum=query_checksum,
+                                                      policy_checksum=policy_checksum):
+            ## Another request (or process) may have negotiated the connection meanwhile
+            transfer_process_id: str = self.connection_manager.get_connection_transfer_id(counter_party_id=counter_party_id,
+                                                                                          counter_party_address=counter_party_address,
+                                                                                          query_checksum=query_checksum,
+                                                                                          policy_checksum=policy_checksum)
+            if (transfer_process_id is not None):
+                return transfer_process_id
+
+            if self.logger:
+                self.logger.info(
+                    "Connector Service The EDR was not found in the cache for counter_party_address=[%s], counter_party_id=[%s], filter=[%s] and selected policies, starting new contract negotiation!",
+                    counter_party_address, counter_party_id, filter_expression)
+
+            edr_entry: dict = negotiate()
+
+            ## Check if the edr entry is not none
+            if (edr_entry is None):
+                raise RuntimeError("Connector Service Failed to get edr entry! Response was none!")
+
+            ## Check if the transfer id is available and return the transfer process id
+            transfer_process_id = self.connection_manager.add_connection(counter_party_id=counter_party_id,
+                                                                         counter_party_address=counter_party_address,
+                                                                         query_checksum=query_checksum,
+                                                                         policy_checksum=policy_checksum,
+                                                                         connection_entry=edr_entry)
+            ## A data address cached for a previous connection with the same transfer id is not valid anymore
+            if transfer_process_id is not None:
+                self.invalidate_edr(transfer_process_id)
+
+            if self.logger:
+                self.logger.info(f"Connector Service The EDR Entry was found! Transfer Process ID: [{transfer_process_id}]")
+
+            return transfer_process_id
 
     def do_dsp_by_dct_type(
         self,
@@ -1180,3 +1501,276 @@ class BaseConnectorConsumerService(BaseService):
             timeout=timeout,
             allow_redirects=allow_redirects
         )
+
+    ## Asynchronous counterparts, sharing the pooled httpx client of the AsyncHttpTools
+
+    async def get_edr_async(self, transfer_id: str) -> dict | None:
+        """
+        Awaitable version of get_edr.
+        """
+        if self.edr_cache_manager is not None:
+            cached = self.edr_cache_manager.get(transfer_id)
+            if cached is not None:
+                edr, refresh_due = cached
+                if not refresh_due:
+                    return edr
+                ## Refresh inline, the event loop keeps serving other requests meanwhile
+                try:
+                    response = await self.async_edrs.refresh(oid=transfer_id)
+                    if (response is not None and response.status_code == 200):
+                        edr = response.json()
+                        self.edr_cache_manager.put(transfer_id, edr)
+                        return edr
+                except Exception as e:
+                    if self.verbose and self.logger:
+                        self.logger.warning(f"Connector Service Error refreshing the EDR of the transfer [{transfer_id}]: {e}")
+                self.edr_cache_manager.release_refresh(transfer_id)
+                return edr
+
+        response = await self.async_edrs.get_data_address(oid=transfer_id, params={"auto_refresh": True})
+        if (response is None or response.status_code != 200):
+            raise ConnectionError(
+                "Connector Service It was not possible to get the edr because the EDC response was not successful!")
+        edr = response.json()
+        if self.edr_cache_manager is not None:
+            self.edr_cache_manager.put(transfer_id, edr)
+        return edr
+
+    async def get_endpoint_with_token_async(self, transfer_id: str) -> tuple[str, str]:
+        """
+        Awaitable version of get_endpoint_with_token.
+
+        @returns: tuple[dataplane_endpoint:str, authorization:str]
+        """
+        edr: dict = await self.get_edr_async(transfer_id=transfer_id)
+        if (edr is None):
+            raise RuntimeError("Connector Service It was not possible to retrieve the edr token and the dataplane endpoint!")
+
+        return edr["endpoint"], edr["authorization"]
+
+    async def get_catalog_async(self, counter_party_id: str = None, counter_party_address: str = None,
+                                request: BaseCatalogModel = None, timeout=60) -> dict | None:
+        """
+        Awaitable version of get_catalog.
+        """
+        if request is None:
+            if counter_party_id is None or counter_party_address is None:
+                raise ValueError(
+                    "Connector Service Either request or counter_party_id and counter_party_address are required to build a catalog request")
+            request = self.get_catalog_request(counter_party_id=counter_party_id,
+                                               counter_party_address=counter_party_address)
+
+        if self.catalog_cache_manager is None or not isinstance(request, BaseCatalogModel):
+            return await self._request_catalog_async(request=request, timeout=timeout)
+
+        ## Same cache as get_catalog, the stale catalog is revalidated in a task of the running event loop
+        key: CatalogCacheKey = self._get_catalog_cache_key(request=request)
+        cached = self.catalog_cache_manager.get(key)
+        if cached is not None:
+            catalog, revalidate = cached
+            if revalidate:
+                task = asyncio.get_running_loop().create_task(self._revalidate_catalog_async(key, request, timeout))
+                ## The event loop only keeps weak references to its tasks
+                self._catalog_revalidations.add(task)
+                task.add_done_callback(self._catalog_revalidations.discard)
+            return catalog
+
+        catalog = await self._request_catalog_async(request=request, timeout=timeout)
+        self.catalog_cache_manager.put(key, catalog)
+        return catalog
+
+    async def _request_catalog_async(self, request: BaseCatalogModel, timeout=60) -> dict:
+        response = await self.async_catalogs.get_catalog(obj=request, timeout=timeout)
+        if response is None or response.status_code != 200:
+            raise ConnectionError(
+                f"Connector Service It was not possible to get the catalog from the EDC provider! Response code: [{response.status_code}]")
+        return response.json()
+
+    async def _revalidate_catalog_async(self, key: CatalogCacheKey, request: BaseCatalogModel, timeout=60) -> None:
+        try:
+            self.catalog_cache_manager.put(key, await self._request_catalog_async(request=request, timeout=timeout))
+            return
+        except Exception as e:
+            if self.verbose and self.logger:
+                self.logger.warning(f"Connector Service [{key.counter_party_address}] Error revalidating the catalog: {e}")
+        self.catalog_cache_manager.release_revalidation(key)
+
+    async def get_transfer_id_async(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
+                                    policies: list = None, **kwargs) -> str:
+        """
+        Awaitable version of get_transfer_id.
+
+        With an async connection manager the connection is looked up in the event loop and only a needed contract
+        negotiation runs in a worker thread. Without it the whole lookup runs in a worker thread.
+
+        @param kwargs: Additional keyword arguments for get_transfer_id (e.g. protocol or contexts).
+        @returns: The transfer process id.
+        """
+        if self.async_connection_manager is None:
+            return await asyncio.to_thread(
+                self.get_transfer_id,
+                counter_party_id=counter_party_id,
+                counter_party_address=counter_party_address,
+                policies=policies,
+                filter_expression=filter_expression,
+                **kwargs
+            )
+
+        query_checksum, policy_checksum = self.get_connection_checksums(filter_expression=filter_expression,
+                                                                        policies=policies)
+        key = (counter_party_id, counter_party_address, query_checksum, policy_checksum)
+        transfer_process_id: str = await self.async_connection_manager.get_connection_transfer_id(*key)
+        if (transfer_process_id is not None):
+            return transfer_process_id
+
+        ## Concurrent tasks asking for the same connection wait for a single negotiation
+        lock = self._async_negotiation_locks.get(key)
+        if lock is None:
+            lock = self._async_negotiation_locks[key] = asyncio.Lock()
+        async with lock, self.async_connection_manager.negotiation_lock(*key):
+            ## Another task (or process) may have negotiated the connection meanwhile
+            transfer_process_id = await self.async_connection_manager.get_connection_transfer_id(*key)
+            if (transfer_process_id is not None):
+                return transfer_process_id
+
+            if self.logger:
+                self.logger.info(
+                    "Connector Service The EDR was not found in the cache for counter_party_address=[%s], counter_party_id=[%s], filter=[%s] and selected policies, starting new contract negotiation!",
+                    counter_party_address, counter_party_id, filter_expression)
+
+            ## The negotiation polls the connector, so it runs in a worker thread
+            edr_entry: dict = await asyncio.to_thread(
+                self.negotiate_and_transfer,
+                counter_party_id=counter_party_id,
+                counter_party_address=counter_party_address,
+                policies=policies,
+                filter_expression=filter_expression,
+                **kwargs
+            )
+            if (edr_entry is None):
+                raise RuntimeError("Connector Service Failed to get edr entry! Response was none!")
+
+            transfer_process_id = await self.async_connection_manager.add_connection(
+                counter_party_id=counter_party_id,
+                counter_party_address=counter_party_address,
+                query_checksum=query_checksum,
+                policy_checksum=policy_checksum,
+                connection_entry=edr_entry
+            )
+            if transfer_process_id is not None:
+                self.invalidate_edr(transfer_process_id)
+            return transfer_process_id
+
+    async def do_dsp_async(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
+                           policies: list = None, **kwargs) -> tuple[str, str]:
+        """
+        Awaitable version of do_dsp.
+
+        The transfer id is looked up with get_transfer_id_async, so that the event loop is never blocked
+        by the connection manager or by the negotiation polling.
+
+        @param kwargs: Additional keyword arguments for get_transfer_id (e.g. protocol or contexts).
+        @returns: tuple[dataplane_endpoint:str, edr_access_token:str] or if fail Exception
+        """
+        transfer_id = await self.get_transfer_id_async(
+            counter_party_id=counter_party_id,
+            counter_party_address=counter_party_address,
+            policies=policies,
+            filter_expression=filter_expression,
+            **kwargs
+        )
+        return await self.get_endpoint_with_token_async(transfer_id=transfer_id)
+
+    async def do_get_async(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
+                           path: str = "/", policies: list = None, verify: bool = False, headers: dict = None,
+                           timeout: int = None, params: dict = None, allow_redirects: bool = False, **kwargs):
+        """
+        Awaitable version of do_get, the dataplane request is sent with the shared pooled httpx client.
+
+        @param kwargs: Additional keyword arguments for do_dsp_async.
+        @returns: httpx.Response
+        """
+        dataplane_url, access_token = await self.do_dsp_async(
+            counter_party_id=counter_party_id,
+            counter_party_address=counter_party_address,
+            policies=policies,
+            filter_expression=filter_expression,
+            **kwargs
+        )
+
+        if dataplane_url is None or access_token is None:
+            raise RuntimeError("Connector Service No dataplane URL or access_token was able to be retrieved!")
+
+        dataplane_headers: dict = self.get_data_plane_headers(access_token=access_token)
+        return await AsyncHttpTools.do_get(
+            url=dataplane_url + path,
+            headers=(headers or {}) | dataplane_headers,
+            verify=verify,
+            timeout=timeout,
+            params=params,
+            allow_redirects=allow_redirects
+        )
+
+    async def do_post_async(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
+                            path: str = "/", content_type: str = "application/json", json=None, data=None,
+                            policies: list = None, verify: bool = False, headers: dict = None, timeout: int = None,
+                            allow_redirects: bool = False, **kwargs):
+        """
+        Awaitable version of do_post, the dataplane request is sent with the shared pooled httpx client.
+
+        @param kwargs: Additional keyword arguments for do_dsp_async.
+        @returns: httpx.Response
+        """
+        dataplane_url, access_token = await self.do_dsp_async(
+            counter_party_id=counter_party_id,
+            counter_party_address=counter_party_address,
+            policies=policies,
+            filter_expression=filter_expression,
+            **kwargs
+        )
+
+        if dataplane_url is None or access_token is None:
+            raise RuntimeError("Connector Service No dataplane URL or access_token was able to be retrieved!")
+
+        dataplane_headers: dict = self.get_data_plane_headers(access_token=access_token, content_type=content_type)
+        return await AsyncHttpTools.do_post(
+            url=dataplane_url + path,
+            json=json,
+            data=data,
+            headers=(headers or {}) | dataplane_headers,
+            verify=verify,
+            timeout=timeout,
+            allow_redirects=allow_redirects
+        )
+
+    async def do_put_async(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
+                           path: str = "/", content_type: str = "application/json", json=None, data=None,
+                           policies: list = None, verify: bool = False, headers: dict = None, timeout: int = None,
+                           allow_redirects: bool = False, **kwargs):
+        """
+        Awaitable version of do_put, the dataplane request is sent with the shared pooled httpx client.
+
+        @param kwargs: Additional keyword arguments for do_dsp_async.
+        @returns: httpx.Response
+        """
+        dataplane_url, access_token = await self.do_dsp_async(
+            counter_party_id=counter_party_id,
+            counter_party_address=counter_party_address,
+            policies=policies,
+            filter_expression=filter_expression,
+            **kwargs
+        )
+
+        if dataplane_url is None or access_token is None:
+            raise RuntimeError("Connector Service No dataplane URL or access_token was able to be retrieved!")
+
+        dataplane_headers: dict = self.get_data_plane_headers(access_token=access_token, content_type=content_type)
+        return await AsyncHttpTools.do_put(
+            url=dataplane_url + path,
+            json=json,
+            data=data,
+            headers=(headers or {}) | dataplane_headers,
+            verify=verify,
+            timeout=timeout,
+            allow_redirects=allow_redirects
+        )
@@ -0,0 +1,180 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import random
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+
+class NegotiationEventListener:
+    """
+    Wakes up the EDR pollers when the connector notifies that a negotiation or transfer has progressed.
+
+    The application receiving the connector events (e.g. an EDC event subscriber calling a webhook) forwards them
+    to handle_event() or notify(), and the waiting pollers check the EDR entry right away instead of sleeping
+    until their next scheduled poll.
+    """
+
+    NEGOTIATION_ID_KEYS = ["contractNegotiationId", "edc:contractNegotiationId",
+                           "https://w3id.org/edc/v0.0.1/ns/contractNegotiationId"]
+
+    def __init__(self):
+        self._events: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def get_event(self, negotiation_id: str) -> threading.Event:
+        """
+        Returns the event set when the negotiation is notified, registering it if needed.
+        """
+        with self._lock:
+            event = self._events.get(negotiation_id)
+            if event is None:
+                event = threading.Event()
+                self._events[negotiation_id] = event
+            return event
+
+    def release(self, negotiation_id: str) -> None:
+        """
+        Removes the event of a negotiation which is no longer awaited.
+        """
+        with self._lock:
+            self._events.pop(negotiation_id, None)
+
+    def notify(self, negotiation_id: str = None) -> None:
+        """
+        Wakes up the pollers of a negotiation, or all of them if the negotiation is unknown.
+        """
+        with self._lock:
+            if negotiation_id is None:
+                events = list(self._events.values())
+            else:
+                events = [self._events.get(negotiation_id)]
+        for event in events:
+            if event is not None:
+                event.set()
+
+    def handle_event(self, event: dict) -> None:
+        """
+        Handles a connector event (e.g. "ContractNegotiationFinalized" or "TransferProcessStarted").
+
+        The negotiation id is searched in the event and its payload, if it is not found all the pollers are woken up.
+        """
+        payload = event.get("payload", {}) if isinstance(event, dict) else {}
+        negotiation_id = None
+        for source in [payload, event]:
+            if not isinstance(source, dict):
+                continue
+            for key in self.NEGOTIATION_ID_KEYS:
+                if source.get(key):
+                    negotiation_id = source.get(key)
+                    break
+            if negotiation_id is not None:
+                break
+        self.notify(negotiation_id=negotiation_id)
+
+
+class PollingStrategy:
+    """
+    Polls until a result is available, with an immediate first poll, exponential backoff, jitter and a total deadline.
+
+    If a NegotiationEventListener is given, the waits between polls are interrupted as soon as the awaited
+    negotiation is notified.
+    """
+
+    def __init__(self, initial_delay: float = 0.25, max_delay: float = 10.0, multiplier: float = 2.0,
+                 jitter: float = 0.1, deadline: float | None = 60.0, max_attempts: int | None = None,
+                 event_listener: NegotiationEventListener = None):
+        """
+        :param initial_delay: Seconds waited after the first unsuccessful poll.
+        :param max_delay: Maximum seconds waited between two polls.
+        :param multiplier: Factor applied to the delay after every unsuccessful poll.
+        :param jitter: Fraction of the delay randomly added or removed, to spread the polls of concurrent callers.
+        :param deadline: Maximum total seconds spent polling, None for no deadline.
+        :param max_attempts: Maximum amount of polls, None for no limit.
+        :param event_listener: Optional listener whose notifications trigger the next poll right away.
+        """
+        if deadline is None and max_attempts is None:
+            raise ValueError("The polling strategy needs a deadline or a maximum amount of attempts!")
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.max_attempts = max_attempts
+        self.event_listener = event_listener
+
+    @classmethod
+    def fixed(cls, interval: float, max_attempts: int, event_listener: NegotiationEventListener = None):
+        """
+        Builds a strategy polling every interval seconds, for a maximum amount of attempts.
+        """
+        return cls(initial_delay=interval, max_delay=interval, multiplier=1.0, jitter=0.0, deadline=None,
+                   max_attempts=max_attempts, event_listener=event_listener)
+
+    def delays(self) -> Iterator[float]:
+        """
+        Yields the seconds to wait after each unsuccessful poll, without the deadline applied.
+        """
+        delay = self.initial_delay
+        while True:
+            spread = delay * self.jitter
+            yield max(0.0, delay + random.uniform(-spread, spread))
+            delay = min(delay * self.multiplier, self.max_delay)
+
+    def poll(self, fetch: Callable[[], Any], key: str = None, on_retry: Callable[[int, float], None] = None) -> Any:
+        """
+        Calls fetch until it returns something other than None, or the attempts or the deadline are exhausted.
+
+        :param fetch: The function returning the result, or None if it is not available yet.
+        :param key: The negotiation id whose notifications interrupt the waits, when an event listener is configured.
+        :param on_retry: Optional callback receiving the attempt number and the seconds to wait before the next poll.
+        :return: The result of fetch, or None if it was not available in time.
+        """
+        started = time.monotonic()
+        wake_up = self.event_listener.get_event(key) if (self.event_listener is not None and key is not None) else None
+        try:
+            attempt = 0
+            for delay in self.delays():
+                ## Clear before fetching, so that a notification arriving meanwhile triggers the next poll
+                if wake_up is not None:
+                    wake_up.clear()
+                result = fetch()
+                attempt += 1
+                if result is not None:
+                    return result
+                if self.max_attempts is not None and attempt >= self.max_attempts:
+                    return None
+                if self.deadline is not None:
+                    remaining = self.deadline - (time.monotonic() - started)
+                    if remaining <= 0:
+                        return None
+                    delay = min(delay, remaining)
+                if on_retry is not None:
+                    on_retry(attempt, delay)
+                if wake_up is not None:
+                    wake_up.wait(timeout=delay)
+                else:
+                    time.sleep(delay)
+        finally:
+            if wake_up is not None:
+                self.event_listener.release(key)
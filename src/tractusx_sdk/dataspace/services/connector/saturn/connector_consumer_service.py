@@ -21,16 +21,20 @@
 #################################################################################
 
 from ....models.connector.saturn import ContractNegotiationModel
-from ....tools import op, HttpTools, DspTools
+from ....tools import HttpTools, DspTools, BoundedExecutor, SingleFlight, TtlCache
 from ..base_connector_consumer import BaseConnectorConsumerService
+from ..polling_strategy import PollingStrategy
 from ....managers.connection.base_connection_manager import BaseConnectionManager
+from ....managers.connection.async_base_connection_manager import AsyncBaseConnectionManager
+from ....managers.edr_cache_manager import BaseEdrCacheManager
+from ....managers.catalog_cache_manager import BaseCatalogCacheManager
 import logging
 from ....models.connector.model_factory import ModelFactory, DataspaceVersionMapping
 from ....adapters.connector.adapter_factory import AdapterFactory
 from ....controllers.connector.base_dma_controller import BaseDmaController
 from ....controllers.connector.controller_factory import ControllerType, ControllerFactory
 from ....models.connector.saturn.catalog_model import CatalogModel
-import hashlib
+from typing import Iterator
 from requests import Response
 class ConnectorConsumerService(BaseConnectorConsumerService):
     
@@ -40,8 +44,13 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
     DEFAULT_CONTEXT:dict = {"edc": EDC_NAMESPACE,"odrl": "http://www.w3.org/ns/odrl/2/","dct": "https://purl.org/dc/terms/"}
     _connector_discovery_controller: BaseDmaController
     DEFAULT_DCT_TYPE_KEY: str = "'http://purl.org/dc/terms/type'.'@id'"
+    ASYNC_CONTROLLER_TYPES: list[ControllerType] = BaseConnectorConsumerService.ASYNC_CONTROLLER_TYPES + [ControllerType.CONNECTOR_DISCOVERY]
     def __init__(self, base_url: str, dma_path: str, headers: dict = None,
-                 connection_manager: BaseConnectionManager = None, verbose: bool = True, logger: logging.Logger = None):
+                 connection_manager: BaseConnectionManager = None, verbose: bool = True, logger: logging.Logger = None,
+                 edr_cache_manager: BaseEdrCacheManager = None, edr_cache_enabled: bool = False,
+                 polling_strategy: PollingStrategy = None, catalog_cache_manager: BaseCatalogCacheManager = None,
+                 discovery_cache: TtlCache = None, discovery_cache_enabled: bool = False,
+                 async_connection_manager: AsyncBaseConnectionManager = None):
         # Set attributes before accessing them
         self.verbose = verbose
         self.logger = logger
@@ -78,12 +87,30 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
             headers=headers,
             connection_manager=connection_manager,
             verbose=verbose,
-            logger=logger
+            logger=logger,
+            edr_cache_manager=edr_cache_manager,
+            edr_cache_enabled=edr_cache_enabled,
+            polling_strategy=polling_strategy,
+            catalog_cache_manager=catalog_cache_manager,
+            async_connection_manager=async_connection_manager
         )
+        ## BPNL -> connector discovery info, opt-in (a cache given or enabled) since the partners may move their connectors.
+        ## The unreachable partners are also cached for a shorter time
+        if discovery_cache is not None:
+            self.discovery_cache = discovery_cache
+        elif discovery_cache_enabled:
+            self.discovery_cache = TtlCache(ttl=300, negative_ttl=30)
+        else:
+            self.discovery_cache = None
+        self._discoveries = SingleFlight()
         
     @property
     def connector_discovery(self):
         return self._connector_discovery_controller
+
+    @property
+    def async_connector_discovery(self):
+        return self.async_controllers.get(ControllerType.CONNECTOR_DISCOVERY)
     
     def _resolve_counter_party_info(self, counter_party_id: str = None, counter_party_address: str = None, 
                                    bpnl: str = None, protocol: str = DSP_2025, namespace: str = EDC_NAMESPACE) -> tuple[str, str, str]:
@@ -241,7 +268,8 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
         return content.get("@id", None)
     
     def negotiate_and_transfer(self, counter_party_id: str, counter_party_address: str, filter_expression: list[dict],
-                               policies: list = None, max_retries: int = 6, timeout: int = 10, protocol: str = DSP_2025, catalog_context: dict = DEFAULT_CONTEXT, negotiation_context: dict = DEFAULT_NEGOTIATION_CONTEXT) -> dict:
+                               policies: list = None, max_retries: int = None, timeout: int = None, protocol: str = DSP_2025, catalog_context: dict = DEFAULT_CONTEXT, negotiation_context: dict = DEFAULT_NEGOTIATION_CONTEXT,
+                               polling_strategy: PollingStrategy = None) -> dict:
         """
         This method checks if there is a transfer process ID available, or if it needs to be negotiated.
 
@@ -249,6 +277,9 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
         @param counter_party_address: The URL of the EDC provider.
         @param policies: The policies to be used for the transfer. Defaults to None.
         @param dct_type: The DCT type to be used for the transfer. Defaults to "IndustryFlagService".
+        @param max_retries: If given (or the timeout), the EDR entry is polled this amount of times every timeout seconds.
+        @param timeout: If given (or the max_retries), the seconds waited between the polls of the EDR entry.
+        @param polling_strategy: The strategy for polling the EDR entry. Defaults to the one of the service.
         @returns: edr_entry:dict, if fails Exception
         """
         ##### 1. Get Catalog
@@ -290,23 +321,18 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
                 break
 
         if (negotiation_id is None):
+            ## The offers of a cached catalog may be outdated
+            self.invalidate_catalogs(counter_party_id=counter_party_id, counter_party_address=counter_party_address)
             raise RuntimeError(
                 f"Connector Service [{counter_party_address}] It was not possible to start the EDR Negotiation! The negotiation id is empty!")
 
         ##### 3. Get EDC Entry (details)
 
-        retries: int = 0
-        edr_entry: dict | None = None
-        while edr_entry is None and retries < max_retries:
-            edr_entry = self.get_edr_entry(negotiation_id=negotiation_id)
-            if edr_entry is not None:  ## If edr is found skip retry
-                break
-            ## Wait until the timeout has reached to retry again
-            if self.logger:
-                self.logger.info(
-                    f"Connector Service Attempt [{retries + 1}]/[{max_retries}]: [{counter_party_address}] The EDR Negotiation [{negotiation_id}] entry was not found! Waiting {timeout} seconds and retrying...")
-            op.wait(seconds=timeout)
-            retries += 1
+        edr_entry: dict | None = self.wait_for_edr_entry(negotiation_id=negotiation_id,
+                                                         counter_party_address=counter_party_address,
+                                                         polling_strategy=self._get_polling_strategy(
+                                                             polling_strategy=polling_strategy,
+                                                             max_retries=max_retries, timeout=timeout))
 
         if edr_entry is None:
             raise TimeoutError(
@@ -334,8 +360,8 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
         """
 
         ## Hash the policies to get checksum. 
-        current_policies_checksum = hashlib.sha3_256(str(policies).encode('utf-8')).hexdigest()
-        filter_expression_checksum = hashlib.sha3_256(str(filter_expression).encode('utf-8')).hexdigest()
+        filter_expression_checksum, current_policies_checksum = self.get_connection_checksums(
+            filter_expression=filter_expression, policies=policies)
         ## If the countrer party id is already available and also the dct type is in the counter_party_id and the transfer key is also present
         transfer_process_id: str = self.connection_manager.get_connection_transfer_id(counter_party_id=counter_party_id,
                                                                                       counter_party_address=counter_party_address,
@@ -349,34 +375,77 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
                     counter_party_address, transfer_process_id, counter_party_id, filter_expression)
             return transfer_process_id
 
-        if self.logger:
-            self.logger.info(
-                "Connector Service The EDR was not found in the cache for counter_party_address=[%s], counter_party_id=[%s], filter=[%s] and selected policies, starting new contract negotiation!",
-                counter_party_address, counter_party_id, filter_expression)
-
-        ## If not the contract negotiation MUST be done!
-        edr_entry: dict = self.negotiate_and_transfer(counter_party_id=counter_party_id,
-                                                      counter_party_address=counter_party_address, policies=policies,
-                                                      filter_expression=filter_expression,
-                                                      protocol=protocol,
-                                                      catalog_context=catalog_context,
-                                                      negotiation_context=negotiation_context)
-
-        ## Check if the edr entry is not none
-        if (edr_entry is None):
-            raise RuntimeError("Connector Service Failed to get edr entry! Response was none!")
-
-        if self.logger:
-            self.logger.info(f"Connector Service The EDR Entry was found! Transfer Process ID: [{transfer_process_id}]")
-
-        ## Check if the transfer id is available and return the transfer process id
-        return self.connection_manager.add_connection(counter_party_id=counter_party_id,
-                                                      counter_party_address=counter_party_address,
-                                                      query_checksum=filter_expression_checksum,
-                                                      policy_checksum=current_policies_checksum,
-                                                      connection_entry=edr_entry)
+        ## If not the contract negotiation MUST be done, only once for all the concurrent requests of the same connection!
+        return self._negotiate_transfer_id(
+            counter_party_id=counter_party_id,
+            counter_party_address=counter_party_address,
+            filter_expression=filter_expression,
+            query_checksum=filter_expression_checksum,
+            policy_checksum=current_policies_checksum,
+            negotiate=lambda: self.negotiate_and_transfer(counter_party_id=counter_party_id,
+                                                          counter_party_address=counter_party_address, policies=policies,
+                                                          filter_expression=filter_expression,
+                                                          protocol=protocol,
+                                                          catalog_context=catalog_context,
+                                                          negotiation_context=negotiation_context)
+        )
         
     def discover_connector_protocol(self, bpnl: str, counter_party_address: str = None) -> dict | None:
+        """
+        Discovers the connector protocol parameters of a BPNL, served from the discovery cache when available.
+        Concurrent discoveries of the same BPNL share a single request.
+        """
+        if self.discovery_cache is None:
+            return self._request_connector_protocol(bpnl=bpnl, counter_party_address=counter_party_address)
+
+        key = (bpnl, counter_party_address)
+        found, discovery_info = self.discovery_cache.lookup(key)
+        if found:
+            return discovery_info
+        return self._discoveries.do(key, self._discover_and_cache, key)
+
+    def _discover_and_cache(self, key: tuple[str, str]) -> dict:
+        bpnl, counter_party_address = key
+        try:
+            discovery_info = self._request_connector_protocol(bpnl=bpnl, counter_party_address=counter_party_address)
+        except ConnectionError as e:
+            self.discovery_cache.set_error(key, e)
+            raise
+        ## An empty answer is kept only as long as a failure, the partner may register its connector soon
+        if not discovery_info:
+            self.discovery_cache.set(key, discovery_info, ttl=self.discovery_cache.negative_ttl)
+        else:
+            self.discovery_cache.set(key, discovery_info)
+        return discovery_info
+
+    def prewarm_discovery(self, bpnls: list[str], counter_party_address: str = None, max_concurrency: int = None,
+                          deadline: float = None) -> dict[str, bool]:
+        """
+        Discovers the connectors of several BPNLs in parallel, filling the discovery cache before they are used.
+
+        @param bpnls: The BPNLs to discover.
+        @param counter_party_address: Optional URL of the EDC provider, shared by all the BPNLs.
+        @param max_concurrency: Maximum amount of discoveries at the same time. Defaults to catalog_max_concurrency.
+        @param deadline: Maximum seconds to wait for all the discoveries.
+        @returns: dict with True for the BPNLs discovered and False for the failed or late ones.
+        """
+        results: dict[str, bool] = {bpnl: False for bpnl in bpnls}
+        concurrency = max_concurrency if max_concurrency is not None else self.catalog_max_concurrency
+        for bpnl, future in BoundedExecutor.as_completed(
+                function=lambda item: self.discover_connector_protocol(bpnl=item, counter_party_address=counter_party_address),
+                items=list(results), max_concurrency=concurrency, deadline=deadline):
+            results[bpnl] = future.exception() is None
+        return results
+
+    def invalidate_discovery(self, bpnl: str = None, counter_party_address: str = None) -> None:
+        """
+        Removes the cached discovery of a BPNL (and address), or all of them if no BPNL is given.
+        """
+        if self.discovery_cache is None:
+            return
+        self.discovery_cache.invalidate(None if bpnl is None else (bpnl, counter_party_address))
+
+    def _request_connector_protocol(self, bpnl: str, counter_party_address: str = None) -> dict | None:
 
         response: Response = self.connector_discovery.get_discover(
             ModelFactory.get_connector_discovery_model(dataspace_version=self.dataspace_version,
@@ -473,9 +542,11 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
 
     def get_catalogs_by_dct_type(self, counter_party_id: str, edcs: list, dct_type: str,
                                  dct_type_key: str = DEFAULT_DCT_TYPE_KEY, timeout: int = None,
-                                 protocol: str = DSP_2025, context=DEFAULT_CONTEXT):
+                                 protocol: str = DSP_2025, context=DEFAULT_CONTEXT,
+                                 max_concurrency: int = None, deadline: float = None):
         filter_expr = [self.get_filter_expression(key=dct_type_key, value=dct_type, operator="=")]
-        return self.get_catalogs_with_filter(counter_party_id=counter_party_id, edcs=edcs, filter_expression=filter_expr, timeout=timeout, protocol=protocol, context=context)
+        return self.get_catalogs_with_filter(counter_party_id=counter_party_id, edcs=edcs, filter_expression=filter_expr, timeout=timeout, protocol=protocol, context=context,
+                                             max_concurrency=max_concurrency, deadline=deadline)
 
     def get_catalogs_by_dct_type_with_bpnl(self, bpnl: str, edcs: list, dct_type: str,
                                            dct_type_key: str = DEFAULT_DCT_TYPE_KEY, timeout: int = None,
@@ -485,12 +556,17 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
                                                       timeout=timeout, namespace=namespace, context=context)
 
     def get_catalogs_with_filter(self, counter_party_id: str, edcs: list, filter_expression: list[dict],
-                                 timeout: int = None, protocol: str = DSP_2025, context=DEFAULT_CONTEXT):
-        import threading
-        catalogs: dict = {}
-        threads: list[threading.Thread] = []
-
-        def fetch_catalog(counter_party_id, counter_party_address, filter_expression, timeout, catalogs, protocol, context):
+                                 timeout: int = None, protocol: str = DSP_2025, context=DEFAULT_CONTEXT,
+                                 max_concurrency: int = None, deadline: float = None) -> dict:
+        return dict(self.iter_catalogs_with_filter(counter_party_id=counter_party_id, edcs=edcs,
+                                                   filter_expression=filter_expression, timeout=timeout,
+                                                   protocol=protocol, context=context,
+                                                   max_concurrency=max_concurrency, deadline=deadline))
+
+    def iter_catalogs_with_filter(self, counter_party_id: str, edcs: list, filter_expression: list[dict],
+                                  timeout: int = None, protocol: str = DSP_2025, context=DEFAULT_CONTEXT,
+                                  max_concurrency: int = None, deadline: float = None) -> Iterator[tuple[str, dict]]:
+        def fetch_catalog(counter_party_address):
             catalog_request = self.get_catalog_request_with_filter(
                 counter_party_id=counter_party_id,
                 counter_party_address=counter_party_address,
@@ -498,25 +574,10 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
                 protocol=protocol,
                 context=context
             )
-            catalogs[counter_party_address] = self.get_catalog(request=catalog_request, timeout=timeout)
-
-        for edc_url in edcs:
-            thread = threading.Thread(target=fetch_catalog, kwargs={
-                'counter_party_id': counter_party_id,
-                'counter_party_address': edc_url,
-                'filter_expression': filter_expression,
-                'timeout': timeout,
-                'catalogs': catalogs,
-                'protocol': protocol,
-                'context': context
-            })
-            thread.start()
-            threads.append(thread)
-
-        for thread in threads:
-            thread.join()
+            return self.get_catalog(request=catalog_request, timeout=timeout)
 
-        return catalogs
+        return self._iter_catalogs(edcs=edcs, fetch_catalog=fetch_catalog,
+                                   max_concurrency=max_concurrency, deadline=deadline)
 
     def get_catalogs_with_filter_with_bpnl(self, bpnl: str, edcs: list, filter_expression: list[dict],
                                            timeout: int = None, namespace: str = EDC_NAMESPACE, context=DEFAULT_CONTEXT):
@@ -571,31 +632,35 @@ class ConnectorConsumerService(BaseConnectorConsumerService):
     
     def get_catalogs_by_dct_type_with_bpnl_parallel(self, bpnl: str, edcs: list, dct_type: str,
                                                     dct_type_key: str = DEFAULT_DCT_TYPE_KEY, timeout: int = None,
-                                                    namespace: str = EDC_NAMESPACE, context=DEFAULT_CONTEXT):
+                                                    namespace: str = EDC_NAMESPACE, context=DEFAULT_CONTEXT,
+                                                    max_concurrency: int = None, deadline: float = None):
         filter_expr = [self.get_filter_expression(key=dct_type_key, value=dct_type, operator="=")]
         return self.get_catalogs_with_filter_with_bpnl_parallel(bpnl=bpnl, edcs=edcs, filter_expression=filter_expr,
-                                                               timeout=timeout, namespace=namespace, context=context)
+                                                               timeout=timeout, namespace=namespace, context=context,
+                                                               max_concurrency=max_concurrency, deadline=deadline)
 
     def get_catalogs_with_filter_with_bpnl_parallel(self, bpnl: str, edcs: list, filter_expression: list[dict],
-                                                   timeout: int = None, namespace: str = EDC_NAMESPACE, context=DEFAULT_CONTEXT):
-        import threading
-        catalogs = {}
-        threads = []
-
-        def fetch_catalog(edc_url):
-            catalogs[edc_url] = self._get_catalog_internal(bpnl=bpnl, counter_party_address=edc_url,
-                                                         filter_expression=filter_expression, timeout=timeout,
-                                                         context=context, namespace=namespace)
-
-        for edc_url in edcs:
-            thread = threading.Thread(target=fetch_catalog, args=(edc_url,))
-            thread.start()
-            threads.append(thread)
-
-        for thread in threads:
-            thread.join()
-
-        return catalogs
+                                                   timeout: int = None, namespace: str = EDC_NAMESPACE, context=DEFAULT_CONTEXT,
+                                                   max_concurrency: int = None, deadline: float = None) -> dict:
+        return dict(self.iter_catalogs_with_filter_with_bpnl(bpnl=bpnl, edcs=edcs, filter_expression=filter_expression,
+                                                             timeout=timeout, namespace=namespace, context=context,
+                                                             max_concurrency=max_concurrency, deadline=deadline))
+
+    def iter_catalogs_with_filter_with_bpnl(self, bpnl: str, edcs: list, filter_expression: list[dict],
+                                            timeout: int = None, namespace: str = EDC_NAMESPACE, context=DEFAULT_CONTEXT,
+                                            max_concurrency: int = None, deadline: float = None) -> Iterator[tuple[str, dict]]:
+        """
+        Requests the catalogs of several EDCs of a BPNL in the shared bounded worker pool,
+        yielding (edc_url, catalog) as soon as each catalog is received.
+        """
+        return self._iter_catalogs(
+            edcs=edcs,
+            fetch_catalog=lambda edc_url: self._get_catalog_internal(bpnl=bpnl, counter_party_address=edc_url,
+                                                                     filter_expression=filter_expression, timeout=timeout,
+                                                                     context=context, namespace=namespace),
+            max_concurrency=max_concurrency,
+            deadline=deadline
+        )
     
     def do_dsp_with_bpnl(self, bpnl: str, counter_party_address: str = None, filter_expression: list[dict] = None,
                         policies: list = None,
@@ -21,12 +21,15 @@
 #################################################################################
 
 import time
+import random
 import logging
+import threading
 from typing import Optional
 from abc import ABC, abstractmethod
 
 from tractusx_sdk.dataspace.managers.oauth2_manager import OAuth2Manager
 from tractusx_sdk.dataspace.services.discovery import DiscoveryFinderService
+from tractusx_sdk.dataspace.tools.single_flight import SingleFlight
 
 
 class BaseDiscoveryService(ABC):
@@ -35,13 +38,16 @@ class BaseDiscoveryService(ABC):
     
     This abstract base class provides:
     - Time-based caching with configurable timeouts
+    - Single-flight refreshes, concurrent requests of an expired URL share one discovery finder request
+    - Refresh ahead, URLs close to their expiration are refreshed in the background while the cached one is served
     - Enhanced logging with cache status and validity information
     - Safety mechanisms preserving cached URLs during failures
     - Cache management methods (flush, invalidate, status)
     """
 
     def __init__(self, oauth: OAuth2Manager, discovery_finder_service: DiscoveryFinderService, cache_timeout_seconds: int = 60 * 60 * 12,
-                 verbose: bool = False, logger: Optional[logging.Logger] = None):
+                 verbose: bool = False, logger: Optional[logging.Logger] = None, refresh_ahead_ratio: float = 0.1,
+                 background_refresh: bool = True):
         """
         Initialize the base discovery service.
         
@@ -52,13 +58,21 @@ class BaseDiscoveryService(ABC):
             cache_timeout_seconds (int): Cache timeout in seconds (default: 12 hours).
             verbose (bool): Enable verbose logging (default: False).
             logger (Optional[logging.Logger]): Logger instance for logging (default: None).
+            refresh_ahead_ratio (float): Last fraction of the cache timeout in which the URLs are refreshed ahead (default: 0.1).
+                The chance of a request triggering the refresh grows from 0 to 1 along it, spreading the refreshes of the replicas.
+            background_refresh (bool): Whether the URLs are refreshed ahead in a background thread (default: True).
         """
         self.oauth = oauth
         self.discovery_finder_service = discovery_finder_service
         self.cache_timeout_seconds = cache_timeout_seconds
         self.verbose = verbose
         self.logger = logger
+        self.refresh_ahead_ratio = refresh_ahead_ratio
+        self.background_refresh = background_refresh
+        ## The entries are replaced, never modified, so they can be read without the lock
         self.discovery_cache = {}
+        self._cache_lock = threading.Lock()
+        self._refreshes = SingleFlight()
 
     @abstractmethod
     def get_service_name(self) -> str:
@@ -85,7 +99,10 @@ class BaseDiscoveryService(ABC):
     def _get_or_update_discovery_url(self, discovery_key: str) -> str:
         """
         Retrieves a cached discovery URL or updates the cache if expired.
-        
+
+        Concurrent requests of a missing or expired URL wait for a single discovery finder request.
+        Valid URLs are always served from the cache, the ones close to their expiration are refreshed in the background.
+
         Safety mechanism: If the refresh attempt fails, the cached URL is preserved
         to maintain service availability during temporary connectivity issues.
 
@@ -100,53 +117,93 @@ class BaseDiscoveryService(ABC):
         """
         current_time = time.time()
         entry: dict = self.discovery_cache.get(discovery_key)
-        
+
         # Check if the entry exists and if it is still valid
         if (
             not entry or
             (current_time - entry.get("timestamp", 0)) > self.cache_timeout_seconds
         ):
-            try:
-                url = self.get_discovery_url(
-                    discovery_finder_service=self.discovery_finder_service,
-                    discovery_key=discovery_key
-                )
-                if url:
-                    # Update cache only if successful
-                    self.discovery_cache[discovery_key] = {
-                        "url": url,
-                        "timestamp": current_time
-                    }
-                    if self.verbose and self.logger:
-                        import datetime
-                        cache_count = len(self.discovery_cache)
-                        valid_until = datetime.datetime.fromtimestamp(current_time + self.cache_timeout_seconds)
-                        service_name = self.get_service_name()
-                        self.logger.info(f"[{service_name}] Updated cache with new discovery URL for key '{discovery_key}': {url}")
-                        self.logger.info(f"[{service_name}] Cache status: {cache_count} URL(s) cached, valid until {valid_until.strftime('%Y-%m-%d %H:%M:%S')}")
-                    
-            except Exception as e:
-                # If we have a cached entry, preserve it and continue using it
-                if entry:
-                    # Log the error but continue with cached URL
-                    if self.verbose and self.logger:
-                        service_name = self.get_service_name()
-                        self.logger.warning(f"[{service_name}] Failed to refresh discovery URL, using cached version. Error: {str(e)}")
-                    return entry["url"]
-                else:
-                    # No cached entry available, re-raise the exception
-                    raise e
-        else:
-            # Using valid cached URL
-            if self.verbose and self.logger and entry:
-                import datetime
-                cache_count = len(self.discovery_cache)
-                valid_until = datetime.datetime.fromtimestamp(entry["timestamp"] + self.cache_timeout_seconds)
-                service_name = self.get_service_name()
-                self.logger.debug(f"[{service_name}] Using cached discovery URL for key '{discovery_key}': {entry['url']}")
-                self.logger.debug(f"[{service_name}] Cache status: {cache_count} URL(s) cached, this entry valid until {valid_until.strftime('%Y-%m-%d %H:%M:%S')}")
-            
-        return self.discovery_cache[discovery_key]["url"]
+            return self._refreshes.do(discovery_key, self._refresh_discovery_url, discovery_key)
+
+        if self._should_refresh_ahead(entry, current_time):
+            self._start_background_refresh(discovery_key)
+
+        # Using valid cached URL
+        if self.verbose and self.logger:
+            import datetime
+            cache_count = len(self.discovery_cache)
+            valid_until = datetime.datetime.fromtimestamp(entry["timestamp"] + self.cache_timeout_seconds)
+            service_name = self.get_service_name()
+            self.logger.debug(f"[{service_name}] Using cached discovery URL for key '{discovery_key}': {entry['url']}")
+            self.logger.debug(f"[{service_name}] Cache status: {cache_count} URL(s) cached, this entry valid until {valid_until.strftime('%Y-%m-%d %H:%M:%S')}")
+
+        return entry["url"]
+
+    def _should_refresh_ahead(self, entry: dict, current_time: float) -> bool:
+        """
+        Decides if a valid entry is refreshed ahead, with a chance growing linearly along the refresh ahead window.
+        """
+        if not self.background_refresh or self.refresh_ahead_ratio <= 0:
+            return False
+        window = self.cache_timeout_seconds * self.refresh_ahead_ratio
+        remaining = entry.get("timestamp", 0) + self.cache_timeout_seconds - current_time
+        if remaining > window:
+            return False
+        return random.random() >= remaining / window
+
+    def _start_background_refresh(self, discovery_key: str) -> None:
+        if self._refreshes.in_flight(discovery_key):
+            return
+        threading.Thread(target=self._background_refresh, args=(discovery_key,), daemon=True).start()
+
+    def _background_refresh(self, discovery_key: str) -> None:
+        try:
+            self._refreshes.do(discovery_key, self._refresh_discovery_url, discovery_key)
+        except Exception as e:
+            if self.verbose and self.logger:
+                self.logger.warning(f"[{self.get_service_name()}] Background refresh of the discovery URL for key '{discovery_key}' failed. Error: {str(e)}")
+
+    def _refresh_discovery_url(self, discovery_key: str) -> str:
+        """
+        Requests the discovery URL and caches it, falling back to the cached URL if the request fails.
+        """
+        entry: dict = self.discovery_cache.get(discovery_key)
+        try:
+            url = self.get_discovery_url(
+                discovery_finder_service=self.discovery_finder_service,
+                discovery_key=discovery_key
+            )
+        except Exception as e:
+            # If we have a cached entry, preserve it and continue using it
+            if entry:
+                # Log the error but continue with cached URL
+                if self.verbose and self.logger:
+                    service_name = self.get_service_name()
+                    self.logger.warning(f"[{service_name}] Failed to refresh discovery URL, using cached version. Error: {str(e)}")
+                return entry["url"]
+            # No cached entry available, re-raise the exception
+            raise e
+
+        if not url:
+            if entry:
+                return entry["url"]
+            raise Exception(f"[{self.get_service_name()}] No discovery URL was found for key '{discovery_key}'!")
+
+        # Update cache only if successful
+        current_time = time.time()
+        with self._cache_lock:
+            self.discovery_cache[discovery_key] = {
+                "url": url,
+                "timestamp": current_time
+            }
+        if self.verbose and self.logger:
+            import datetime
+            cache_count = len(self.discovery_cache)
+            valid_until = datetime.datetime.fromtimestamp(current_time + self.cache_timeout_seconds)
+            service_name = self.get_service_name()
+            self.logger.info(f"[{service_name}] Updated cache with new discovery URL for key '{discovery_key}': {url}")
+            self.logger.info(f"[{service_name}] Cache status: {cache_count} URL(s) cached, valid until {valid_until.strftime('%Y-%m-%d %H:%M:%S')}")
+        return url
 
     def flush_cache(self) -> int:
         """
@@ -155,8 +212,9 @@ class BaseDiscoveryService(ABC):
         Returns:
             int: Number of cache entries that were removed.
         """
-        cache_count = len(self.discovery_cache)
-        self.discovery_cache.clear()
+        with self._cache_lock:
+            cache_count = len(self.discovery_cache)
+            self.discovery_cache.clear()
         
         if self.verbose and self.logger:
             service_name = self.get_service_name()
@@ -174,10 +232,10 @@ class BaseDiscoveryService(ABC):
         Returns:
             bool: True if the entry was found and removed, False if it didn't exist.
         """
-        entry_existed = discovery_key in self.discovery_cache
-        
+        with self._cache_lock:
+            entry_existed = self.discovery_cache.pop(discovery_key, None) is not None
+
         if entry_existed:
-            del self.discovery_cache[discovery_key]
             if self.verbose and self.logger:
                 service_name = self.get_service_name()
                 self.logger.info(f"[{service_name}] Cache entry invalidated for key '{discovery_key}'")
@@ -201,7 +259,9 @@ class BaseDiscoveryService(ABC):
         current_time = time.time()
         
         entries = []
-        for key, entry in self.discovery_cache.items():
+        with self._cache_lock:
+            cached_entries = list(self.discovery_cache.items())
+        for key, entry in cached_entries:
             expires_at = entry["timestamp"] + self.cache_timeout_seconds
             is_expired = current_time > expires_at
             
@@ -215,7 +275,7 @@ class BaseDiscoveryService(ABC):
             })
         
         return {
-            "total_entries": len(self.discovery_cache),
+            "total_entries": len(cached_entries),
             "cache_timeout_seconds": self.cache_timeout_seconds,
             "entries": entries
         }
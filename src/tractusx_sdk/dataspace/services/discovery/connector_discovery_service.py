@@ -23,6 +23,7 @@ import logging
 from typing import Optional
 
 from ...tools.http_tools import HttpTools
+from ...tools import BoundedExecutor, TtlCache
 from ...managers import OAuth2Manager
 from .base_discovery_service import BaseDiscoveryService
 from .discovery_finder_service import DiscoveryFinderService
@@ -33,7 +34,8 @@ class ConnectorDiscoveryService(BaseDiscoveryService):
     oauth:OAuth2Manager
     
     def __init__(self, oauth:OAuth2Manager, discovery_finder_service:DiscoveryFinderService, connector_discovery_key:str="bpn", 
-                 cache_timeout_seconds:int = 60 * 60 * 12, verbose:bool=False, logger:Optional[logging.Logger]=None):
+                 cache_timeout_seconds:int = 60 * 60 * 12, verbose:bool=False, logger:Optional[logging.Logger]=None,
+                 connector_cache:TtlCache=None, connector_cache_enabled:bool=False, batch_size:int=100, max_concurrency:int=8):
         """
         Initialize the Connector Discovery Service with caching functionality.
         
@@ -43,6 +45,11 @@ class ConnectorDiscoveryService(BaseDiscoveryService):
             cache_timeout_seconds (int): Cache timeout in seconds (default: 12 hours).
             verbose (bool): Enable verbose logging (default: False).
             logger (Optional[logging.Logger]): Logger instance for logging (default: None).
+            connector_cache (TtlCache): Cache of the connector endpoints by BPN, enables the caching when given.
+            connector_cache_enabled (bool): Whether the connector endpoints are cached when no cache is given,
+                for 5 minutes and 30 seconds for unknown BPNs (default: False).
+            batch_size (int): Maximum number of BPNs sent in one connector discovery request (default: 100).
+            max_concurrency (int): Maximum number of connector discovery requests sent at the same time (default: 8).
         """
         self.oauth=oauth
         super().__init__(
@@ -53,6 +60,20 @@ class ConnectorDiscoveryService(BaseDiscoveryService):
             logger=logger
         )
         self.connector_discovery_key = connector_discovery_key
+        ## The finders without registration (like test doubles) resolve the key on its own
+        register_discovery_keys = getattr(discovery_finder_service, "register_discovery_keys", None)
+        if register_discovery_keys is not None:
+            register_discovery_keys([connector_discovery_key])
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        ## (bpn, bpn_key, connector_endpoint_key) -> connector endpoints, the unknown BPNs are cached as None for a shorter time.
+        ## Opt-in (a cache given or enabled), since the partners may move their connectors
+        if connector_cache is not None:
+            self.connector_cache = connector_cache
+        elif connector_cache_enabled:
+            self.connector_cache = TtlCache(ttl=300, negative_ttl=30)
+        else:
+            self.connector_cache = None
 
     def get_service_name(self) -> str:
         """Returns the service name for logging purposes."""
@@ -72,7 +93,7 @@ class ConnectorDiscoveryService(BaseDiscoveryService):
         Raises:
             Exception: If no discovery endpoint is found for the given key.
         """
-        endpoints = discovery_finder_service.find_discovery_urls(keys=[discovery_key])
+        endpoints = discovery_finder_service.get_discovery_urls(keys=[discovery_key])
         if(discovery_key not in endpoints):
           raise Exception("[Connector Discovery Service] Connector Discovery endpoint not found!")
         
@@ -131,24 +152,86 @@ class ConnectorDiscoveryService(BaseDiscoveryService):
         Raises:
             Exception: If the connector discovery service request fails.
         """
-        # Use cached discovery URL, refresh if necessary
-        discovery_url = self._get_or_update_discovery_url()
+        return self.find_connectors_by_bpns(bpns=[bpn], bpn_key=bpn_key, connector_endpoint_key=connector_endpoint_key)[bpn]
 
-        body:list = [
-            bpn
-        ]
-        
-        headers:dict = self.oauth.add_auth_header(headers={'Content-Type' : 'application/json'})
+    def find_connectors_by_bpns(self, bpns:list[str], bpn_key:str="bpn", connector_endpoint_key:str="connectorEndpoint") -> dict[str, list | None]:
+        """
+        Finds the connector endpoints of several BPNs.
+
+        The BPNs not cached are requested in batches of batch_size, sent concurrently. The results of every
+        successful batch are cached, so retrying after an error only requests the BPNs still missing.
+
+        Args:
+            bpns (list[str]): The Business Partner Numbers to search for.
+            bpn_key (str): The key for BPN in the response (default: "bpn").
+            connector_endpoint_key (str): The key for connector endpoints in the response (default: "connectorEndpoint").
 
-        response = HttpTools.do_post(url=discovery_url, headers=headers, json=body)
+        Returns:
+            dict[str, list | None]: The connector endpoints by BPN, None for the BPNs not found.
+
+        Raises:
+            Exception: If a connector discovery service request fails.
+        """
+        bpns = list(dict.fromkeys(bpns))
+        connectors: dict[str, list | None] = {}
+        missing = bpns
+        if self.connector_cache is not None:
+            found, missing_keys = self.connector_cache.lookup_many([(bpn, bpn_key, connector_endpoint_key) for bpn in bpns])
+            connectors = {key[0]: endpoints for key, endpoints in found.items()}
+            missing = [key[0] for key in missing_keys]
+        if not missing:
+            return connectors
+
+        # Use cached discovery URL, refresh if necessary, and a single token for all the batches
+        discovery_url = self._get_or_update_discovery_url()
+        headers:dict = self.oauth.add_auth_header(headers={'Content-Type' : 'application/json'})
+        batches = [tuple(missing[i:i + self.batch_size]) for i in range(0, len(missing), self.batch_size)]
+
+        def request_batch(batch: tuple) -> dict[str, list | None]:
+            return self._request_connectors(discovery_url=discovery_url, headers=headers, bpns=list(batch),
+                                            bpn_key=bpn_key, connector_endpoint_key=connector_endpoint_key)
+
+        if len(batches) == 1:
+            connectors.update(request_batch(batches[0]))
+            return connectors
+
+        error = None
+        for _, future in BoundedExecutor.as_completed(function=request_batch, items=batches, max_concurrency=self.max_concurrency):
+            if future.exception() is not None:
+                error = error or future.exception()
+                continue
+            connectors.update(future.result())
+        if error is not None:
+            raise error
+        return connectors
+
+    def _request_connectors(self, discovery_url:str, headers:dict, bpns:list[str], bpn_key:str, connector_endpoint_key:str) -> dict[str, list | None]:
+        """
+        Requests the connector endpoints of a batch of BPNs and caches them.
+        """
+        response = HttpTools.do_post(url=discovery_url, headers=headers, json=bpns)
         if(response is None or response.status_code != 200):
             raise Exception("[Connector Discovery Service] It was not possible to get the connector urls because the connector discovery service response was not successful!")
-        
-        json_response:dict = response.json()
 
-        # Iterate over the json_response to find the connectorEndpoint for the specified BPN
+        json_response:list = response.json()
+
+        # Index the response by BPN, the first entry of a BPN wins
+        connectors: dict[str, list | None] = {bpn: None for bpn in bpns}
         for item in json_response:
-            if item.get(bpn_key) == bpn:
-                return item.get(connector_endpoint_key, [])
-        # If the BPN is not found, return None or an empty list
-        return None
\ No newline at end of file
+            bpn = item.get(bpn_key)
+            if bpn in connectors and connectors[bpn] is None:
+                connectors[bpn] = item.get(connector_endpoint_key, [])
+
+        if self.connector_cache is not None:
+            for bpn, endpoints in connectors.items():
+                self.connector_cache.set((bpn, bpn_key, connector_endpoint_key), endpoints,
+                                         ttl=None if endpoints is not None else self.connector_cache.negative_ttl)
+        return connectors
+
+    def invalidate_connectors(self, bpn:str = None, bpn_key:str="bpn", connector_endpoint_key:str="connectorEndpoint") -> None:
+        """
+        Removes the cached connector endpoints of a BPN, or of all of them if no BPN is given.
+        """
+        if self.connector_cache is None:
+            return
+        self.connector_cache.invalidate(None if bpn is None else (bpn, bpn_key, connector_endpoint_key))
@@ -20,15 +20,19 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+import threading
 from requests import Response
 
 from ...tools.http_tools import HttpTools
+from ...tools.single_flight import SingleFlight
+from ...tools.ttl_cache import TtlCache
 from ...managers import OAuth2Manager
 
 class DiscoveryFinderService:
     
     def __init__(self, url:str, oauth:OAuth2Manager, types_key:str="types", endpoints_key:str="endpoints", 
-                 endpoint_address_key:str="endpointAddress", return_type_key:str='type'):
+                 endpoint_address_key:str="endpointAddress", return_type_key:str='type', discovery_keys:list=None,
+                 cache_ttl:float=300, unknown_cache_ttl:float=60, url_cache:TtlCache=None):
         """
         Initialize the Discovery Finder Service with URL, OAuth, and configurable response keys.
         
@@ -39,6 +43,11 @@ class DiscoveryFinderService:
             endpoints_key (str): Key for endpoints in discovery response (default: "endpoints").
             endpoint_address_key (str): Key for endpoint address in discovery response (default: "endpointAddress").
             return_type_key (str): Key for return type in discovery response (default: "type").
+            discovery_keys (list): Discovery types resolved together by get_discovery_urls, the discovery services
+                using this finder register their own types as well (default: None).
+            cache_ttl (float): Seconds the URLs resolved by get_discovery_urls are cached (default: 5 minutes).
+            unknown_cache_ttl (float): Seconds the discovery types unknown to the finder are cached (default: 1 minute).
+            url_cache (TtlCache): Cache of the URLs by discovery type, can be shared between finders (default: None).
         """
         self.url = url
         self.oauth = oauth
@@ -46,6 +55,92 @@ class DiscoveryFinderService:
         self.endpoints_key = endpoints_key
         self.endpoint_address_key = endpoint_address_key
         self.return_type_key = return_type_key
+        ## Unknown discovery types are cached as None for the negative ttl
+        self.url_cache = url_cache if url_cache is not None else TtlCache(ttl=cache_ttl, negative_ttl=unknown_cache_ttl)
+        ## Discovery types resolved in every request, kept in registration order
+        self._discovery_keys = dict.fromkeys(discovery_keys or [])
+        self._keys_lock = threading.Lock()
+        self._prefetches = SingleFlight()
+
+    @property
+    def discovery_keys(self) -> list:
+        with self._keys_lock:
+            return list(self._discovery_keys)
+
+    def register_discovery_keys(self, keys:list) -> None:
+        """
+        Adds discovery types to the ones resolved together by get_discovery_urls and prefetch.
+
+        Args:
+            keys (list): The discovery types to register.
+        """
+        with self._keys_lock:
+            for key in keys:
+                self._discovery_keys.setdefault(key, None)
+
+    def get_discovery_urls(self, keys:list) -> dict:
+        """
+        Returns the discovery service urls of the keys, served from the finder cache.
+
+        If any key is missing, all the registered discovery types are resolved in a single request, so that the
+        discovery services sharing this finder do not request their types one by one. Concurrent misses share the request.
+        The types unknown to the finder are cached as well, so that they are not requested again on every call.
+
+        Args:
+            keys (list): List of keys to search for.
+
+        Returns:
+            dict: Dictionary mapping the discovery types found to their endpoint URLs.
+        """
+        self.register_discovery_keys(keys)
+        urls, missing = self.url_cache.lookup_many(keys)
+        if missing:
+            requested, fetched = self._prefetches.do("discovery_urls", self._prefetch)
+            ## Only the keys registered after the request in flight was sent need a request of their own
+            not_requested = [key for key in missing if key not in requested]
+            if not_requested:
+                _, fetched_later = self._prefetch(keys=not_requested)
+                fetched = {**fetched, **fetched_later}
+            urls.update({key: fetched[key] for key in missing if key in fetched})
+        return {key: url for key, url in urls.items() if url is not None}
+
+    def prefetch(self, keys:list=None) -> dict:
+        """
+        Resolves the registered discovery types (and the given keys) in a single request and caches them,
+        i.e. at startup, before the discovery services are used.
+
+        Args:
+            keys (list): Additional keys to resolve (default: None).
+
+        Returns:
+            dict: Dictionary mapping discovery types to their endpoint URLs.
+        """
+        _, urls = self._prefetch(keys=keys)
+        return urls
+
+    def _prefetch(self, keys:list=None) -> tuple[set, dict]:
+        """
+        Requests the registered discovery types, caching the types missing in the response as unknown.
+
+        Returns:
+            tuple: The requested discovery types and the URLs found by discovery type.
+        """
+        if keys:
+            self.register_discovery_keys(keys)
+        requested = self.discovery_keys or ["bpn"]
+        urls = self.find_discovery_urls(keys=requested)
+        for key, url in urls.items():
+            self.url_cache.set(key, url)
+        for key in requested:
+            if key not in urls:
+                self.url_cache.set(key, None, ttl=self.url_cache.negative_ttl)
+        return set(requested), urls
+
+    def invalidate_discovery_urls(self, key:str=None) -> None:
+        """
+        Removes the cached url of a discovery type, or of all of them if no key is given.
+        """
+        self.url_cache.invalidate(key)
 
     def find_discovery_urls(self, keys:list=["bpn"]) -> dict:
         """
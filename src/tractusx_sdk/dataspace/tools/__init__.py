@@ -28,7 +28,12 @@ __license__ = "Apache License, Version 2.0"
 ## Software Development KIT specific tools
 
 from .http_tools import HttpTools
+from .http_session_manager import HttpSessionManager
+from .async_http_tools import AsyncHttpTools
 from .dsp_tools import DspTools
 from .operators import op
+from .single_flight import SingleFlight
+from .bounded_executor import BoundedExecutor
+from .ttl_cache import TtlCache
 from .encoding_tools import encode_as_base64_url_safe, decode_base64_url_safe
 from .utils import get_arguments, get_app_config, get_log_config
@@ -0,0 +1,159 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+## Asynchronous counterpart of the HttpTools, based on a shared pooled httpx client
+
+import asyncio
+import threading
+import httpx
+
+
+class AsyncHttpTools:
+    """
+    Awaitable HTTP helpers sharing one pooled httpx.AsyncClient per event loop and SSL verification mode.
+
+    The clients are created lazily on first use and keep the connections alive between requests,
+    so that many concurrent calls to the same connectors reuse the same TCP+TLS connections.
+    An httpx client can only be used in the event loop it was created in, so every running loop gets
+    its own clients. Clients of loops which were closed are dropped, call aclose() on shutdown.
+    """
+
+    max_connections: int = 200
+    max_keepalive_connections: int = 50
+    keepalive_expiry: float = 30.0
+
+    _clients: dict[tuple[int, bool], tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def configure(max_connections: int = 200, max_keepalive_connections: int = 50, keepalive_expiry: float = 30.0):
+        """
+        Configures the connection pool limits of the shared clients.
+        Clients which are already open keep their limits until aclose() is called.
+
+        :param max_connections: Maximum amount of concurrent connections per client.
+        :param max_keepalive_connections: Maximum amount of idle connections kept alive per client.
+        :param keepalive_expiry: Seconds an idle connection is kept alive.
+        """
+        AsyncHttpTools.max_connections = max_connections
+        AsyncHttpTools.max_keepalive_connections = max_keepalive_connections
+        AsyncHttpTools.keepalive_expiry = keepalive_expiry
+
+    @staticmethod
+    def get_client(verify: bool = True) -> httpx.AsyncClient:
+        """
+        Returns the shared client of the running event loop for the given SSL verification mode,
+        creating it if needed. Must be called from within a running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), verify)
+        entry = AsyncHttpTools._clients.get(key)
+        ## The loop is compared too, since the id of a closed loop can be reused by a new one
+        if entry is not None and entry[0] is loop and not entry[1].is_closed:
+            return entry[1]
+        with AsyncHttpTools._lock:
+            AsyncHttpTools._drop_closed_loops()
+            entry = AsyncHttpTools._clients.get(key)
+            if entry is not None and entry[0] is loop and not entry[1].is_closed:
+                return entry[1]
+            client = httpx.AsyncClient(
+                verify=verify,
+                limits=httpx.Limits(
+                    max_connections=AsyncHttpTools.max_connections,
+                    max_keepalive_connections=AsyncHttpTools.max_keepalive_connections,
+                    keepalive_expiry=AsyncHttpTools.keepalive_expiry
+                )
+            )
+            AsyncHttpTools._clients[key] = (loop, client)
+            return client
+
+    @staticmethod
+    def _drop_closed_loops():
+        """
+        Forgets the clients of event loops which were closed, their connections can no longer be used.
+        Must be called holding the lock.
+        """
+        for key, (loop, _) in list(AsyncHttpTools._clients.items()):
+            if loop.is_closed():
+                del AsyncHttpTools._clients[key]
+
+    @staticmethod
+    async def aclose():
+        """
+        Closes the shared clients of the running event loop and their pooled connections.
+        Clients of other event loops which are still running are kept, they must be closed from their own loop.
+        """
+        loop = asyncio.get_running_loop()
+        with AsyncHttpTools._lock:
+            AsyncHttpTools._drop_closed_loops()
+            keys = [key for key, entry in AsyncHttpTools._clients.items() if entry[0] is loop]
+            clients = [AsyncHttpTools._clients.pop(key)[1] for key in keys]
+        for client in clients:
+            await client.aclose()
+
+    @staticmethod
+    def get_request_kwargs(data=None, json=None, params=None, allow_redirects=False) -> dict:
+        """
+        Translates the requests-style keyword arguments into the httpx ones.
+        """
+        kwargs = {"params": params, "follow_redirects": allow_redirects}
+        if json is not None:
+            kwargs["json"] = json
+        ## Raw payloads (like serialized models) are sent as content, dicts as form data
+        if isinstance(data, (str, bytes)):
+            kwargs["content"] = data
+        elif data is not None:
+            kwargs["data"] = data
+        return kwargs
+
+    # do async request with the shared client
+    @staticmethod
+    async def do_request(method, url, client=None, verify=True, headers=None, timeout=None, params=None, data=None, json=None, allow_redirects=False) -> httpx.Response:
+        if client is None:
+            client = AsyncHttpTools.get_client(verify=verify)
+        return await client.request(method=method, url=url, headers=headers, timeout=timeout,
+                                    **AsyncHttpTools.get_request_kwargs(data=data, json=json, params=params,
+                                                                        allow_redirects=allow_redirects))
+
+    # do async get request
+    @staticmethod
+    async def do_get(url, verify=True, headers=None, timeout=None, params=None, allow_redirects=False, client=None) -> httpx.Response:
+        return await AsyncHttpTools.do_request("GET", url=url, client=client, verify=verify, headers=headers,
+                                               timeout=timeout, params=params, allow_redirects=allow_redirects)
+
+    # do async post request
+    @staticmethod
+    async def do_post(url, data=None, verify=True, headers=None, timeout=None, json=None, allow_redirects=False, client=None) -> httpx.Response:
+        return await AsyncHttpTools.do_request("POST", url=url, client=client, verify=verify, headers=headers,
+                                               timeout=timeout, data=data, json=json, allow_redirects=allow_redirects)
+
+    # do async put request
+    @staticmethod
+    async def do_put(url, data=None, verify=True, headers=None, timeout=None, json=None, allow_redirects=False, client=None) -> httpx.Response:
+        return await AsyncHttpTools.do_request("PUT", url=url, client=client, verify=verify, headers=headers,
+                                               timeout=timeout, data=data, json=json, allow_redirects=allow_redirects)
+
+    # do async delete request
+    @staticmethod
+    async def do_delete(url, verify=True, headers=None, timeout=None, params=None, allow_redirects=False, client=None) -> httpx.Response:
+        return await AsyncHttpTools.do_request("DELETE", url=url, client=client, verify=verify, headers=headers,
+                                               timeout=timeout, params=params, allow_redirects=allow_redirects)
@@ -0,0 +1,117 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+## Process-wide worker pool for fanning out requests
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Iterable, Iterator
+
+
+class BoundedExecutor:
+    """
+    Shares one bounded thread pool between all the fan-out operations of the process (e.g. requesting the catalogs of
+    many connectors), so that the amount of threads does not grow with the amount of requests.
+
+    Every call can limit how many of its tasks run at the same time and set a deadline, and gets its results as soon
+    as each task completes.
+    """
+
+    max_workers: int = 32
+
+    _executor: ThreadPoolExecutor | None = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def configure(max_workers: int = 32):
+        """
+        Configures the size of the shared pool. The running tasks of the previous pool are finished in the background.
+
+        :param max_workers: Maximum amount of threads of the pool.
+        """
+        with BoundedExecutor._lock:
+            BoundedExecutor.max_workers = max_workers
+            executor = BoundedExecutor._executor
+            BoundedExecutor._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def get_executor() -> ThreadPoolExecutor:
+        """
+        Returns the shared pool, creating it if needed.
+        """
+        executor = BoundedExecutor._executor
+        if executor is not None:
+            return executor
+        with BoundedExecutor._lock:
+            if BoundedExecutor._executor is None:
+                BoundedExecutor._executor = ThreadPoolExecutor(max_workers=BoundedExecutor.max_workers,
+                                                               thread_name_prefix="tractusx-sdk")
+            return BoundedExecutor._executor
+
+    @staticmethod
+    def as_completed(function: Callable[[Any], Any], items: Iterable, max_concurrency: int = None,
+                     deadline: float = None) -> Iterator[tuple[Any, Future]]:
+        """
+        Runs the function for every item in the shared pool, yielding (item, future) as soon as each one completes.
+
+        The tasks which did not start before the deadline are cancelled and not yielded, the same happens when the
+        caller stops iterating. Tasks already running can not be interrupted, their results are discarded.
+        The function must not wait for other tasks of the shared pool, since it could run out of workers.
+
+        :param function: The function called with each item.
+        :param items: The items to process.
+        :param max_concurrency: Maximum amount of tasks of this call running at the same time, None for no limit.
+        :param deadline: Maximum seconds to wait for all the results, None for no deadline.
+        """
+        executor = BoundedExecutor.get_executor()
+        pending_items = iter(items)
+        in_flight: dict[Future, Any] = {}
+        expires_at = time.monotonic() + deadline if deadline is not None else None
+
+        def submit_next() -> bool:
+            for item in pending_items:
+                in_flight[executor.submit(function, item)] = item
+                return True
+            return False
+
+        try:
+            while max_concurrency is None or len(in_flight) < max_concurrency:
+                if not submit_next():
+                    break
+
+            while in_flight:
+                remaining = None
+                if expires_at is not None:
+                    remaining = expires_at - time.monotonic()
+                    if remaining <= 0:
+                        return
+                done, _ = wait(list(in_flight), timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    submit_next()
+                    yield item, future
+        finally:
+            for future in in_flight:
+                future.cancel()
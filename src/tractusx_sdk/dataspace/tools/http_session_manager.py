@@ -0,0 +1,150 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+## Process-wide pooled transport for the HttpTools
+
+import threading
+from http.cookiejar import DefaultCookiePolicy
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpSessionManager:
+    """
+    Keeps one shared requests.Session for the whole process.
+
+    The session mounts pooled HTTPAdapters, so that every host keeps its own pool of
+    alive TCP+TLS connections which are reused between calls. Idempotent requests are
+    retried on connection errors and on the configured status codes, with exponential
+    backoff and jitter. Specific hosts can get dedicated pools with their own settings.
+    """
+
+    pool_connections: int = 20
+    pool_maxsize: int = 50
+    pool_block: bool = False
+    max_retries: int = 3
+    backoff_factor: float = 0.3
+    backoff_jitter: float = 0.3
+    status_forcelist: tuple[int, ...] = (502, 503, 504)
+
+    _session: requests.Session | None = None
+    _host_options: dict[str, dict] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def configure(pool_connections: int = 20, pool_maxsize: int = 50, pool_block: bool = False,
+                  max_retries: int = 3, backoff_factor: float = 0.3, backoff_jitter: float = 0.3,
+                  status_forcelist: tuple[int, ...] = (502, 503, 504)):
+        """
+        Configures the default transport of the shared session. The session is rebuilt with the new settings,
+        the previous one is not closed since other threads may still be using it, it is released once unused.
+
+        :param pool_connections: Amount of host pools kept in the session.
+        :param pool_maxsize: Maximum amount of connections kept alive per host.
+        :param pool_block: If True the callers wait for a free connection instead of opening extra ones.
+        :param max_retries: Retries for connection errors and retryable status codes of idempotent requests, 0 disables them.
+        :param backoff_factor: Base of the exponential backoff between retries, in seconds.
+        :param backoff_jitter: Maximum random seconds added to every backoff.
+        :param status_forcelist: Status codes which trigger a retry.
+        """
+        with HttpSessionManager._lock:
+            HttpSessionManager.pool_connections = pool_connections
+            HttpSessionManager.pool_maxsize = pool_maxsize
+            HttpSessionManager.pool_block = pool_block
+            HttpSessionManager.max_retries = max_retries
+            HttpSessionManager.backoff_factor = backoff_factor
+            HttpSessionManager.backoff_jitter = backoff_jitter
+            HttpSessionManager.status_forcelist = tuple(status_forcelist)
+            HttpSessionManager._session = None
+
+    @staticmethod
+    def configure_host(url_prefix: str, **options):
+        """
+        Gives the requests starting with the url prefix (e.g. "https://provider.example.com") a dedicated
+        connection pool. The options are the same as in configure(), the missing ones use the defaults.
+        """
+        with HttpSessionManager._lock:
+            HttpSessionManager._host_options[url_prefix] = options
+            ## The previous session is left open for the threads still using it
+            HttpSessionManager._session = None
+
+    @staticmethod
+    def get_session() -> requests.Session:
+        """
+        Returns the shared session, creating it if needed.
+        """
+        session = HttpSessionManager._session
+        if session is not None:
+            return session
+        with HttpSessionManager._lock:
+            if HttpSessionManager._session is None:
+                HttpSessionManager._session = HttpSessionManager._build_session()
+            return HttpSessionManager._session
+
+    @staticmethod
+    def reset():
+        """
+        Drops the shared session and the host specific pools, a new session is built on the next call.
+        """
+        with HttpSessionManager._lock:
+            session = HttpSessionManager._session
+            HttpSessionManager._session = None
+            HttpSessionManager._host_options = {}
+        if session is not None:
+            session.close()
+
+    @staticmethod
+    def build_adapter(pool_connections: int = None, pool_maxsize: int = None, pool_block: bool = None,
+                      max_retries: int = None, backoff_factor: float = None, backoff_jitter: float = None,
+                      status_forcelist: tuple[int, ...] = None) -> HTTPAdapter:
+        """
+        Builds a pooled HTTPAdapter, the missing options are taken from the defaults of the manager.
+        """
+        retry = Retry(
+            total=HttpSessionManager.max_retries if max_retries is None else max_retries,
+            backoff_factor=HttpSessionManager.backoff_factor if backoff_factor is None else backoff_factor,
+            backoff_jitter=HttpSessionManager.backoff_jitter if backoff_jitter is None else backoff_jitter,
+            status_forcelist=HttpSessionManager.status_forcelist if status_forcelist is None else status_forcelist,
+            ## Keep returning the last response instead of raising when the retries are exhausted
+            raise_on_status=False,
+            respect_retry_after_header=True
+        )
+        return HTTPAdapter(
+            pool_connections=HttpSessionManager.pool_connections if pool_connections is None else pool_connections,
+            pool_maxsize=HttpSessionManager.pool_maxsize if pool_maxsize is None else pool_maxsize,
+            pool_block=HttpSessionManager.pool_block if pool_block is None else pool_block,
+            max_retries=retry
+        )
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        session = requests.Session()
+        ## Cookies of one provider must never be sent to the requests of another caller
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        default_adapter = HttpSessionManager.build_adapter()
+        session.mount("http://", default_adapter)
+        session.mount("https://", default_adapter)
+        ## requests selects the adapter with the longest matching prefix
+        for url_prefix, options in HttpSessionManager._host_options.items():
+            session.mount(url_prefix, HttpSessionManager.build_adapter(**options))
+        return session
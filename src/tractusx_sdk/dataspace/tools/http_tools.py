@@ -31,12 +31,18 @@ import requests
 from fastapi.responses import JSONResponse, Response
 from io import BytesIO
 import urllib.parse
+from .http_session_manager import HttpSessionManager
 class HttpTools:
 
-    # do get request without session
+    # shared pooled session used when no session is given
+    @staticmethod
+    def get_session() -> requests.Session:
+        return HttpSessionManager.get_session()
+
+    # do get request with the shared session
     @staticmethod
     def do_get(url,verify=True,headers=None,timeout=None,params=None,allow_redirects=False):
-        return requests.get(url=url,verify=verify,
+        return HttpTools.get_session().get(url=url,verify=verify,
                             timeout=timeout,headers=headers,
                             params=params,allow_redirects=allow_redirects)
     
@@ -44,15 +50,15 @@ class HttpTools:
     @staticmethod
     def do_get_with_session(url,session=None,verify=True,headers=None,timeout=None, params=None,allow_redirects=False):
         if session is None:
-            session = requests.Session()
+            session = HttpTools.get_session()
         return session.get(url=url,verify=verify,
                            timeout=timeout,headers=headers,
                            params=params,allow_redirects=allow_redirects)
     
-    # do post request without session
+    # do post request with the shared session
     @staticmethod
     def do_post(url,data=None,verify=True,headers=None,timeout=None,json=None,allow_redirects=False):
-        return requests.post(url=url,verify=verify,
+        return HttpTools.get_session().post(url=url,verify=verify,
                              timeout=timeout,headers=headers,
                              data=data,json=json,
                              allow_redirects=allow_redirects)
@@ -61,16 +67,16 @@ class HttpTools:
     @staticmethod
     def do_post_with_session(url,session=None,data=None,verify=True,headers=None,timeout=None,json=None,allow_redirects=False):
         if session is None:
-            session = requests.Session()
+            session = HttpTools.get_session()
         return session.post(url=url,verify=verify,
                             timeout=timeout,headers=headers,
                             data=data,json=json,
                             allow_redirects=allow_redirects)
 
-    # do put request without session
+    # do put request with the shared session
     @staticmethod
     def do_put(url, data=None, verify=True, headers=None, timeout=None, json=None, allow_redirects=False):
-        return requests.put(url=url, verify=verify,
+        return HttpTools.get_session().put(url=url, verify=verify,
                             timeout=timeout, headers=headers,
                             data=data, json=json,
                             allow_redirects=allow_redirects)
@@ -79,16 +85,16 @@ class HttpTools:
     @staticmethod
     def do_put_with_session(url, session=None, data=None, verify=True, headers=None, timeout=None, json=None, allow_redirects=False):
         if session is None:
-            session = requests.Session()
+            session = HttpTools.get_session()
         return session.put(url=url, verify=verify,
                            timeout=timeout, headers=headers,
                            data=data, json=json,
                            allow_redirects=allow_redirects)
 
-    # do delete request without session
+    # do delete request with the shared session
     @staticmethod
     def do_delete(url, verify=True, headers=None, timeout=None, params=None, allow_redirects=False):
-        return requests.delete(url=url, verify=verify,
+        return HttpTools.get_session().delete(url=url, verify=verify,
                                timeout=timeout, headers=headers,
                                params=params, allow_redirects=allow_redirects)
 
@@ -96,7 +102,7 @@ class HttpTools:
     @staticmethod
     def do_delete_with_session(url, session=None, verify=True, headers=None, timeout=None, params=None, allow_redirects=False):
         if session is None:
-            session = requests.Session()
+            session = HttpTools.get_session()
         return session.delete(url=url, verify=verify,
                               timeout=timeout, headers=headers,
                               params=params, allow_redirects=allow_redirects)
@@ -0,0 +1,132 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class _Error:
+    def __init__(self, error: Exception):
+        self.error_type = type(error)
+        self.args = error.args
+
+    def build(self) -> Exception:
+        return self.error_type(*self.args)
+
+
+class TtlCache:
+    """
+    Thread-safe in-memory cache whose entries expire after a time to live, bounded by the amount of entries
+    (least recently used are evicted).
+
+    Besides values, errors can be cached (negative caching), so that a failing lookup is not repeated for every
+    request; they are raised again by lookup() until they expire.
+    """
+
+    def __init__(self, ttl: float = 300, negative_ttl: float = 30, max_entries: int = 10000):
+        """
+        :param ttl: Default seconds a value is kept.
+        :param negative_ttl: Default seconds an error is kept.
+        :param max_entries: Maximum amount of entries kept.
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        ## key -> (value or _Error, expires_at)
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        """
+        Looks up a key.
+
+        :return: (True, value) if the key is cached, (False, None) if it is missing or expired.
+        :raises Exception: The cached error, if an error was cached for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+        if isinstance(value, _Error):
+            raise value.build()
+        return True, value
+
+    def lookup_many(self, keys: list[Hashable]) -> tuple[dict, list]:
+        """
+        Looks up several keys at once, cached errors are reported as missing.
+
+        :return: (dict with the cached values by key, list of the keys missing or with errors)
+        """
+        found: dict = {}
+        missing: list = []
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None or now >= entry[1] or isinstance(entry[0], _Error):
+                    missing.append(key)
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = entry[0]
+        return found, missing
+
+    def set(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        """
+        Caches a value for ttl seconds (the default ttl if not given).
+        """
+        self._store(key, value, self.ttl if ttl is None else ttl)
+
+    def set_error(self, key: Hashable, error: Exception, ttl: float = None) -> None:
+        """
+        Caches an error for ttl seconds (the default negative ttl if not given).
+        """
+        self._store(key, _Error(error), self.negative_ttl if ttl is None else ttl)
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """
+        Removes a key, or all of them if no key is given.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
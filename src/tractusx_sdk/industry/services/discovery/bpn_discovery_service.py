@@ -21,13 +21,17 @@
 #################################################################################
 
 import logging
-from typing import Optional
+from itertools import islice
+from typing import Iterable, Optional
 
 from tractusx_sdk.dataspace.tools.http_tools import HttpTools
 from tractusx_sdk.dataspace.managers import OAuth2Manager
 from tractusx_sdk.dataspace.services.discovery import DiscoveryFinderService
 from tractusx_sdk.dataspace.services.discovery.base_discovery_service import BaseDiscoveryService
 from tractusx_sdk.dataspace.tools.operators import op
+from tractusx_sdk.dataspace.tools.ttl_cache import TtlCache
+from tractusx_sdk.dataspace.tools.bounded_executor import BoundedExecutor
+from tractusx_sdk.dataspace.services.connector.polling_strategy import PollingStrategy
 import requests
 
 class BpnDiscoveryService(BaseDiscoveryService):
@@ -36,7 +40,7 @@ class BpnDiscoveryService(BaseDiscoveryService):
     oauth:OAuth2Manager
     def __init__(self, oauth:OAuth2Manager, discovery_finder_service: DiscoveryFinderService, cache_timeout_seconds:int = 60 * 60 * 12,
                  session:requests.Session = None, base_path:str="/api/v1.0/administration/connectors/bpnDiscovery",
-                 verbose:bool=False, logger:Optional[logging.Logger]=None):
+                 verbose:bool=False, logger:Optional[logging.Logger]=None, result_cache:TtlCache=None, result_cache_enabled:bool=False):
         """
         Initialize the BPN Discovery Service.
         
@@ -47,6 +51,9 @@ class BpnDiscoveryService(BaseDiscoveryService):
             base_path (str): API path to append to the base URL from discovery finder (default: "/api/v1.0/administration/connectors/bpnDiscovery").
             verbose (bool): Enable verbose logging (default: False).
             logger (Optional[logging.Logger]): Logger instance for logging (default: None).
+            result_cache (TtlCache): Cache of the BPNs found by identifier, enables the caching when given.
+            result_cache_enabled (bool): Whether the BPNs found by find_bpns are cached when no cache is given,
+                for 1 hour and 5 minutes for identifiers without BPNs (default: False).
         """
         self.oauth = oauth
         super().__init__(
@@ -58,8 +65,21 @@ class BpnDiscoveryService(BaseDiscoveryService):
         )
         self.session = session
         self.base_path = base_path
+        ## The default identifier type is resolved by the finder together with the other discovery types,
+        ## the finders without registration (like test doubles) resolve it on its own
+        register_discovery_keys = getattr(discovery_finder_service, "register_discovery_keys", None)
+        if register_discovery_keys is not None:
+            register_discovery_keys(["manufacturerPartId"])
         if(not self.session):
             self.session = requests.Session()
+        ## (identifier_type, key) -> BPNs of the key, the keys without BPNs are cached as an empty list for a shorter time.
+        ## Opt-in (a cache given or enabled), since the partners may register new identifiers at any time
+        if result_cache is not None:
+            self.result_cache = result_cache
+        elif result_cache_enabled:
+            self.result_cache = TtlCache(ttl=60 * 60, negative_ttl=5 * 60)
+        else:
+            self.result_cache = None
 
     def get_service_name(self) -> str:
         """Returns the service name for logging purposes."""
@@ -79,7 +99,7 @@ class BpnDiscoveryService(BaseDiscoveryService):
         Raises:
             Exception: If no discovery endpoint is found for the given key.
         """
-        endpoints = discovery_finder_service.find_discovery_urls(keys=[discovery_key])
+        endpoints = discovery_finder_service.get_discovery_urls(keys=[discovery_key])
         if(discovery_key not in endpoints):
           raise Exception("[BPN Discovery Service] BPN Discovery endpoint not found!")
 
@@ -201,6 +221,8 @@ class BpnDiscoveryService(BaseDiscoveryService):
         """
         Finds and returns a list of unique BPNs corresponding to given identifier keys.
 
+        The BPNs of every key are cached, only the keys not cached are searched.
+
         Args:
             keys (list): List of identifier keys to resolve to BPNs.
             identifier_type (str): The type of the identifier (default: "manufacturerPartId").
@@ -208,10 +230,55 @@ class BpnDiscoveryService(BaseDiscoveryService):
         Returns:
             list | None: A list of unique BPNs or None if none found.
         """
-        json_response:dict = self.search_bpns(keys=keys, identifier_type=identifier_type)
-        bpns_data = json_response.get("bpns", [])
-        bpns = op.extract_dict_values(array=bpns_data, key="value")
-        return list(set(bpns)) if bpns else None
+        keys = list(dict.fromkeys(keys))
+        bpns:set = set()
+        missing = keys
+        if self.result_cache is not None:
+            found, missing_keys = self.result_cache.lookup_many([(identifier_type, key) for key in keys])
+            for key_bpns in found.values():
+                bpns.update(key_bpns)
+            missing = [key for _, key in missing_keys]
+
+        if missing:
+            json_response:dict = self.search_bpns(keys=missing, identifier_type=identifier_type)
+            bpns_data = json_response.get("bpns", [])
+            bpns.update(op.extract_dict_values(array=bpns_data, key="value") or [])
+            self._cache_search_result(keys=missing, identifier_type=identifier_type, bpns_data=bpns_data)
+
+        return list(bpns) if bpns else None
+
+    def _cache_search_result(self, keys:list, identifier_type:str, bpns_data:list) -> None:
+        """
+        Caches the BPNs found for every searched key, the keys without BPNs are cached as empty.
+        Nothing is cached if the results do not tell the key they belong to.
+        """
+        if self.result_cache is None:
+            return
+        key_bpns:dict = {key: [] for key in keys}
+        for item in bpns_data:
+            key = item.get("key")
+            if key not in key_bpns or item.get("type", identifier_type) != identifier_type:
+                return
+            key_bpns[key].append(item.get("value"))
+        for key, found_bpns in key_bpns.items():
+            self.result_cache.set((identifier_type, key), list(dict.fromkeys(found_bpns)),
+                                  ttl=None if found_bpns else self.result_cache.negative_ttl)
+
+    def invalidate_bpns(self, keys:list = None, identifier_type:str="manufacturerPartId") -> None:
+        """
+        Removes the cached BPNs of the given identifier keys, or of all the identifiers if no keys are given.
+
+        Args:
+            keys (list): The identifier keys to invalidate.
+            identifier_type (str): The type of the identifiers (default: "manufacturerPartId").
+        """
+        if self.result_cache is None:
+            return
+        if keys is None:
+            self.result_cache.invalidate()
+            return
+        for key in keys:
+            self.result_cache.invalidate((identifier_type, key))
 
     def find_bpns_multi_type(self, search_filters:list) -> list | None:
         """
@@ -277,6 +344,7 @@ class BpnDiscoveryService(BaseDiscoveryService):
         if response.status_code != 201:
             raise Exception("[BPN Discovery Service] Failed to create BPN identifier.")
 
+        self.invalidate_bpns(keys=[identifier_key], identifier_type=identifier_type)
         return response.json()
 
     def set_multiple_identifiers(self, identifiers: list, identifier_type:str="manufacturerPartId") -> list:
@@ -293,12 +361,7 @@ class BpnDiscoveryService(BaseDiscoveryService):
         Raises:
             Exception: If the batch creation fails.
         """
-        body = [{"type": identifier_type, "key": key} for key in identifiers]
-
-        discovery_url = self._get_or_update_discovery_url(bpn_discovery_key=identifier_type) + "/batch"
-        headers: dict = self.oauth.add_auth_header(headers={'Content-Type': 'application/json'})
-
-        response = HttpTools.do_post_with_session(url=discovery_url, headers=headers, json=body, session=self.session)
+        response = self._post_identifiers_batch(identifiers=identifiers, identifier_type=identifier_type)
         if response is None:
             raise Exception("[BPN Discovery Service] No response received from the connector discovery service.")
         if response.status_code == 401:
@@ -306,8 +369,111 @@ class BpnDiscoveryService(BaseDiscoveryService):
         if response.status_code != 201:
             raise Exception("[BPN Discovery Service] Failed to create BPN identifiers batch.")
 
+        self.invalidate_bpns(keys=identifiers, identifier_type=identifier_type)
         return response.json()
 
+    def _post_identifiers_batch(self, identifiers: list, identifier_type: str) -> requests.Response | None:
+        """
+        Sends the batch request registering the identifiers, returning the response as it is.
+        """
+        body = [{"type": identifier_type, "key": key} for key in identifiers]
+
+        discovery_url = self._get_or_update_discovery_url(bpn_discovery_key=identifier_type) + "/batch"
+        headers: dict = self.oauth.add_auth_header(headers={'Content-Type': 'application/json'})
+
+        return HttpTools.do_post_with_session(url=discovery_url, headers=headers, json=body, session=self.session)
+
+    def register_identifiers(self, identifiers: Iterable[str], identifier_type:str="manufacturerPartId", chunk_size:int=500,
+                             max_in_flight:int=4, retry_strategy:PollingStrategy=None) -> dict[str, dict]:
+        """
+        Registers a large amount of identifiers to the authenticated user's BPN, in chunks sent concurrently.
+
+        The identifiers are consumed lazily, only max_in_flight chunks are read and sent at the same time.
+        A chunk failing with a transport error, a 429 or a 5xx response is sent again after the backoff delays of
+        the retry strategy. Once its attempts or its deadline are exhausted, or if it fails with any other response,
+        its identifiers are reported as failed, without stopping the other chunks.
+        A conflict answering a retry means that an earlier attempt was stored by the server, so the chunk is
+        reported as registered (without the response entries).
+
+        Args:
+            identifiers (Iterable[str]): The identifier keys, i.e. a generator reading them from a file.
+            identifier_type (str): The type of identifier (default: "manufacturerPartId").
+            chunk_size (int): Maximum number of identifiers sent per batch request (default: 500).
+            max_in_flight (int): Maximum number of batch requests sent at the same time (default: 4).
+            retry_strategy (PollingStrategy): Backoff and maximum attempts of every chunk (default: 3 attempts, 1 second initial delay).
+
+        Returns:
+            dict[str, dict]: The outcome by identifier key, {"status": "registered", "result": <response entry or None>}
+                or {"status": "failed", "error": <error message>}.
+        """
+        if retry_strategy is None:
+            retry_strategy = PollingStrategy(initial_delay=1.0, max_delay=30.0, deadline=None, max_attempts=3)
+        report: dict[str, dict] = {}
+        iterator = iter(identifiers)
+        chunks = iter(lambda: tuple(islice(iterator, chunk_size)), ())
+
+        def register_chunk(chunk: tuple) -> list:
+            return self._register_chunk_with_retries(chunk=list(chunk), identifier_type=identifier_type, retry_strategy=retry_strategy)
+
+        for chunk, future in BoundedExecutor.as_completed(function=register_chunk, items=chunks, max_concurrency=max_in_flight):
+            error = future.exception()
+            if error is not None:
+                for key in chunk:
+                    report[key] = {"status": "failed", "error": str(error)}
+                continue
+            results = future.result()
+            entries = {entry.get("key"): entry for entry in results if isinstance(entry, dict)} if isinstance(results, list) else {}
+            for key in chunk:
+                report[key] = {"status": "registered", "result": entries.get(key)}
+
+        if self.verbose and self.logger:
+            failed = sum(1 for outcome in report.values() if outcome["status"] == "failed")
+            self.logger.info(f"[BPN Discovery Service] Registered {len(report) - failed} identifiers, {failed} failed.")
+        return report
+
+    def _register_chunk_with_retries(self, chunk: list, identifier_type: str, retry_strategy: PollingStrategy) -> list:
+        """
+        Sends a chunk with the batch request, retrying the transient failures with the backoff of the strategy.
+        """
+        attempts = 0
+        errors: list[Exception] = []
+
+        def send() -> list | None:
+            nonlocal attempts
+            attempts += 1
+            try:
+                response = self._post_identifiers_batch(identifiers=chunk, identifier_type=identifier_type)
+            except requests.RequestException as e:
+                errors.append(e)
+                return None
+            if response is None:
+                errors.append(Exception("[BPN Discovery Service] No response received from the connector discovery service."))
+                return None
+            if response.status_code == 201:
+                self.invalidate_bpns(keys=chunk, identifier_type=identifier_type)
+                results = response.json()
+                return results if results is not None else []
+            ## The previous attempt was committed by the server before the client gave up on it
+            if response.status_code == 409 and attempts > 1:
+                self.invalidate_bpns(keys=chunk, identifier_type=identifier_type)
+                return []
+            error = Exception(f"[BPN Discovery Service] Failed to create BPN identifiers batch. Response code: [{response.status_code}]")
+            if response.status_code == 429 or response.status_code >= 500:
+                errors.append(error)
+                return None
+            if response.status_code == 401:
+                raise Exception("[BPN Discovery Service] Unauthorized access. Please check your clientid permissions.")
+            raise error
+
+        def on_retry(attempt: int, delay: float):
+            if self.verbose and self.logger:
+                self.logger.warning(f"[BPN Discovery Service] Batch of {len(chunk)} identifiers failed (attempt {attempt}), retrying in {delay:.2f}s. Error: {str(errors[-1])}")
+
+        results = retry_strategy.poll(fetch=send, on_retry=on_retry)
+        if results is None:
+            raise errors[-1]
+        return results
+
     def delete_bpn_identifier_by_id(self, resource_id: str, identifier_type:str="manufacturerPartId") -> None:
         """
         Deletes an existing BPN identifier association by its resource ID.
@@ -328,4 +494,7 @@ class BpnDiscoveryService(BaseDiscoveryService):
         if response.status_code == 401:
             raise Exception("[BPN Discovery Service] Unauthorized access. Please check your clientid permissions.")
         if response.status_code != 204:
-            raise Exception(f"[BPN Discovery Service] Failed to delete BPN identifier with resourceId {resource_id}.")
\ No newline at end of file
+            raise Exception(f"[BPN Discovery Service] Failed to delete BPN identifier with resourceId {resource_id}.")
+
+        ## The key of the deleted identifier is not known, so none of the cached results can be trusted
+        self.invalidate_bpns()
\ No newline at end of file
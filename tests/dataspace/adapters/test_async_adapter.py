@@ -0,0 +1,102 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import unittest
+import httpx
+
+from tractusx_sdk.dataspace.adapters.async_adapter import AsyncAdapter
+from tractusx_sdk.dataspace.adapters.connector.adapter_factory import AdapterFactory
+from tractusx_sdk.dataspace.adapters.connector.saturn import AsyncDmaAdapter
+from tractusx_sdk.dataspace.controllers.connector.saturn.edr_controller import EdrController
+
+
+class TestAsyncAdapter(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.base_url = "https://example.com"
+        self.headers = {"X-Api-Key": "secret"}
+        self.requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request):
+            self.requests.append(request)
+            return httpx.Response(200, json={"key": "value"})
+
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    def test_builder_creates_adapter_instance(self):
+        adapter = AsyncAdapter.builder().base_url(self.base_url).headers(self.headers).verify(False).build()
+
+        self.assertIsInstance(adapter, AsyncAdapter)
+        self.assertEqual(adapter.base_url, self.base_url)
+        self.assertEqual(adapter.headers, self.headers)
+        self.assertFalse(adapter.verify)
+
+    async def test_request_merges_headers_and_builds_url(self):
+        adapter = AsyncAdapter(base_url=self.base_url, headers=self.headers, client=self.client)
+
+        response = await adapter.get("test-endpoint", headers={"Accept": "application/json"}, params={"a": "b"})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"key": "value"}, response.json())
+        request = self.requests[0]
+        self.assertEqual(str(request.url), "https://example.com/test-endpoint?a=b")
+        self.assertEqual(request.headers["X-Api-Key"], "secret")
+        self.assertEqual(request.headers["Accept"], "application/json")
+
+    async def test_request_sends_serialized_data_as_content(self):
+        adapter = AsyncAdapter(base_url=self.base_url, client=self.client)
+
+        await adapter.post("test-endpoint", data='{"a": 1}', verify=False, allow_redirects=True)
+
+        self.assertEqual(self.requests[0].method, "POST")
+        self.assertEqual(self.requests[0].content, b'{"a": 1}')
+
+    async def test_controller_methods_are_awaitable(self):
+        adapter = AsyncDmaAdapter(base_url=self.base_url, dma_path="/management", client=self.client)
+        controller = EdrController.builder().adapter(adapter).build()
+
+        response = await controller.get_data_address(oid="transfer-1", params={"auto_refresh": True})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(str(self.requests[0].url),
+                         "https://example.com/management/v3/edrs/transfer-1/dataaddress?auto_refresh=true")
+
+    def test_adapter_factory_builds_async_dma_adapter(self):
+        adapter = AdapterFactory.get_async_dma_adapter(dataspace_version="saturn", base_url=self.base_url,
+                                                       dma_path="/management", headers=self.headers)
+
+        self.assertIsInstance(adapter, AsyncDmaAdapter)
+        self.assertEqual(adapter.base_url, "https://example.com/management")
+
+    async def test_close_only_closes_dedicated_client(self):
+        adapter = AsyncAdapter(base_url=self.base_url, client=self.client)
+        await adapter.close()
+        self.assertTrue(self.client.is_closed)
+
+        shared_adapter = AsyncAdapter(base_url=self.base_url)
+        await shared_adapter.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+import os
+import tempfile
+import unittest
+from contextlib import asynccontextmanager, contextmanager
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from tractusx_sdk.dataspace.managers.connection import (
+    AsyncFileSystemConnectionManager,
+    AsyncMemoryConnectionManager,
+    AsyncPostgresConnectionManager
+)
+
+
+def build_entry(transfer_id):
+    return {"@id": transfer_id, "@type": "EndpointDataReferenceEntry", "providerId": "BPNL0001",
+            "@context": {}, "transferProcessId": transfer_id}
+
+
+class SyncBackedAsyncConnection:
+    """Runs the statements of the async connection API on a synchronous SQLAlchemy connection."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    async def execute(self, statement, parameters=None):
+        return self.connection.execute(statement, parameters)
+
+    async def run_sync(self, fn, *args):
+        return fn(self.connection, *args)
+
+    async def commit(self):
+        self.connection.commit()
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        with self.connection.begin_nested():
+            yield
+
+
+class SyncBackedAsyncEngine:
+    """Exposes the connection methods of a SQLAlchemy AsyncEngine over a synchronous engine."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.dialect = engine.dialect
+
+    @asynccontextmanager
+    async def begin(self):
+        with self.engine.begin() as connection:
+            yield SyncBackedAsyncConnection(connection)
+
+    @asynccontextmanager
+    async def connect(self):
+        with self.engine.connect() as connection:
+            yield SyncBackedAsyncConnection(connection)
+
+
+class TestAsyncMemoryConnectionManager(unittest.IsolatedAsyncioTestCase):
+
+    async def test_add_get_delete(self):
+        manager = AsyncMemoryConnectionManager()
+        self.assertEqual(await manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1")), "tp-1")
+        self.assertEqual(await manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+        self.assertEqual((await manager.get_connection("BPNL0001", "https://edc", "query", "policy"))["transferProcessId"], "tp-1")
+        self.assertEqual(len(manager.get_connections()), 1)
+        self.assertTrue(await manager.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertIsNone(await manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"))
+
+    async def test_negotiation_lock_serializes_tasks_of_the_same_connection(self):
+        manager = AsyncMemoryConnectionManager(negotiation_locking=True)
+        negotiations = []
+
+        async def negotiate():
+            async with manager.negotiation_lock("BPNL0001", "https://edc", "query", "policy"):
+                transfer_id = await manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy")
+                if transfer_id is None:
+                    negotiations.append(1)
+                    await asyncio.sleep(0.01)
+                    transfer_id = await manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+                return transfer_id
+
+        self.assertEqual(await asyncio.gather(*(negotiate() for _ in range(5))), ["tp-1"] * 5)
+        self.assertEqual(len(negotiations), 1)
+        self.assertEqual(len(manager._negotiation_locks), 0)
+
+
+class TestAsyncFileSystemConnectionManager(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "connections.jsonl")
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.stop()
+        self.directory.cleanup()
+
+    def build_manager(self):
+        manager = AsyncFileSystemConnectionManager(path=self.path, persist_interval=60, negotiation_locking=True, lock_poll_interval=0.01)
+        self.managers.append(manager)
+        return manager
+
+    async def test_negotiated_connection_is_shared_through_the_journal(self):
+        first, second = self.build_manager(), self.build_manager()
+        async with first.negotiation_lock("BPNL0001", "https://edc", "query", "policy"):
+            await first.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+
+        async with second.negotiation_lock("BPNL0001", "https://edc", "query", "policy"):
+            self.assertEqual(await second.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+
+    async def test_negotiation_lock_waits_without_blocking_the_loop(self):
+        first, second = self.build_manager(), self.build_manager()
+        events = []
+
+        async def wait_for_lock():
+            async with second.negotiation_lock("BPNL0001", "https://edc", "query", "policy"):
+                events.append("second")
+
+        async with first.negotiation_lock("BPNL0001", "https://edc", "query", "policy"):
+            waiter = asyncio.create_task(wait_for_lock())
+            await asyncio.sleep(0.05)
+            events.append("first")
+        await waiter
+        self.assertEqual(events, ["first", "second"])
+
+
+class TestAsyncPostgresConnectionManager(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.manager = AsyncPostgresConnectionManager(SyncBackedAsyncEngine(engine), table_name="edr_async_connections", batch_size=2)
+
+    async def test_add_get_delete(self):
+        await self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        await self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-2"))
+        self.assertTrue(self.manager._native_upsert)
+        self.assertEqual(await self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-2")
+        self.assertEqual(await self.manager.get_connection("BPNL0001", "https://edc", "query", "policy"),
+                         {"@id": "tp-2", "transferProcessId": "tp-2"})
+        self.assertTrue(await self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertFalse(await self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertEqual(await self.manager.get_connection("BPNL0001", "https://edc", "query", "policy"), {})
+
+    async def test_bulk_methods(self):
+        keys = [("BPNL0001", "https://edc", f"query-{i}", "policy") for i in range(3)]
+        await self.manager.add_connections_many([key + (build_entry(f"tp-{i}"),) for i, key in enumerate(keys)])
+        missing = ("BPNL0002", "https://edc", "query", "policy")
+        connections = await self.manager.get_connections_many(keys + [missing])
+        self.assertEqual([connections[key]["transferProcessId"] for key in keys], ["tp-0", "tp-1", "tp-2"])
+        self.assertEqual(connections[missing], {})
+        self.assertEqual(await self.manager.delete_connections_many(keys + [missing]), 3)
+
+    async def test_negotiation_lock_does_not_lock_other_databases(self):
+        self.manager.negotiation_locking = True
+        async with self.manager.negotiation_lock("BPNL0001", "https://edc", "query", "policy"):
+            pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import time
+import unittest
+from unittest import mock
+
+from tractusx_sdk.dataspace.managers.catalog_cache_manager import BaseCatalogCacheManager, MemoryCatalogCacheManager
+
+
+def build_key(counter_party_id="BPNL0001", counter_party_address="https://provider/api/v1/dsp", filter_value="a"):
+    return BaseCatalogCacheManager.get_key(counter_party_id=counter_party_id,
+                                           counter_party_address=counter_party_address,
+                                           protocol="dataspace-protocol-http:2025-1",
+                                           request_data={"querySpec": {"filterExpression": [filter_value]}})
+
+
+class TestMemoryCatalogCacheManager(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = MemoryCatalogCacheManager(ttl=10, stale_ttl=5)
+        self.catalog = {"dcat:dataset": [{"@id": "asset-1"}]}
+
+    def test_key_depends_on_the_request(self):
+        self.assertEqual(build_key(), build_key())
+        self.assertNotEqual(build_key(filter_value="a"), build_key(filter_value="b"))
+
+    def test_fresh_catalog_is_served(self):
+        key = build_key()
+        self.cache.put(key, self.catalog)
+        self.assertEqual(self.cache.get(key), (self.catalog, False))
+        self.assertIsNone(self.cache.get(build_key(filter_value="b")))
+
+    def test_stale_catalog_is_served_while_revalidated_once(self):
+        key = build_key()
+        now = time.monotonic()
+        self.cache.put(key, self.catalog)
+        with mock.patch("time.monotonic", return_value=now + 12):
+            self.assertEqual(self.cache.get(key), (self.catalog, True))
+            self.assertEqual(self.cache.get(key), (self.catalog, False))
+            self.cache.release_revalidation(key)
+            self.assertEqual(self.cache.get(key), (self.catalog, True))
+
+    def test_expired_catalog_is_removed(self):
+        key = build_key()
+        now = time.monotonic()
+        self.cache.put(key, self.catalog)
+        with mock.patch("time.monotonic", return_value=now + 16):
+            self.assertIsNone(self.cache.get(key))
+        self.assertEqual(self.cache.size, 0)
+
+    def test_least_recently_used_is_evicted_by_size(self):
+        catalog_size = len(json.dumps(self.catalog))
+        cache = MemoryCatalogCacheManager(max_bytes=catalog_size * 2)
+        first, second, third = build_key(filter_value="1"), build_key(filter_value="2"), build_key(filter_value="3")
+        cache.put(first, self.catalog)
+        cache.put(second, self.catalog)
+        cache.get(first)
+        cache.put(third, self.catalog)
+        self.assertIsNotNone(cache.get(first))
+        self.assertIsNone(cache.get(second))
+        self.assertIsNotNone(cache.get(third))
+        self.assertEqual(cache.size, catalog_size * 2)
+
+    def test_catalog_bigger_than_the_cache_is_not_cached(self):
+        cache = MemoryCatalogCacheManager(max_bytes=5)
+        cache.put(build_key(), self.catalog)
+        self.assertIsNone(cache.get(build_key()))
+        self.assertEqual(cache.size, 0)
+
+    def test_invalidate_by_counter_party(self):
+        first = build_key(counter_party_id="BPNL0001")
+        second = build_key(counter_party_id="BPNL0002")
+        self.cache.put(first, self.catalog)
+        self.cache.put(second, self.catalog)
+        self.cache.invalidate(counter_party_id="BPNL0001")
+        self.assertIsNone(self.cache.get(first))
+        self.assertIsNotNone(self.cache.get(second))
+        self.cache.invalidate()
+        self.assertIsNone(self.cache.get(second))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import json
+import time
+import unittest
+from unittest import mock
+
+from tractusx_sdk.dataspace.managers.edr_cache_manager import BaseEdrCacheManager, MemoryEdrCacheManager
+from tractusx_sdk.dataspace.tools.encoding_tools import encode_as_base64_url_safe
+
+
+def build_edr(exp, endpoint="https://provider.dataplane/api/public"):
+    header = encode_as_base64_url_safe(json.dumps({"alg": "ES256"}))
+    payload = encode_as_base64_url_safe(json.dumps({"exp": exp}))
+    return {"endpoint": endpoint, "authorization": f"{header}.{payload}.signature"}
+
+
+class TestMemoryEdrCacheManager(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = MemoryEdrCacheManager(refresh_margin=30, max_entries=2)
+
+    def test_get_expiration(self):
+        exp = int(time.time()) + 300
+        self.assertEqual(BaseEdrCacheManager.get_expiration(build_edr(exp)), exp)
+        self.assertIsNone(BaseEdrCacheManager.get_expiration({"authorization": "token"}))
+        self.assertIsNone(BaseEdrCacheManager.get_expiration({"authorization": "a.!!.c"}))
+        self.assertIsNone(BaseEdrCacheManager.get_expiration({}))
+
+    def test_valid_edr_is_served(self):
+        edr = build_edr(int(time.time()) + 300)
+        self.assertTrue(self.cache.put("transfer-1", edr))
+        self.assertEqual(self.cache.get("transfer-1"), (edr, False))
+
+    def test_edr_without_expiration_is_not_cached(self):
+        self.assertFalse(self.cache.put("transfer-1", {"endpoint": "url", "authorization": "token"}))
+        self.assertIsNone(self.cache.get("transfer-1"))
+
+    def test_expired_edr_is_not_cached(self):
+        self.assertFalse(self.cache.put("transfer-1", build_edr(int(time.time()) - 1)))
+        self.assertIsNone(self.cache.get("transfer-1"))
+
+    def test_refresh_is_due_once_inside_margin(self):
+        now = time.time()
+        edr = build_edr(int(now) + 300)
+        self.cache.put("transfer-1", edr)
+        with mock.patch("time.time", return_value=now + 280):
+            self.assertEqual(self.cache.get("transfer-1"), (edr, True))
+            ## The other callers keep being served while the refresh runs
+            self.assertEqual(self.cache.get("transfer-1"), (edr, False))
+            self.cache.release_refresh("transfer-1")
+            self.assertEqual(self.cache.get("transfer-1"), (edr, True))
+
+    def test_short_lived_token_is_refreshed_at_half_lifetime(self):
+        now = time.time()
+        edr = build_edr(int(now) + 20)
+        self.cache.put("transfer-1", edr)
+        self.assertEqual(self.cache.get("transfer-1"), (edr, False))
+        with mock.patch("time.time", return_value=now + 11):
+            self.assertEqual(self.cache.get("transfer-1"), (edr, True))
+
+    def test_put_clears_pending_refresh(self):
+        now = time.time()
+        self.cache.put("transfer-1", build_edr(int(now) + 300))
+        with mock.patch("time.time", return_value=now + 280):
+            self.cache.get("transfer-1")
+        fresh = build_edr(int(time.time()) + 300)
+        self.cache.put("transfer-1", fresh)
+        self.assertEqual(self.cache.get("transfer-1"), (fresh, False))
+
+    def test_least_recently_used_is_evicted(self):
+        exp = int(time.time()) + 300
+        self.cache.put("transfer-1", build_edr(exp))
+        self.cache.put("transfer-2", build_edr(exp))
+        self.cache.get("transfer-1")
+        self.cache.put("transfer-3", build_edr(exp))
+        self.assertIsNotNone(self.cache.get("transfer-1"))
+        self.assertIsNone(self.cache.get("transfer-2"))
+        self.assertIsNotNone(self.cache.get("transfer-3"))
+
+    def test_invalidate(self):
+        exp = int(time.time()) + 300
+        self.cache.put("transfer-1", build_edr(exp))
+        self.cache.put("transfer-2", build_edr(exp))
+        self.cache.invalidate("transfer-1")
+        self.assertIsNone(self.cache.get("transfer-1"))
+        self.assertIsNotNone(self.cache.get("transfer-2"))
+        self.cache.invalidate()
+        self.assertIsNone(self.cache.get("transfer-2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import builtins
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from tractusx_sdk.dataspace.managers.connection.file_system.file_system_connection_manager import FileSystemConnectionManager
+
+
+def build_entry(transfer_id):
+    return {"@id": transfer_id, "@type": "EndpointDataReferenceEntry", "providerId": "BPNL0001",
+            "@context": {}, "transferProcessId": transfer_id}
+
+
+class TestFileSystemConnectionManager(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache", "connections.jsonl")
+        self.managers = []
+        self.manager = self.build_manager()
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.stop()
+        self.directory.cleanup()
+
+    def build_manager(self, **kwargs):
+        manager = FileSystemConnectionManager(path=self.path, persist_interval=3600, **kwargs)
+        self.managers.append(manager)
+        return manager
+
+    def read_lines(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_idle_saves_do_not_read_the_journal(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        self.manager._save_to_file()
+        self.assertFalse(self.manager.has_unsaved_changes())
+        with mock.patch.object(self.manager, "_read_journal") as read_journal:
+            self.manager._save_to_file()
+        read_journal.assert_not_called()
+
+    def test_changes_are_appended_to_the_journal(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query-1", "policy", build_entry("tp-1"))
+        self.manager._save_to_file()
+        self.manager.add_connection("BPNL0001", "https://edc", "query-2", "policy", build_entry("tp-2"))
+        self.manager.delete_connection("BPNL0001", "https://edc", "query-1", "policy")
+        self.manager._save_to_file()
+        self.assertEqual([(record["op"], record["key"][2]) for record in self.read_lines()],
+                         [("put", "query-1"), ("put", "query-2"), ("del", "query-1")])
+
+        other = self.build_manager()
+        self.assertIsNone(other.get_connection_transfer_id("BPNL0001", "https://edc", "query-1", "policy"))
+        self.assertEqual(other.get_connection_transfer_id("BPNL0001", "https://edc", "query-2", "policy"), "tp-2")
+
+    def test_readers_only_read_the_new_records(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query-1", "policy", build_entry("tp-1"))
+        self.manager._save_to_file()
+        other = self.build_manager()
+        offset = other._offset
+
+        self.manager.add_connection("BPNL0001", "https://edc", "query-2", "policy", build_entry("tp-2"))
+        self.manager._save_to_file()
+        with mock.patch.object(other, "_replace_entries") as replace_entries:
+            other._load_if_updated()
+        replace_entries.assert_not_called()
+        self.assertGreater(other._offset, offset)
+        self.assertEqual(other.get_connection_transfer_id("BPNL0001", "https://edc", "query-2", "policy"), "tp-2")
+
+    def test_unchanged_journal_is_not_read(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        self.manager._save_to_file()
+        with mock.patch("builtins.open", wraps=builtins.open) as opened:
+            self.manager._load_if_updated()
+            self.manager._save_to_file()
+        opened.assert_not_called()
+
+    def test_journal_is_compacted(self):
+        manager = self.build_manager(compact_min_records=3)
+        reader = self.build_manager()
+        for i in range(4):
+            manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry(f"tp-{i}"))
+            manager._save_to_file()
+        self.assertEqual(self.read_lines(), [{"op": "put", "key": ["BPNL0001", "https://edc", "query", "policy"],
+                                              "edr": {"@id": "tp-3", "transferProcessId": "tp-3"}}])
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+        reader._load_if_updated()
+        self.assertEqual(reader.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-3")
+
+    def test_incomplete_record_is_ignored(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query-1", "policy", build_entry("tp-1"))
+        self.manager._save_to_file()
+        with open(self.path, "a") as f:
+            f.write('{"op": "put", "key": ["BPNL0001"')
+
+        other = self.build_manager()
+        self.assertEqual(other.get_connection_transfer_id("BPNL0001", "https://edc", "query-1", "policy"), "tp-1")
+        other.add_connection("BPNL0001", "https://edc", "query-2", "policy", build_entry("tp-2"))
+        other._save_to_file()
+
+        reader = self.build_manager()
+        self.assertEqual(reader.get_connection_transfer_id("BPNL0001", "https://edc", "query-2", "policy"), "tp-2")
+
+    def test_legacy_file_is_converted(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump({"BPNL0001": {"https://edc": {"query": {"policy": {"transferProcessId": "tp-1"}}}}, "edrs": 1}, f)
+        manager = self.build_manager()
+        self.assertEqual(manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+
+        manager._save_to_file()
+        self.assertEqual(self.read_lines(), [{"op": "put", "key": ["BPNL0001", "https://edc", "query", "policy"],
+                                              "edr": {"transferProcessId": "tp-1"}}])
+
+    def test_formatted_legacy_file_is_converted(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump({"BPNL0001": {"https://edc": {"query": {"policy": {"transferProcessId": "tp-1"}}}}}, f, indent=2)
+            f.write("\n")
+        manager = self.build_manager()
+        self.assertEqual(manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+
+    def test_legacy_file_next_to_the_journal_is_migrated(self):
+        legacy_path = self.path[:-len(".jsonl")] + ".json"
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(legacy_path, "w") as f:
+            json.dump({"BPNL0001": {"https://edc": {"query": {"policy": {"transferProcessId": "tp-1"}}}}}, f)
+        manager = self.build_manager()
+        self.assertEqual(manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+
+        manager._save_to_file()
+        self.assertEqual(self.read_lines(), [{"op": "put", "key": ["BPNL0001", "https://edc", "query", "policy"],
+                                              "edr": {"transferProcessId": "tp-1"}}])
+        self.assertTrue(os.path.exists(legacy_path))
+
+    def test_legacy_file_is_not_migrated_over_a_journal(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query-1", "policy", build_entry("tp-1"))
+        self.manager._save_to_file()
+        with open(self.path[:-len(".jsonl")] + ".json", "w") as f:
+            json.dump({"BPNL0002": {"https://edc": {"query": {"policy": {"transferProcessId": "tp-2"}}}}}, f)
+        other = self.build_manager()
+        self.assertEqual(other.get_connection_transfer_id("BPNL0001", "https://edc", "query-1", "policy"), "tp-1")
+        self.assertIsNone(other.get_connection_transfer_id("BPNL0002", "https://edc", "query", "policy"))
+
+    def test_corrupted_record_is_logged(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query-1", "policy", build_entry("tp-1"))
+        self.manager._save_to_file()
+        with open(self.path, "a") as f:
+            f.write('{"op": "put"\n')
+        logger = mock.Mock()
+        other = self.build_manager(logger=logger)
+        logger.error.assert_called_once_with("[FileSystemConnectionManager] Skipped a corrupted record of the journal.")
+        self.assertEqual(other.get_connection_transfer_id("BPNL0001", "https://edc", "query-1", "policy"), "tp-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
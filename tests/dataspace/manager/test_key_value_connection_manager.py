@@ -0,0 +1,124 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from tractusx_sdk.dataspace.managers.connection import (
+    KeyValueConnectionManager,
+    MemoryKeyValueStore,
+    RedisKeyValueStore
+)
+
+
+def build_entry(transfer_id):
+    return {"@id": transfer_id, "@type": "EndpointDataReferenceEntry", "providerId": "BPNL0001",
+            "@context": {}, "transferProcessId": transfer_id}
+
+
+class TestKeyValueConnectionManager(unittest.TestCase):
+
+    def setUp(self):
+        self.store = MemoryKeyValueStore()
+        self.manager = KeyValueConnectionManager(store=self.store, negotiation_locking=True, lock_poll_interval=0.01)
+
+    def test_connections_are_shared_through_the_store(self):
+        replica = KeyValueConnectionManager(store=self.store)
+        self.assertEqual(self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1")), "tp-1")
+        self.assertEqual(replica.get_connection("BPNL0001", "https://edc", "query", "policy"),
+                         {"@id": "tp-1", "transferProcessId": "tp-1"})
+        self.assertEqual(replica.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+
+        self.assertTrue(replica.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertFalse(replica.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertIsNone(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"))
+
+    def test_connections_expire(self):
+        manager = KeyValueConnectionManager(store=self.store, ttl=60)
+        manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+            self.assertEqual(manager.get_connection("BPNL0001", "https://edc", "query", "policy"), {})
+            self.assertEqual(self.store.purge_expired(), 0)
+
+    def test_bulk_methods(self):
+        keys = [("BPNL0001", "https://edc", f"query-{i}", "policy") for i in range(3)]
+        self.assertEqual(self.manager.add_connections_many([key + (build_entry(f"tp-{i}"),) for i, key in enumerate(keys)]),
+                         ["tp-0", "tp-1", "tp-2"])
+        missing = ("BPNL0002", "https://edc", "query", "policy")
+        connections = self.manager.get_connections_many(keys + [missing])
+        self.assertEqual(connections[keys[1]]["transferProcessId"], "tp-1")
+        self.assertEqual(connections[missing], {})
+        self.assertEqual(self.manager.delete_connections_many(keys + [missing]), 3)
+
+    def test_negotiation_lock_is_exclusive(self):
+        replica = KeyValueConnectionManager(store=self.store, negotiation_locking=True, lock_poll_interval=0.01)
+        events = []
+        with self.manager.negotiation_lock("BPNL0001", "https://edc", "query", "policy"):
+            waiter = threading.Thread(target=lambda: replica.negotiation_lock("BPNL0001", "https://edc", "query", "policy")
+                                      .__enter__() and None or events.append("acquired"))
+            waiter.start()
+            time.sleep(0.05)
+            events.append("released")
+        waiter.join(timeout=2)
+        self.assertEqual(events, ["released", "acquired"])
+
+    def test_negotiation_lock_timeout(self):
+        replica = KeyValueConnectionManager(store=self.store, negotiation_locking=True, lock_timeout=0.05, lock_poll_interval=0.01)
+        with self.manager.negotiation_lock("BPNL0001", "https://edc", "query", "policy"):
+            with self.assertRaises(TimeoutError):
+                with replica.negotiation_lock("BPNL0001", "https://edc", "query", "policy"):
+                    pass
+
+    def test_expired_lock_is_not_released_by_its_former_owner(self):
+        self.assertTrue(self.store.set_if_absent("lock", "owner-1", ttl=0))
+        self.assertTrue(self.store.set_if_absent("lock", "owner-2", ttl=60))
+        self.assertFalse(self.store.delete_if_value("lock", "owner-1"))
+        self.assertEqual(self.store.get("lock"), "owner-2")
+
+
+class TestRedisKeyValueStore(unittest.TestCase):
+
+    def setUp(self):
+        self.client = mock.Mock()
+        self.store = RedisKeyValueStore(self.client)
+
+    def test_get_many_uses_a_single_mget(self):
+        self.client.mget.return_value = [b"value", None]
+        self.assertEqual(self.store.get_many(["a", "b"]), ["value", None])
+        self.client.mget.assert_called_once_with(["a", "b"])
+
+    def test_set_many_is_pipelined(self):
+        pipeline = self.client.pipeline.return_value
+        self.store.set_many({"a": "1", "b": "2"}, ttl=1.5)
+        pipeline.set.assert_has_calls([mock.call("a", "1", px=1500), mock.call("b", "2", px=1500)])
+        pipeline.execute.assert_called_once()
+
+    def test_set_if_absent_uses_set_nx(self):
+        self.client.set.return_value = None
+        self.assertFalse(self.store.set_if_absent("lock", "token", ttl=10))
+        self.client.set.assert_called_once_with("lock", "token", px=10000, nx=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from tractusx_sdk.dataspace.managers.connection.memory import memory_connection_manager as mcm
+from tractusx_sdk.dataspace.managers.connection.memory.memory_connection_manager import MemoryConnectionManager
+
+
+def build_entry(transfer_id):
+    return {"@id": transfer_id, "@type": "EndpointDataReferenceEntry", "providerId": "BPNL0001",
+            "@context": {}, "transferProcessId": transfer_id}
+
+
+def run_inline(target, args, daemon):
+    return mock.Mock(start=lambda: target(*args))
+
+
+class TestMemoryConnectionManager(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = MemoryConnectionManager()
+
+    def test_add_get_and_delete_connection(self):
+        entry = build_entry("tp-1")
+        self.assertEqual(self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", entry), "tp-1")
+        stored = self.manager.get_connection("BPNL0001", "https://edc", "query", "policy")
+        self.assertEqual(stored, {"@id": "tp-1", "transferProcessId": "tp-1"})
+        self.assertIn("@type", entry)
+
+        self.assertTrue(self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertFalse(self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertIsNone(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"))
+
+    def test_counter_party_connections(self):
+        self.manager.add_connection("BPNL0001", "https://edc-1", "query", "policy", build_entry("tp-1"))
+        self.manager.add_connection("BPNL0001", "https://edc-2", "query", "policy", build_entry("tp-2"))
+        self.manager.add_connection("BPNL0002", "https://edc-3", "query", "policy", build_entry("tp-3"))
+        self.manager.delete_connection("BPNL0002", "https://edc-3", "query", "policy")
+
+        connections = self.manager.get_counter_party_connections("BPNL0001")
+        self.assertEqual({edr["transferProcessId"] for edr in connections.values()}, {"tp-1", "tp-2"})
+        self.assertEqual(self.manager.get_counter_party_connections("BPNL0002"), {})
+
+    def test_open_connections_view(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        with self.assertWarns(DeprecationWarning):
+            view = self.manager.open_connections
+        self.assertEqual(view["BPNL0001"]["https://edc"]["query"]["policy"]["transferProcessId"], "tp-1")
+        self.assertEqual(view["edrs"], 1)
+
+        other = MemoryConnectionManager()
+        with self.assertWarns(DeprecationWarning):
+            other.open_connections = view
+        self.assertEqual(other.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+        self.assertEqual(other.get_counter_party_connections("BPNL0001").keys(), {("BPNL0001", "https://edc", "query", "policy")})
+
+    def test_open_connections_is_a_snapshot(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        with self.assertWarns(DeprecationWarning):
+            view = self.manager.open_connections
+        view["BPNL0001"]["https://edc"]["query"]["policy"]["transferProcessId"] = "changed"
+        self.assertEqual(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+
+        connections = self.manager.get_connections()
+        connections[("BPNL0001", "https://edc", "query", "policy")]["transferProcessId"] = "changed"
+        self.assertEqual(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+
+    def test_lookups_do_not_wait_for_the_lock(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        result = []
+        with self.manager._lock:
+            reader = threading.Thread(target=lambda: result.append(
+                self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy")))
+            reader.start()
+            reader.join(timeout=2)
+        self.assertEqual(result, ["tp-1"])
+
+
+class TestMemoryConnectionManagerEviction(unittest.TestCase):
+
+    def test_unbounded_by_default(self):
+        manager = MemoryConnectionManager()
+        for i in range(50):
+            manager.add_connection("BPNL0001", "https://edc", f"query-{i}", "policy", build_entry(f"tp-{i}"))
+        self.assertEqual(manager.get_eviction_stats(), {"entries": 50, "evicted_capacity": 0, "evicted_expired": 0})
+
+    def test_least_recently_used_connections_are_evicted_above_capacity(self):
+        manager = MemoryConnectionManager(max_entries=2)
+        manager.add_connection("BPNL0001", "https://edc", "query-1", "policy", build_entry("tp-1"))
+        manager.add_connection("BPNL0001", "https://edc", "query-2", "policy", build_entry("tp-2"))
+        manager.get_connection("BPNL0001", "https://edc", "query-1", "policy")
+        manager.add_connection("BPNL0001", "https://edc", "query-3", "policy", build_entry("tp-3"))
+
+        self.assertEqual(manager.get_connection_transfer_id("BPNL0001", "https://edc", "query-1", "policy"), "tp-1")
+        self.assertIsNone(manager.get_connection_transfer_id("BPNL0001", "https://edc", "query-2", "policy"))
+        self.assertEqual(manager.get_eviction_stats(), {"entries": 2, "evicted_capacity": 1, "evicted_expired": 0})
+
+    def test_expired_connections_are_evicted_on_access(self):
+        manager = MemoryConnectionManager(max_age=60)
+        manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+            self.assertEqual(manager.get_connection("BPNL0001", "https://edc", "query", "policy"), {})
+        self.assertEqual(manager.get_eviction_stats()["evicted_expired"], 1)
+
+    def test_sweep_evicts_expired_connections(self):
+        manager = MemoryConnectionManager(max_age=60)
+        manager.add_connection("BPNL0001", "https://edc", "query-1", "policy", build_entry("tp-1"))
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 30):
+            manager.add_connection("BPNL0001", "https://edc", "query-2", "policy", build_entry("tp-2"))
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+            self.assertEqual(manager.sweep(), 1)
+        self.assertEqual(manager.get_connection_transfer_id("BPNL0001", "https://edc", "query-2", "policy"), "tp-2")
+        self.assertEqual(manager.get_eviction_stats()["entries"], 1)
+
+    def test_background_sweeper_stops(self):
+        manager = MemoryConnectionManager(max_age=0, sweep_interval=0.01)
+        manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        deadline = time.monotonic() + 2
+        while manager.get_eviction_stats()["entries"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        manager.stop()
+        self.assertEqual(manager.get_eviction_stats()["evicted_expired"], 1)
+
+    def test_eviction_hook_is_called_with_the_evicted_edr(self):
+        on_evict = mock.Mock(side_effect=[RuntimeError("connector down"), None])
+        manager = MemoryConnectionManager(max_entries=1, on_evict=on_evict)
+        with mock.patch.object(mcm.threading, "Thread", side_effect=run_inline):
+            manager.add_connection("BPNL0001", "https://edc", "query-1", "policy", build_entry("tp-1"))
+            manager.add_connection("BPNL0001", "https://edc", "query-2", "policy", build_entry("tp-2"))
+            manager.add_connection("BPNL0001", "https://edc", "query-3", "policy", build_entry("tp-3"))
+        self.assertEqual(on_evict.call_count, 2)
+        self.assertEqual(on_evict.call_args_list[0].args[:4], ("BPNL0001", "https://edc", "query-1", "policy"))
+        self.assertEqual(on_evict.call_args_list[0].args[4]["transferProcessId"], "tp-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,9 +21,13 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+import json
+import threading
+import time
 import unittest
 from unittest.mock import Mock
 from fastapi import Request, HTTPException
+from jwcrypto import jwk, jwt
 from starlette.datastructures import Headers
 from tractusx_sdk.dataspace.managers.oauth2_manager import OAuth2Manager
 from unittest.mock import patch, MagicMock
@@ -131,6 +135,143 @@ class TestOAuth2Manager(unittest.TestCase):
             manager.get_token()
         self.assertIn("Failed to retrieve token", str(exc.exception))
 
+    def _build_cached_manager(self, mock_keycloak, **kwargs):
+        manager = OAuth2Manager.__new__(OAuth2Manager)
+        manager.connected = True
+        manager.keycloak_openid = mock_keycloak
+        manager.clientid = self.clientid
+        manager.clientsecret = self.clientsecret
+        for key, value in kwargs.items():
+            setattr(manager, key, value)
+        return manager
+
+    def test_get_token_is_cached_until_refresh_margin(self):
+        mock_keycloak = MagicMock()
+        mock_keycloak.token.return_value = {"access_token": "abc123", "expires_in": 300}
+        manager = self._build_cached_manager(mock_keycloak)
+
+        self.assertEqual(manager.get_token(), "abc123")
+        self.assertEqual(manager.get_token(), "abc123")
+        mock_keycloak.token.assert_called_once()
+
+    def test_get_token_is_cached_per_scope(self):
+        mock_keycloak = MagicMock()
+        mock_keycloak.token.side_effect = [
+            {"access_token": "first", "expires_in": 300},
+            {"access_token": "second", "expires_in": 300},
+        ]
+        manager = self._build_cached_manager(mock_keycloak)
+
+        self.assertEqual(manager.get_token(scope="a"), "first")
+        self.assertEqual(manager.get_token(scope="b"), "second")
+        self.assertEqual(manager.get_token(scope="a"), "first")
+        self.assertEqual(mock_keycloak.token.call_count, 2)
+
+    def test_get_token_without_expires_in_is_not_cached(self):
+        mock_keycloak = MagicMock()
+        mock_keycloak.token.return_value = {"access_token": "abc123"}
+        manager = self._build_cached_manager(mock_keycloak)
+
+        manager.get_token()
+        manager.get_token()
+        self.assertEqual(mock_keycloak.token.call_count, 2)
+
+    def test_get_token_cache_disabled(self):
+        mock_keycloak = MagicMock()
+        mock_keycloak.token.return_value = {"access_token": "abc123", "expires_in": 300}
+        manager = self._build_cached_manager(mock_keycloak, token_cache_enabled=False)
+
+        manager.get_token()
+        manager.get_token()
+        self.assertEqual(mock_keycloak.token.call_count, 2)
+
+    @patch("tractusx_sdk.dataspace.managers.oauth2_manager.time.monotonic")
+    def test_get_token_expired_is_refreshed_synchronously(self, mock_monotonic):
+        mock_keycloak = MagicMock()
+        mock_keycloak.token.side_effect = [
+            {"access_token": "old", "expires_in": 100},
+            {"access_token": "new", "expires_in": 100},
+        ]
+        manager = self._build_cached_manager(mock_keycloak)
+
+        mock_monotonic.return_value = 1000.0
+        self.assertEqual(manager.get_token(), "old")
+        mock_monotonic.return_value = 1101.0
+        self.assertEqual(manager.get_token(), "new")
+        self.assertEqual(mock_keycloak.token.call_count, 2)
+
+    @patch("tractusx_sdk.dataspace.managers.oauth2_manager.time.monotonic")
+    def test_get_token_inside_margin_refreshes_in_background(self, mock_monotonic):
+        mock_keycloak = MagicMock()
+        mock_keycloak.token.side_effect = [
+            {"access_token": "old", "expires_in": 100},
+            {"access_token": "new", "expires_in": 100},
+        ]
+        manager = self._build_cached_manager(mock_keycloak, token_refresh_margin=30)
+
+        mock_monotonic.return_value = 1000.0
+        self.assertEqual(manager.get_token(), "old")
+
+        mock_monotonic.return_value = 1080.0
+        with patch("tractusx_sdk.dataspace.managers.oauth2_manager.threading.Thread") as mock_thread:
+            self.assertEqual(manager.get_token(), "old")
+            mock_thread.assert_called_once()
+            ## Run the background refresh inline
+            target = mock_thread.call_args.kwargs["target"]
+            target(*mock_thread.call_args.kwargs["args"])
+
+        self.assertEqual(manager.get_token(), "new")
+        self.assertEqual(mock_keycloak.token.call_count, 2)
+
+    def test_get_token_concurrent_callers_share_one_request(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_token(*args, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return {"access_token": "abc123", "expires_in": 300}
+
+        mock_keycloak = MagicMock()
+        mock_keycloak.token.side_effect = slow_token
+        manager = self._build_cached_manager(mock_keycloak)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(manager.get_token())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        started.wait(timeout=5)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(results, ["abc123"] * 5)
+        mock_keycloak.token.assert_called_once()
+
+    def test_invalidate_token_forces_new_request(self):
+        mock_keycloak = MagicMock()
+        mock_keycloak.token.return_value = {"access_token": "abc123", "expires_in": 300}
+        manager = self._build_cached_manager(mock_keycloak)
+
+        manager.get_token()
+        manager.invalidate_token()
+        manager.get_token()
+        self.assertEqual(mock_keycloak.token.call_count, 2)
+
+    @patch("tractusx_sdk.dataspace.managers.oauth2_manager.KeycloakOpenID")
+    def test_connect_resets_token_cache(self, mock_keycloak_cls):
+        mock_keycloak = MagicMock()
+        mock_keycloak.well_known.return_value = True
+        mock_keycloak.token.return_value = {"access_token": "abc123", "expires_in": 300}
+        mock_keycloak_cls.return_value = mock_keycloak
+
+        manager = OAuth2Manager(self.auth_url, self.realm, self.clientid, self.clientsecret)
+        manager.get_token()
+        manager.connect(self.auth_url, self.realm, "other_client", "other_secret")
+        manager.get_token()
+        self.assertEqual(mock_keycloak.token.call_count, 2)
+
+
     @patch("tractusx_sdk.dataspace.managers.oauth2_manager.KeycloakOpenID")
     def test_add_auth_header_success_with_none_headers(self, mock_keycloak_cls):
 
@@ -270,5 +411,138 @@ class TestOAuth2Manager(unittest.TestCase):
         self.assertFalse(result)
 
 
+    def _build_local_manager(self, keys, **kwargs):
+        mock_keycloak = MagicMock()
+        mock_keycloak.certs.return_value = {"keys": [json.loads(key.export_public()) for key in keys]}
+        manager = OAuth2Manager.__new__(OAuth2Manager)
+        manager.connected = True
+        manager.keycloak_openid = mock_keycloak
+        manager.validation_mode = OAuth2Manager.VALIDATION_LOCAL
+        for key, value in kwargs.items():
+            setattr(manager, key, value)
+        return manager, mock_keycloak
+
+    @staticmethod
+    def _sign(key, claims):
+        token = jwt.JWT(header={"alg": "RS256", "kid": key.get("kid")}, claims=json.dumps(claims))
+        token.make_signed_token(key)
+        return token.serialize()
+
+    @staticmethod
+    def _bearer_request(token):
+        request = Mock(spec=Request)
+        request.headers = Headers({"Authorization": f"Bearer {token}"})
+        return request
+
+    def test_is_authenticated_local_mode_valid_token(self):
+        key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-1")
+        manager, mock_keycloak = self._build_local_manager([key], audience="my-api")
+        token = self._sign(key, {"sub": "user1", "aud": "my-api", "exp": int(time.time()) + 300})
+
+        self.assertTrue(manager.is_authenticated(self._bearer_request(token)))
+        self.assertTrue(manager.is_authenticated(self._bearer_request(token)))
+        mock_keycloak.userinfo.assert_not_called()
+        mock_keycloak.certs.assert_called_once()
+
+    def test_is_authenticated_local_mode_expired_token_raises(self):
+        key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-1")
+        manager, _ = self._build_local_manager([key])
+        token = self._sign(key, {"sub": "user1", "exp": int(time.time()) - 300})
+
+        with self.assertRaises(HTTPException) as exc:
+            manager.is_authenticated(self._bearer_request(token))
+        self.assertEqual(exc.exception.status_code, 401)
+
+    def test_is_authenticated_local_mode_wrong_audience_raises(self):
+        key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-1")
+        manager, _ = self._build_local_manager([key], audience="my-api")
+        token = self._sign(key, {"sub": "user1", "aud": "other-api", "exp": int(time.time()) + 300})
+
+        with self.assertRaises(HTTPException) as exc:
+            manager.is_authenticated(self._bearer_request(token))
+        self.assertEqual(exc.exception.status_code, 401)
+
+    def test_is_authenticated_local_mode_wrong_issuer_raises(self):
+        key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-1")
+        manager, _ = self._build_local_manager([key], issuer="http://example.com/auth/realms/test_realm")
+        token = self._sign(key, {"sub": "user1", "iss": "http://evil.com", "exp": int(time.time()) + 300})
+
+        with self.assertRaises(HTTPException):
+            manager.is_authenticated(self._bearer_request(token))
+
+    def test_is_authenticated_local_mode_forged_signature_raises(self):
+        key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-1")
+        forged_key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-1")
+        manager, _ = self._build_local_manager([key])
+        token = self._sign(forged_key, {"sub": "user1", "exp": int(time.time()) + 300})
+
+        with self.assertRaises(HTTPException):
+            manager.is_authenticated(self._bearer_request(token))
+
+    def test_validate_token_refreshes_jwks_on_key_rotation(self):
+        old_key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-1")
+        new_key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-2")
+        manager, mock_keycloak = self._build_local_manager([old_key], jwks_min_refresh_interval=0)
+        manager.validate_token(self._sign(old_key, {"sub": "user1", "exp": int(time.time()) + 300}))
+
+        mock_keycloak.certs.return_value = {"keys": [json.loads(new_key.export_public())]}
+        claims = manager.validate_token(self._sign(new_key, {"sub": "user2", "exp": int(time.time()) + 300}))
+
+        self.assertEqual(claims["sub"], "user2")
+        self.assertEqual(mock_keycloak.certs.call_count, 2)
+
+    def test_validate_token_unknown_key_does_not_refetch_within_interval(self):
+        key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-1")
+        unknown_key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-2")
+        manager, mock_keycloak = self._build_local_manager([key], jwks_min_refresh_interval=300)
+        manager.validate_token(self._sign(key, {"sub": "user1", "exp": int(time.time()) + 300}))
+
+        for _ in range(3):
+            with self.assertRaises(Exception):
+                manager.validate_token(self._sign(unknown_key, {"sub": "user1", "exp": int(time.time()) + 300}))
+        mock_keycloak.certs.assert_called_once()
+
+    def test_validate_token_lru_is_bounded(self):
+        key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-1")
+        manager, _ = self._build_local_manager([key], validated_tokens_cache_size=2)
+
+        for subject in ["a", "b", "c"]:
+            manager.validate_token(self._sign(key, {"sub": subject, "exp": int(time.time()) + 300}))
+        self.assertEqual(len(manager._validated_tokens), 2)
+
+    def test_validate_token_cached_token_not_blocked_by_jwks_fetch(self):
+        key = jwk.JWK.generate(kty="RSA", size=2048, kid="key-1")
+        manager, mock_keycloak = self._build_local_manager([key], jwks_cache_ttl=60)
+        cached_token = self._sign(key, {"sub": "cached", "exp": int(time.time()) + 300})
+        manager.validate_token(cached_token)
+
+        certs = mock_keycloak.certs.return_value
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def slow_certs():
+            fetching.set()
+            release.wait(5)
+            return certs
+
+        mock_keycloak.certs.side_effect = slow_certs
+        manager._jwks_fetched_at -= 120
+        other_token = self._sign(key, {"sub": "other", "exp": int(time.time()) + 300})
+        worker = threading.Thread(target=manager.validate_token, args=(other_token,), daemon=True)
+        worker.start()
+        self.assertTrue(fetching.wait(5))
+
+        try:
+            self.assertEqual(manager.validate_token(cached_token)["sub"], "cached")
+        finally:
+            release.set()
+            worker.join(5)
+        self.assertEqual(mock_keycloak.certs.call_count, 2)
+
+    def test_init_invalid_validation_mode_raises(self):
+        with self.assertRaises(ValueError):
+            OAuth2Manager(self.auth_url, self.realm, self.clientid, self.clientsecret, validation_mode="other")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,94 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import unittest
+
+from sqlalchemy import inspect
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine, select
+
+from tractusx_sdk.dataspace.managers.connection.database.postgres_connection_manager import PostgresConnectionManager
+
+
+def build_entry(transfer_id):
+    return {"@id": transfer_id, "@type": "EndpointDataReferenceEntry", "providerId": "BPNL0001",
+            "@context": {}, "transferProcessId": transfer_id}
+
+
+class TestPostgresConnectionManager(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.manager = PostgresConnectionManager(engine=self.engine, table_name="edr_direct_connections", batch_size=2)
+
+    def stored_transfer_ids(self):
+        with Session(self.engine) as session:
+            return {row.transfer_id for row in session.exec(select(self.manager.EDRConnection)).all()}
+
+    def test_connection_key_has_a_unique_index(self):
+        indexes = inspect(self.engine).get_indexes("edr_direct_connections")
+        index = next(index for index in indexes if index["name"] == "ix_edr_direct_connections_connection_key")
+        self.assertEqual(index["column_names"], ["counter_party_id", "counter_party_address", "query_checksum", "policy_checksum"])
+        self.assertTrue(index["unique"])
+
+    def test_add_connection_replaces_the_previous_transfer(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-old"))
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-old"))
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-new"))
+        self.assertEqual(self.stored_transfer_ids(), {"tp-new"})
+        self.assertEqual(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-new")
+
+    def test_add_connection_with_transfer_stored_for_another_key(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-a", build_entry("tp-1"))
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-b", build_entry("tp-1"))
+        self.assertEqual(self.manager.get_connection("BPNL0001", "https://edc", "query", "policy-a"), {})
+        self.assertEqual(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy-b"), "tp-1")
+
+    def test_bulk_methods(self):
+        keys = [("BPNL0001", "https://edc", f"query-{i}", "policy") for i in range(5)]
+        transfer_ids = self.manager.add_connections_many([key + (build_entry(f"tp-{i}"),) for i, key in enumerate(keys)])
+        self.assertEqual(transfer_ids, [f"tp-{i}" for i in range(5)])
+        self.assertEqual(self.stored_transfer_ids(), set(transfer_ids))
+
+        missing = ("BPNL0002", "https://edc", "query", "policy")
+        connections = self.manager.get_connections_many(keys + [missing])
+        self.assertEqual(connections[keys[3]]["transferProcessId"], "tp-3")
+        self.assertNotIn("@type", connections[keys[3]])
+        self.assertEqual(connections[missing], {})
+
+        self.assertEqual(self.manager.delete_connections_many(keys[:3] + [missing]), 3)
+        self.assertEqual(self.stored_transfer_ids(), {"tp-3", "tp-4"})
+
+    def test_bulk_add_keeps_the_last_entry_of_a_key(self):
+        key = ("BPNL0001", "https://edc", "query", "policy")
+        self.manager.add_connections_many([key + (build_entry("tp-1"),), key + (build_entry("tp-2"),)])
+        self.assertEqual(self.stored_transfer_ids(), {"tp-2"})
+
+    def test_delete_connection(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        self.assertTrue(self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertFalse(self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertEqual(self.stored_transfer_ids(), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
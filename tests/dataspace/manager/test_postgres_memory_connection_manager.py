@@ -0,0 +1,220 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import unittest
+from unittest import mock
+
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine, select
+
+from tractusx_sdk.dataspace.managers.connection.database.postgres_memory_connection_manager import PostgresMemoryConnectionManager
+
+
+def build_entry(transfer_id):
+    return {"@id": transfer_id, "@type": "EndpointDataReferenceEntry", "providerId": "BPNL0001",
+            "@context": {}, "transferProcessId": transfer_id}
+
+
+class TestPostgresMemoryConnectionManager(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        self.manager = self.build_manager()
+
+    def build_manager(self):
+        with mock.patch.object(PostgresMemoryConnectionManager, "_trigger_save"):
+            manager = PostgresMemoryConnectionManager(engine=self.engine, save_batch_size=2)
+        manager._trigger_save = mock.Mock()
+        return manager
+
+    def stored_rows(self):
+        with Session(self.engine) as session:
+            return {row.transfer_id: row for row in session.exec(select(self.manager.EDRConnection)).all() if not row.deleted}
+
+    def test_only_changed_connections_are_saved(self):
+        for i in range(5):
+            self.manager.add_connection("BPNL0001", "https://edc", f"query-{i}", "policy", build_entry(f"tp-{i}"))
+        self.manager._save_to_db()
+        self.assertEqual(set(self.stored_rows()), {f"tp-{i}" for i in range(5)})
+
+        ## Rows which did not change must not be rewritten
+        with Session(self.engine) as session:
+            row = session.get(self.manager.EDRConnection, "tp-0")
+            row.edr_hash = "untouched"
+            session.add(row)
+            session.commit()
+
+        self.manager.add_connection("BPNL0001", "https://edc", "query-5", "policy", build_entry("tp-5"))
+        self.manager._save_to_db()
+        rows = self.stored_rows()
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows["tp-0"].edr_hash, "untouched")
+
+    def test_deleted_connections_are_removed(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-a", build_entry("tp-a"))
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-b", build_entry("tp-b"))
+        self.manager._save_to_db()
+
+        self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy-a")
+        self.manager._save_to_db()
+        self.assertEqual(set(self.stored_rows()), {"tp-b"})
+
+    def test_replaced_connection_is_upserted(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-old"))
+        self.manager._save_to_db()
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-new"))
+        self.manager._save_to_db()
+        self.assertEqual(set(self.stored_rows()), {"tp-new"})
+
+    def test_save_without_changes_does_not_touch_the_database(self):
+        with mock.patch(f"{PostgresMemoryConnectionManager.__module__}.Session") as session:
+            self.manager._save_to_db()
+        session.assert_not_called()
+
+    def test_failed_save_keeps_the_changes(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        with mock.patch.object(Session, "commit", side_effect=SQLAlchemyError("down")):
+            self.manager._save_to_db()
+        self.assertEqual(self.stored_rows(), {})
+
+        self.manager._save_to_db()
+        self.assertEqual(set(self.stored_rows()), {"tp-1"})
+
+    def test_lock_is_not_held_during_database_operations(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        original_commit = Session.commit
+
+        def commit(session):
+            self.assertTrue(self.manager._lock.acquire(blocking=False))
+            self.manager._lock.release()
+            original_commit(session)
+
+        with mock.patch.object(Session, "commit", autospec=True, side_effect=commit):
+            self.manager._save_to_db()
+
+    def test_pending_changes_survive_a_reload(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-a", build_entry("tp-a"))
+        self.manager._save_to_db()
+        other = self.build_manager()
+        other.add_connection("BPNL0001", "https://edc", "query", "policy-b", build_entry("tp-b"))
+        other._save_to_db()
+
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-c", build_entry("tp-c"))
+        self.manager._load_from_db()
+        self.assertEqual(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy-b"), "tp-b")
+        self.assertEqual(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy-c"), "tp-c")
+        self.assertEqual(len(self.manager.get_connections()), 3)
+
+        self.manager._save_to_db()
+        self.assertEqual(set(self.stored_rows()), {"tp-a", "tp-b", "tp-c"})
+
+    def test_replicas_pull_only_the_changes(self):
+        replica = self.build_manager()
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-a", build_entry("tp-a"))
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-b", build_entry("tp-b"))
+        self.manager._save_to_db()
+
+        replica._load_from_db()
+        self.assertEqual(replica.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy-a"), "tp-a")
+        self.assertEqual(len(replica.get_connections()), 2)
+        revision = replica._last_revision
+
+        self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy-a")
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-b", build_entry("tp-b2"))
+        self.manager._save_to_db()
+
+        replica._load_from_db()
+        self.assertEqual(replica.get_connection("BPNL0001", "https://edc", "query", "policy-a"), {})
+        self.assertEqual(replica.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy-b"), "tp-b2")
+        self.assertEqual(len(replica.get_connections()), 1)
+        self.assertEqual(replica._last_revision, revision + 1)
+
+    def test_unchanged_database_is_not_reloaded(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        self.manager._save_to_db()
+        self.manager._load_from_db()
+        connections = self.manager._connections
+        self.manager._load_from_db()
+        self.assertIs(self.manager._connections, connections)
+
+    def test_idle_saves_do_not_touch_the_database(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        self.assertTrue(self.manager.has_unsaved_changes())
+        self.manager._save_to_db()
+        self.assertFalse(self.manager.has_unsaved_changes())
+        with mock.patch.object(self.manager, "_take_changes") as take_changes:
+            self.manager._save_to_db()
+        take_changes.assert_not_called()
+
+    def test_failed_save_keeps_the_changes_unsaved(self):
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        with mock.patch("tractusx_sdk.dataspace.managers.connection.database.postgres_memory_connection_manager.Session",
+                        side_effect=SQLAlchemyError("down")):
+            self.manager._save_to_db()
+        self.assertTrue(self.manager.has_unsaved_changes())
+        self.manager._save_to_db()
+        self.assertFalse(self.manager.has_unsaved_changes())
+        self.assertEqual(set(self.stored_rows()), {"tp-1"})
+
+    def test_old_tombstones_are_dropped(self):
+        self.manager.tombstone_retention = 1
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-a", build_entry("tp-a"))
+        self.manager._save_to_db()
+        self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy-a")
+        self.manager._save_to_db()
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy-b", build_entry("tp-b"))
+        self.manager._save_to_db()
+        with Session(self.engine) as session:
+            transfer_ids = {row.transfer_id for row in session.exec(select(self.manager.EDRConnection)).all()}
+        self.assertEqual(transfer_ids, {"tp-b"})
+
+
+    def test_table_of_older_version_is_migrated(self):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE old_edr_connections (transfer_id VARCHAR PRIMARY KEY, counter_party_id VARCHAR,"
+                                    " counter_party_address VARCHAR, query_checksum VARCHAR, policy_checksum VARCHAR,"
+                                    " edr_data JSON, edr_hash VARCHAR)"))
+            connection.execute(text("INSERT INTO old_edr_connections VALUES ('tp-old', 'BPNL0001', 'https://edc', 'query',"
+                                    " 'policy', '{\"transferProcessId\": \"tp-old\"}', NULL)"))
+
+        with mock.patch.object(PostgresMemoryConnectionManager, "_trigger_save"):
+            manager = PostgresMemoryConnectionManager(engine=engine, table_name="old_edr_connections")
+        self.assertEqual(manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-old")
+        self.assertIn("ix_old_edr_connections_revision", {index["name"] for index in inspect(engine).get_indexes("old_edr_connections")})
+
+        manager.add_connection("BPNL0001", "https://edc", "query", "policy-new", build_entry("tp-new"))
+        manager._save_to_db()
+        self.assertFalse(manager.has_unsaved_changes())
+
+    def test_table_which_can_not_be_migrated_fails_loudly(self):
+        with mock.patch.object(PostgresMemoryConnectionManager, "_trigger_save"), \
+                mock.patch("tractusx_sdk.dataspace.managers.connection.database.postgres_memory_connection_manager.inspect",
+                           side_effect=SQLAlchemyError("permission denied")):
+            with self.assertRaises(RuntimeError):
+                PostgresMemoryConnectionManager(engine=self.engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import gc
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from tractusx_sdk.dataspace.managers.connection import SqliteConnectionManager
+
+
+def build_entry(transfer_id):
+    return {"@id": transfer_id, "@type": "EndpointDataReferenceEntry", "providerId": "BPNL0001",
+            "@context": {}, "transferProcessId": transfer_id}
+
+
+class TestSqliteConnectionManager(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache", "connections.db")
+        self.manager = SqliteConnectionManager(path=self.path, batch_size=2)
+
+    def tearDown(self):
+        self.manager.close()
+        self.directory.cleanup()
+
+    def test_database_runs_in_wal_mode(self):
+        mode = self.manager._get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_add_get_and_delete_connection(self):
+        self.assertEqual(self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1")), "tp-1")
+        self.assertEqual(self.manager.get_connection("BPNL0001", "https://edc", "query", "policy"),
+                         {"@id": "tp-1", "transferProcessId": "tp-1"})
+        self.assertEqual(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+
+        self.manager.add_connection("BPNL0001", "https://edc", "query", "policy", build_entry("tp-2"))
+        self.assertEqual(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-2")
+
+        self.assertTrue(self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertFalse(self.manager.delete_connection("BPNL0001", "https://edc", "query", "policy"))
+        self.assertEqual(self.manager.get_connection("BPNL0001", "https://edc", "query", "policy"), {})
+        self.assertIsNone(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"))
+
+    def test_bulk_methods(self):
+        keys = [("BPNL0001", "https://edc", f"query-{i}", "policy") for i in range(5)]
+        self.assertEqual(self.manager.add_connections_many([key + (build_entry(f"tp-{i}"),) for i, key in enumerate(keys)]),
+                         [f"tp-{i}" for i in range(5)])
+
+        missing = ("BPNL0002", "https://edc", "query", "policy")
+        connections = self.manager.get_connections_many(keys + [missing])
+        self.assertEqual([connections[key]["transferProcessId"] for key in keys], [f"tp-{i}" for i in range(5)])
+        self.assertEqual(connections[missing], {})
+
+        self.assertEqual(self.manager.delete_connections_many(keys[:3] + [missing]), 3)
+        self.assertEqual(len([key for key, edr in self.manager.get_connections_many(keys).items() if edr]), 2)
+
+    def test_failed_batch_is_rolled_back(self):
+        connection = self.manager._get_connection()
+        row = self.manager._build_row("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1"))
+        with self.assertRaises(RuntimeError):
+            with self.manager._transaction(connection):
+                connection.execute(self.manager._upsert_statement, row)
+                raise RuntimeError("failed batch")
+        self.assertEqual(self.manager.get_connection("BPNL0001", "https://edc", "query", "policy"), {})
+
+    def test_connections_are_shared_between_instances_and_threads(self):
+        other = SqliteConnectionManager(path=self.path)
+        thread = threading.Thread(target=other.add_connection,
+                                  args=("BPNL0001", "https://edc", "query", "policy", build_entry("tp-1")))
+        thread.start()
+        thread.join()
+        other.close()
+        self.assertEqual(self.manager.get_connection_transfer_id("BPNL0001", "https://edc", "query", "policy"), "tp-1")
+
+    def test_connection_of_finished_thread_is_closed(self):
+        connections = []
+        thread = threading.Thread(target=lambda: connections.append(self.manager._get_connection()))
+        thread.start()
+        thread.join()
+        del thread
+        gc.collect()
+
+        self.assertEqual(len(self.manager._opened), 1)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
+        ## The connection of the current thread is still usable
+        self.manager._get_connection().execute("SELECT 1")
+
+    def test_invalid_table_name(self):
+        with self.assertRaises(ValueError):
+            SqliteConnectionManager(path=self.path, table_name="edrs; DROP TABLE edrs")
+
+
+if __name__ == "__main__":
+    unittest.main()
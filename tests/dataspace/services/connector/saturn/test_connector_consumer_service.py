@@ -21,11 +21,13 @@
 #################################################################################
 
 from unittest import mock, TestCase, main
+from contextlib import nullcontext
 import logging
 from requests import Response
 
 from tractusx_sdk.dataspace.services.connector.saturn.connector_consumer_service import ConnectorConsumerService
 from tractusx_sdk.dataspace.managers.connection.base_connection_manager import BaseConnectionManager
+from tractusx_sdk.dataspace.tools.ttl_cache import TtlCache
 
 
 class TestSaturnConnectorConsumerService(TestCase):
@@ -38,6 +40,7 @@ class TestSaturnConnectorConsumerService(TestCase):
         
         # Mock connection manager
         self.mock_connection_manager = mock.Mock(spec=BaseConnectionManager)
+        self.mock_connection_manager.negotiation_lock.return_value = nullcontext()
         
         # Create service instance with mocked dependencies
         with mock.patch('tractusx_sdk.dataspace.adapters.connector.adapter_factory.AdapterFactory') as mock_adapter_factory, \
@@ -514,6 +517,30 @@ class TestSaturnConnectorConsumerService(TestCase):
             
             self.assertIsNone(result)
     
+    def test_get_catalogs_with_filter_with_bpnl_parallel(self):
+        """Test the catalogs of several EDCs are requested in the bounded pool."""
+        edcs = ["https://edc1.example.com", "https://edc2.example.com"]
+        with mock.patch.object(self.service, '_get_catalog_internal') as mock_get_catalog:
+            mock_get_catalog.side_effect = lambda counter_party_address, **kwargs: {"edc": counter_party_address}
+            result = self.service.get_catalogs_with_filter_with_bpnl_parallel(
+                bpnl="BPNL000000000001", edcs=edcs, filter_expression=[{"key": "test"}], max_concurrency=1
+            )
+        self.assertEqual(result, {edc: {"edc": edc} for edc in edcs})
+        self.assertEqual(mock_get_catalog.call_count, 2)
+
+    def test_get_catalogs_with_filter_uses_protocol(self):
+        """Test the catalog requests keep the protocol and the context."""
+        with mock.patch.object(self.service, 'get_catalog_request_with_filter') as mock_request, \
+             mock.patch.object(self.service, 'get_catalog') as mock_get_catalog:
+            mock_get_catalog.return_value = {"catalog": "data"}
+            result = self.service.get_catalogs_with_filter(
+                counter_party_id="did:web:provider", edcs=["https://edc1.example.com"], filter_expression=[],
+                protocol="dataspace-protocol-http", context={"@vocab": "test"}
+            )
+        self.assertEqual(result, {"https://edc1.example.com": {"catalog": "data"}})
+        self.assertEqual(mock_request.call_args.kwargs["protocol"], "dataspace-protocol-http")
+        self.assertEqual(mock_request.call_args.kwargs["context"], {"@vocab": "test"})
+
     def test_get_transfer_id_cached(self):
         """Test get_transfer_id with cached transfer ID."""
         counter_party_id = "BPNL000000000001"
@@ -603,6 +630,106 @@ class TestSaturnConnectorConsumerService(TestCase):
             with self.assertRaises(ConnectionError):
                 self.service.discover_connector_protocol(bpnl=bpnl)
     
+    def test_discover_connector_protocol_is_cached(self):
+        """Test the discovery of a BPNL is requested once while cached."""
+        self.service.discovery_cache = TtlCache(ttl=300, negative_ttl=30)
+        mock_response = mock.Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"https://w3id.org/edc/v0.0.1/ns/counterPartyAddress": "https://provider.example.com"}
+
+        with mock.patch.object(self.service, '_connector_discovery_controller') as mock_discovery, \
+             mock.patch('tractusx_sdk.dataspace.services.connector.saturn.connector_consumer_service.ModelFactory'):
+            mock_discovery.get_discover.return_value = mock_response
+            first = self.service.discover_connector_protocol(bpnl="BPNL000000000001")
+            second = self.service.discover_connector_protocol(bpnl="BPNL000000000001")
+            self.assertEqual(first, second)
+            mock_discovery.get_discover.assert_called_once()
+
+            self.service.invalidate_discovery(bpnl="BPNL000000000001")
+            self.service.discover_connector_protocol(bpnl="BPNL000000000001")
+            self.assertEqual(mock_discovery.get_discover.call_count, 2)
+
+    def test_discover_connector_protocol_negative_cache(self):
+        """Test an unreachable partner is not requested again while its failure is cached."""
+        self.service.discovery_cache = TtlCache(ttl=300, negative_ttl=30)
+        mock_response = mock.Mock(spec=Response)
+        mock_response.status_code = 502
+
+        with mock.patch.object(self.service, '_connector_discovery_controller') as mock_discovery, \
+             mock.patch('tractusx_sdk.dataspace.services.connector.saturn.connector_consumer_service.ModelFactory'):
+            mock_discovery.get_discover.return_value = mock_response
+            for _ in range(3):
+                with self.assertRaises(ConnectionError):
+                    self.service.discover_connector_protocol(bpnl="BPNL000000000002")
+            mock_discovery.get_discover.assert_called_once()
+
+    def test_prewarm_discovery(self):
+        """Test several BPNLs are discovered in parallel and the failures reported."""
+        self.service.discovery_cache = TtlCache(ttl=300, negative_ttl=30)
+        def get_discover(model):
+            return model
+
+        def discovery_model(dataspace_version, bpnl, counter_party_address):
+            response = mock.Mock(spec=Response)
+            response.status_code = 404 if bpnl == "BPNL_DOWN" else 200
+            response.json.return_value = {"bpnl": bpnl}
+            return response
+
+        with mock.patch.object(self.service, '_connector_discovery_controller') as mock_discovery, \
+             mock.patch('tractusx_sdk.dataspace.services.connector.saturn.connector_consumer_service.ModelFactory') as mock_factory:
+            mock_discovery.get_discover.side_effect = get_discover
+            mock_factory.get_connector_discovery_model.side_effect = discovery_model
+            result = self.service.prewarm_discovery(["BPNL_A", "BPNL_B", "BPNL_DOWN"])
+            self.assertEqual(result, {"BPNL_A": True, "BPNL_B": True, "BPNL_DOWN": False})
+
+            self.assertEqual(self.service.discover_connector_protocol(bpnl="BPNL_A"), {"bpnl": "BPNL_A"})
+            self.assertEqual(mock_discovery.get_discover.call_count, 3)
+
+    def test_discovery_cache_disabled(self):
+        """Test the discovery is requested every time when the cache is disabled, which is the default."""
+        service = self.service
+        self.assertIsNone(service.discovery_cache)
+        mock_response = mock.Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+        with mock.patch.object(service, '_connector_discovery_controller') as mock_discovery, \
+             mock.patch('tractusx_sdk.dataspace.services.connector.saturn.connector_consumer_service.ModelFactory'):
+            mock_discovery.get_discover.return_value = mock_response
+            service.discover_connector_protocol(bpnl="BPNL000000000001")
+            service.discover_connector_protocol(bpnl="BPNL000000000001")
+            self.assertEqual(mock_discovery.get_discover.call_count, 2)
+
+    def test_discovery_cache_is_opt_in(self):
+        """Test the discovery cache is used when enabled or given."""
+        cache = TtlCache(ttl=60)
+        with mock.patch('tractusx_sdk.dataspace.adapters.connector.adapter_factory.AdapterFactory'), \
+             mock.patch('tractusx_sdk.dataspace.controllers.connector.controller_factory.ControllerFactory'):
+            enabled = ConnectorConsumerService(base_url=self.base_url, dma_path=self.dma_path,
+                                               connection_manager=self.mock_connection_manager,
+                                               discovery_cache_enabled=True)
+            given = ConnectorConsumerService(base_url=self.base_url, dma_path=self.dma_path,
+                                             connection_manager=self.mock_connection_manager, discovery_cache=cache)
+        self.assertIsInstance(enabled.discovery_cache, TtlCache)
+        self.assertIs(given.discovery_cache, cache)
+
+    def test_discover_connector_protocol_empty_answer_uses_negative_ttl(self):
+        """Test an empty discovery is only cached as long as a failure."""
+        self.service.discovery_cache = TtlCache(ttl=300, negative_ttl=30)
+        mock_response = mock.Mock(spec=Response)
+        mock_response.status_code = 200
+        mock_response.json.return_value = {}
+
+        with mock.patch.object(self.service, '_connector_discovery_controller') as mock_discovery, \
+             mock.patch('tractusx_sdk.dataspace.services.connector.saturn.connector_consumer_service.ModelFactory'):
+            mock_discovery.get_discover.return_value = mock_response
+            with mock.patch("time.monotonic", return_value=1000.0):
+                self.service.discover_connector_protocol(bpnl="BPNL000000000001")
+                self.service.discover_connector_protocol(bpnl="BPNL000000000001")
+            self.assertEqual(mock_discovery.get_discover.call_count, 1)
+            with mock.patch("time.monotonic", return_value=1031.0):
+                self.service.discover_connector_protocol(bpnl="BPNL000000000001")
+            self.assertEqual(mock_discovery.get_discover.call_count, 2)
+
     def test_get_discovery_info_variations(self):
         """Test get_discovery_info with different protocol and ID combinations."""
         test_cases = [
@@ -947,6 +1074,8 @@ class TestSaturnConnectorConsumerService(TestCase):
         for test_case in test_cases:
             with self.subTest(test_case["name"]):
                 bpnl = "BPNL000000000001"
+                # The same BPNL answers differently in every case, drop the cached discovery
+                self.service.invalidate_discovery(bpnl=bpnl)
                 
                 # Mock discovery response
                 mock_response = mock.Mock(spec=Response)
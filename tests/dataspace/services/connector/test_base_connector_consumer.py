@@ -20,11 +20,25 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+import json
+import threading
+import asyncio
+import time
 import unittest
 
 from tractusx_sdk.dataspace.services.connector.service_factory import ServiceFactory
 from unittest import mock
 import tractusx_sdk.dataspace.services.connector.base_connector_consumer as bcc
+from tractusx_sdk.dataspace.services.connector.polling_strategy import NegotiationEventListener
+from tractusx_sdk.dataspace.managers.catalog_cache_manager import MemoryCatalogCacheManager
+from tractusx_sdk.dataspace.managers.edr_cache_manager import MemoryEdrCacheManager
+from tractusx_sdk.dataspace.managers.connection import AsyncMemoryConnectionManager
+from tractusx_sdk.dataspace.tools.encoding_tools import encode_as_base64_url_safe
+
+
+def build_edr(expires_in: int, endpoint: str = "url") -> dict:
+    payload = encode_as_base64_url_safe(json.dumps({"exp": int(time.time()) + expires_in}))
+    return {"endpoint": endpoint, "authorization": f"header.{payload}.signature"}
 
 class TestBaseConsumerConnectorService(unittest.TestCase):
     def setUp(self):
@@ -121,7 +135,8 @@ class TestBaseConsumerConnectorService(unittest.TestCase):
             headers={},
             connection_manager=None,
             verbose=False,
-            logger=None
+            logger=None,
+            edr_cache_enabled=True
         )
         service._catalog_controller = mock_catalog
         service._edr_controller = mock_edr
@@ -178,6 +193,51 @@ class TestBaseConsumerConnectorService(unittest.TestCase):
         result = service.get_catalog(counter_party_id="bpn", counter_party_address="url")
         self.assertEqual(result, {"catalog": "data"})
 
+    def _create_catalog_cached_service(self):
+        service, mock_catalog, *_ = self.create_mock_service()
+        service.catalog_cache_manager = MemoryCatalogCacheManager(ttl=10, stale_ttl=5)
+        mock_catalog.get_catalog = mock.Mock(
+            return_value=mock.Mock(status_code=200, json=mock.Mock(return_value={"catalog": "data"})))
+        return service, mock_catalog
+
+    def test_get_catalog_served_from_cache(self):
+        service, mock_catalog = self._create_catalog_cached_service()
+        for _ in range(2):
+            result = service.get_catalog_with_filter(counter_party_id="bpn", counter_party_address="url",
+                                                     filter_expression=[{"key": "value"}])
+            self.assertEqual(result, {"catalog": "data"})
+        mock_catalog.get_catalog.assert_called_once()
+        ## A different filter is a different catalog
+        service.get_catalog_with_filter(counter_party_id="bpn", counter_party_address="url",
+                                        filter_expression=[{"key": "other"}])
+        self.assertEqual(mock_catalog.get_catalog.call_count, 2)
+
+    def test_get_catalog_stale_is_revalidated_in_background(self):
+        service, mock_catalog = self._create_catalog_cached_service()
+        service.get_catalog(counter_party_id="bpn", counter_party_address="url")
+        mock_catalog.get_catalog.return_value = mock.Mock(status_code=200, json=mock.Mock(return_value={"catalog": "new"}))
+        with mock.patch.object(bcc.threading, "Thread") as mock_thread, \
+                mock.patch("time.monotonic", return_value=time.monotonic() + 12):
+            mock_thread.side_effect = lambda target, args, daemon: mock.Mock(start=lambda: target(*args))
+            self.assertEqual(service.get_catalog(counter_party_id="bpn", counter_party_address="url"), {"catalog": "data"})
+            self.assertEqual(service.get_catalog(counter_party_id="bpn", counter_party_address="url"), {"catalog": "new"})
+        self.assertEqual(mock_catalog.get_catalog.call_count, 2)
+
+    def test_invalidate_catalogs(self):
+        service, mock_catalog = self._create_catalog_cached_service()
+        service.get_catalog(counter_party_id="bpn", counter_party_address="url")
+        service.invalidate_catalogs(counter_party_id="bpn")
+        service.get_catalog(counter_party_id="bpn", counter_party_address="url")
+        self.assertEqual(mock_catalog.get_catalog.call_count, 2)
+
+    def test_get_catalog_not_cached_by_default(self):
+        service, mock_catalog, *_ = self.create_mock_service()
+        mock_catalog.get_catalog = mock.Mock(
+            return_value=mock.Mock(status_code=200, json=mock.Mock(return_value={"catalog": "data"})))
+        service.get_catalog(counter_party_id="bpn", counter_party_address="url")
+        service.get_catalog(counter_party_id="bpn", counter_party_address="url")
+        self.assertEqual(mock_catalog.get_catalog.call_count, 2)
+
     def test_get_edr_success(self):
         service, _, mock_edr, *_ = self.create_mock_service()
         mock_response = mock.Mock()
@@ -193,6 +253,210 @@ class TestBaseConsumerConnectorService(unittest.TestCase):
         with self.assertRaises(ConnectionError):
             service.get_edr("transfer_id")
 
+    def test_get_edr_serves_cached_data_address(self):
+        service, _, mock_edr, *_ = self.create_mock_service()
+        edr = build_edr(expires_in=300)
+        mock_edr.get_data_address = mock.Mock(return_value=mock.Mock(status_code=200, json=mock.Mock(return_value=edr)))
+        self.assertEqual(service.get_edr("transfer_id"), edr)
+        self.assertEqual(service.get_edr("transfer_id"), edr)
+        mock_edr.get_data_address.assert_called_once()
+
+    def test_get_edr_cache_disabled(self):
+        service = bcc.BaseConnectorConsumerService(
+            dataspace_version="jupiter", base_url="http://test", dma_path="/test", verbose=False,
+            edr_cache_enabled=False
+        )
+        mock_edr = mock.Mock()
+        service._edr_controller = mock_edr
+        mock_edr.get_data_address = mock.Mock(
+            return_value=mock.Mock(status_code=200, json=mock.Mock(return_value=build_edr(expires_in=300))))
+        service.get_edr("transfer_id")
+        service.get_edr("transfer_id")
+        self.assertEqual(mock_edr.get_data_address.call_count, 2)
+
+    def test_get_edr_refreshes_proactively(self):
+        service, _, mock_edr, *_ = self.create_mock_service()
+        old_edr = build_edr(expires_in=300)
+        new_edr = build_edr(expires_in=600, endpoint="new-url")
+        mock_edr.get_data_address = mock.Mock(return_value=mock.Mock(status_code=200, json=mock.Mock(return_value=old_edr)))
+        mock_edr.refresh = mock.Mock(return_value=mock.Mock(status_code=200, json=mock.Mock(return_value=new_edr)))
+        service.get_edr("transfer_id")
+        with mock.patch.object(bcc.threading, "Thread") as mock_thread, \
+                mock.patch("time.time", return_value=time.time() + 280):
+            mock_thread.side_effect = lambda target, args, daemon: mock.Mock(start=lambda: target(*args))
+            ## The still valid data address is served while it is being refreshed
+            self.assertEqual(service.get_edr("transfer_id"), old_edr)
+            self.assertEqual(service.get_edr("transfer_id"), new_edr)
+        mock_edr.refresh.assert_called_once_with(oid="transfer_id")
+        mock_edr.get_data_address.assert_called_once()
+
+    def test_get_edr_failed_refresh_keeps_cached_data_address(self):
+        service, _, mock_edr, *_ = self.create_mock_service()
+        old_edr = build_edr(expires_in=300)
+        mock_edr.get_data_address = mock.Mock(return_value=mock.Mock(status_code=200, json=mock.Mock(return_value=old_edr)))
+        mock_edr.refresh = mock.Mock(side_effect=ConnectionError("down"))
+        service.get_edr("transfer_id")
+        with mock.patch.object(bcc.threading, "Thread") as mock_thread, \
+                mock.patch("time.time", return_value=time.time() + 280):
+            mock_thread.side_effect = lambda target, args, daemon: mock.Mock(start=lambda: target(*args))
+            self.assertEqual(service.get_edr("transfer_id"), old_edr)
+            self.assertEqual(service.get_edr("transfer_id"), old_edr)
+        self.assertEqual(mock_edr.refresh.call_count, 2)
+
+    def test_invalidate_edr(self):
+        service, _, mock_edr, *_ = self.create_mock_service()
+        mock_edr.get_data_address = mock.Mock(
+            return_value=mock.Mock(status_code=200, json=mock.Mock(return_value=build_edr(expires_in=300))))
+        service.get_edr("transfer_id")
+        service.invalidate_edr("transfer_id")
+        service.get_edr("transfer_id")
+        self.assertEqual(mock_edr.get_data_address.call_count, 2)
+
+    def test_edr_cache_is_opt_in(self):
+        service = bcc.BaseConnectorConsumerService(dataspace_version="jupiter", base_url="http://test",
+                                                   dma_path="/test", verbose=False)
+        self.assertIsNone(service.edr_cache_manager)
+        edr_cache_manager = MemoryEdrCacheManager()
+        service = bcc.BaseConnectorConsumerService(dataspace_version="jupiter", base_url="http://test",
+                                                   dma_path="/test", verbose=False, edr_cache_manager=edr_cache_manager)
+        self.assertIs(service.edr_cache_manager, edr_cache_manager)
+
+    def test_delete_connection_invalidates_cached_edr(self):
+        service, _, mock_edr, *_ = self.create_mock_service()
+        mock_edr.get_data_address = mock.Mock(
+            return_value=mock.Mock(status_code=200, json=mock.Mock(return_value=build_edr(expires_in=300))))
+        query_checksum, policy_checksum = service.get_connection_checksums(filter_expression=[{"key": "value"}])
+        service.connection_manager.add_connection("bpn", "url", query_checksum, policy_checksum,
+                                                  {"@type": "EndpointDataReferenceEntry", "@context": {},
+                                                   "transferProcessId": "transfer-1", "providerId": "bpn"})
+        service.get_edr("transfer-1")
+
+        self.assertTrue(service.delete_connection(counter_party_id="bpn", counter_party_address="url",
+                                                  filter_expression=[{"key": "value"}]))
+        self.assertIsNone(service.connection_manager.get_connection_transfer_id("bpn", "url", query_checksum, policy_checksum))
+        self.assertIsNone(service.edr_cache_manager.get("transfer-1"))
+        self.assertFalse(service.delete_connection(counter_party_id="bpn", counter_party_address="url",
+                                                   filter_expression=[{"key": "value"}]))
+
+    def test_negotiation_invalidates_cached_edr_of_transfer(self):
+        service, _, mock_edr, *_ = self.create_mock_service()
+        mock_edr.get_data_address = mock.Mock(
+            return_value=mock.Mock(status_code=200, json=mock.Mock(return_value=build_edr(expires_in=300))))
+        service.get_edr("transfer-1")
+        service.negotiate_and_transfer = mock.Mock(return_value={"@type": "EndpointDataReferenceEntry", "@context": {},
+                                                                 "transferProcessId": "transfer-1", "providerId": "bpn"})
+
+        self.assertEqual(service.get_transfer_id(counter_party_id="bpn", counter_party_address="url",
+                                                 filter_expression=[]), "transfer-1")
+        self.assertIsNone(service.edr_cache_manager.get("transfer-1"))
+
+    def test_release_evicted_edr(self):
+        service, _, mock_edr, *_ = self.create_mock_service()
+        mock_edr.delete = mock.Mock(return_value=mock.Mock(status_code=204))
+        service.release_evicted_edr("bpn", "url", "query", "policy", {"transferProcessId": "transfer-1"})
+        mock_edr.delete.assert_called_once_with(oid="transfer-1")
+
+        mock_edr.delete.return_value = mock.Mock(status_code=500)
+        with self.assertRaises(ConnectionError):
+            service.release_evicted_edr("bpn", "url", "query", "policy", {"transferProcessId": "transfer-1"})
+
+    def test_get_transfer_id_negotiates_once_for_concurrent_requests(self):
+        service, *_ = self.create_mock_service()
+        started = threading.Event()
+        release = threading.Event()
+
+        def negotiate_and_transfer(**kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return {"@id": "transfer-1", "@type": "EndpointDataReferenceEntry", "@context": {},
+                    "transferProcessId": "transfer-1", "providerId": "bpn"}
+
+        service.negotiate_and_transfer = mock.Mock(side_effect=negotiate_and_transfer)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(service.get_transfer_id(
+            counter_party_id="bpn", counter_party_address="url", filter_expression=[{"key": "value"}], policies=[])))
+            for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        started.wait(timeout=5)
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(results, ["transfer-1"] * 4)
+        service.negotiate_and_transfer.assert_called_once()
+
+    def test_get_transfer_id_rechecks_connection_inside_negotiation_lock(self):
+        service, *_ = self.create_mock_service()
+        connection_manager = mock.MagicMock()
+        ## Not found before the lock, found once another process released it
+        connection_manager.get_connection_transfer_id.side_effect = [None, "transfer-from-other-process"]
+        service.connection_manager = connection_manager
+        service.negotiate_and_transfer = mock.Mock()
+
+        result = service.get_transfer_id(counter_party_id="bpn", counter_party_address="url",
+                                         filter_expression=[], policies=[])
+
+        self.assertEqual(result, "transfer-from-other-process")
+        connection_manager.negotiation_lock.assert_called_once()
+        connection_manager.negotiation_lock.return_value.__enter__.assert_called_once()
+        service.negotiate_and_transfer.assert_not_called()
+
+    def test_wait_for_edr_entry_uses_polling_strategy(self):
+        service, *_ = self.create_mock_service()
+        service.get_edr_entry = mock.Mock(side_effect=[None, {"transferProcessId": "transfer-1"}])
+        strategy = bcc.PollingStrategy(initial_delay=0, jitter=0)
+        self.assertEqual(service.wait_for_edr_entry("negotiation-1", polling_strategy=strategy),
+                         {"transferProcessId": "transfer-1"})
+        self.assertEqual(service.get_edr_entry.call_count, 2)
+
+    def test_negotiate_and_transfer_legacy_retries_use_fixed_interval(self):
+        service, *_ = self.create_mock_service()
+        strategy = service._get_polling_strategy(max_retries=3, timeout=5)
+        self.assertEqual(strategy.max_attempts, 3)
+        self.assertEqual(list(zip(range(2), strategy.delays())), [(0, 5), (1, 5)])
+        self.assertIs(service._get_polling_strategy(), service.polling_strategy)
+
+    def test_handle_negotiation_event(self):
+        listener = NegotiationEventListener()
+        service = bcc.BaseConnectorConsumerService(
+            dataspace_version="jupiter", base_url="http://test", dma_path="/test", verbose=False,
+            polling_strategy=bcc.PollingStrategy(event_listener=listener)
+        )
+        event = listener.get_event("negotiation-1")
+        service.handle_negotiation_event({"payload": {"contractNegotiationId": "negotiation-1"}})
+        self.assertTrue(event.is_set())
+
+    def test_get_catalogs_with_filter_skips_failed_edcs(self):
+        service, *_ = self.create_mock_service()
+
+        def get_catalog_with_filter(counter_party_id, counter_party_address, filter_expression, timeout):
+            if counter_party_address == "edc-down":
+                raise ConnectionError("down")
+            return {"catalog": counter_party_address}
+
+        service.get_catalog_with_filter = mock.Mock(side_effect=get_catalog_with_filter)
+        catalogs = service.get_catalogs_with_filter(counter_party_id="bpn", edcs=["edc-1", "edc-down", "edc-2", "edc-1"],
+                                                    filter_expression=[])
+        self.assertEqual(catalogs, {"edc-1": {"catalog": "edc-1"}, "edc-2": {"catalog": "edc-2"}})
+        self.assertEqual(service.get_catalog_with_filter.call_count, 3)
+
+    def test_iter_catalogs_with_filter_respects_deadline(self):
+        service, *_ = self.create_mock_service()
+        release = threading.Event()
+
+        def get_catalog_with_filter(counter_party_id, counter_party_address, filter_expression, timeout):
+            if counter_party_address == "edc-slow":
+                release.wait(timeout=5)
+            return {"catalog": counter_party_address}
+
+        service.get_catalog_with_filter = mock.Mock(side_effect=get_catalog_with_filter)
+        results = list(service.iter_catalogs_with_filter(counter_party_id="bpn", edcs=["edc-slow", "edc-fast"],
+                                                         filter_expression=[], deadline=0.2))
+        release.set()
+        self.assertEqual(results, [("edc-fast", {"catalog": "edc-fast"})])
+
     def test_get_endpoint_with_token_success(self):
         service, *_ = self.create_mock_service()
         service.get_edr = mock.Mock(return_value={"endpoint": "url", "authorization": "token"})
@@ -276,3 +540,153 @@ class TestBaseConsumerConnectorService(unittest.TestCase):
         service, *_ = self.create_mock_service()
         headers = service.get_data_plane_headers("token", content_type="application/xml")
         self.assertEqual(headers["Content-Type"], "application/xml")
+
+
+class TestBaseConsumerConnectorServiceAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.service = bcc.BaseConnectorConsumerService(
+            dataspace_version="jupiter",
+            base_url="http://test",
+            dma_path="/test",
+            headers={"X-Api-Key": "secret"},
+            verbose=False,
+            edr_cache_enabled=True
+        )
+
+    def test_async_controllers_are_built_lazily(self):
+        self.assertIsNone(self.service._async_controllers)
+        edrs = self.service.async_edrs
+        self.assertIsNotNone(edrs)
+        self.assertEqual(self.service.async_dma_adapter.base_url, "http://test/test")
+        self.assertIs(edrs, self.service.async_edrs)
+
+    async def test_get_edr_async_success(self):
+        mock_response = mock.Mock(status_code=200)
+        mock_response.json.return_value = {"endpoint": "url", "authorization": "token"}
+        self.service._async_controllers = {bcc.ControllerType.EDR: mock.Mock(
+            get_data_address=mock.AsyncMock(return_value=mock_response))}
+
+        endpoint, token = await self.service.get_endpoint_with_token_async("transfer_id")
+        self.assertEqual((endpoint, token), ("url", "token"))
+
+    async def test_get_edr_async_serves_cached_data_address(self):
+        edr = build_edr(expires_in=300)
+        get_data_address = mock.AsyncMock(return_value=mock.Mock(status_code=200, json=mock.Mock(return_value=edr)))
+        self.service._async_controllers = {bcc.ControllerType.EDR: mock.Mock(get_data_address=get_data_address)}
+        self.assertEqual(await self.service.get_edr_async("transfer_id"), edr)
+        self.assertEqual(await self.service.get_edr_async("transfer_id"), edr)
+        get_data_address.assert_awaited_once()
+
+    async def test_get_edr_async_failure(self):
+        self.service._async_controllers = {bcc.ControllerType.EDR: mock.Mock(
+            get_data_address=mock.AsyncMock(return_value=None))}
+
+        with self.assertRaises(ConnectionError):
+            await self.service.get_edr_async("transfer_id")
+
+    async def test_get_catalog_async_success(self):
+        mock_response = mock.Mock(status_code=200)
+        mock_response.json.return_value = {"catalog": "data"}
+        self.service._async_controllers = {bcc.ControllerType.CATALOG: mock.Mock(
+            get_catalog=mock.AsyncMock(return_value=mock_response))}
+
+        result = await self.service.get_catalog_async(counter_party_id="bpn", counter_party_address="url")
+        self.assertEqual(result, {"catalog": "data"})
+
+    async def test_get_catalog_async_uses_catalog_cache(self):
+        self.service.catalog_cache_manager = MemoryCatalogCacheManager(ttl=10, stale_ttl=5)
+        get_catalog = mock.AsyncMock(return_value=mock.Mock(status_code=200, json=mock.Mock(return_value={"catalog": "data"})))
+        self.service._async_controllers = {bcc.ControllerType.CATALOG: mock.Mock(get_catalog=get_catalog)}
+
+        for _ in range(2):
+            result = await self.service.get_catalog_async(counter_party_id="bpn", counter_party_address="url")
+            self.assertEqual(result, {"catalog": "data"})
+        get_catalog.assert_awaited_once()
+        ## The catalogs requested synchronously and asynchronously share the cache
+        self.assertEqual(len(self.service.catalog_cache_manager._entries), 1)
+
+    async def test_get_catalog_async_stale_is_revalidated_in_background(self):
+        self.service.catalog_cache_manager = MemoryCatalogCacheManager(ttl=10, stale_ttl=5)
+        get_catalog = mock.AsyncMock(return_value=mock.Mock(status_code=200, json=mock.Mock(return_value={"catalog": "data"})))
+        self.service._async_controllers = {bcc.ControllerType.CATALOG: mock.Mock(get_catalog=get_catalog)}
+        await self.service.get_catalog_async(counter_party_id="bpn", counter_party_address="url")
+
+        get_catalog.return_value = mock.Mock(status_code=200, json=mock.Mock(return_value={"catalog": "new"}))
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 12):
+            result = await self.service.get_catalog_async(counter_party_id="bpn", counter_party_address="url")
+            self.assertEqual(result, {"catalog": "data"})
+            await asyncio.gather(*self.service._catalog_revalidations)
+            result = await self.service.get_catalog_async(counter_party_id="bpn", counter_party_address="url")
+            self.assertEqual(result, {"catalog": "new"})
+        self.assertEqual(get_catalog.await_count, 2)
+
+    async def test_do_get_async(self):
+        self.service.get_transfer_id = mock.Mock(return_value="transfer_id")
+        self.service.get_endpoint_with_token_async = mock.AsyncMock(return_value=("http://dataplane", "token"))
+
+        with mock.patch.object(bcc.AsyncHttpTools, "do_get", new_callable=mock.AsyncMock) as mock_do_get:
+            mock_do_get.return_value = mock.Mock(status_code=200)
+            response = await self.service.do_get_async(counter_party_id="bpn", counter_party_address="url",
+                                                       filter_expression=[], path="/data", headers={"X-Test": "1"})
+
+        self.assertEqual(response.status_code, 200)
+        self.service.get_transfer_id.assert_called_once()
+        kwargs = mock_do_get.call_args.kwargs
+        self.assertEqual(kwargs["url"], "http://dataplane/data")
+        self.assertEqual(kwargs["headers"]["Authorization"], "token")
+        self.assertEqual(kwargs["headers"]["X-Test"], "1")
+
+    async def test_get_transfer_id_async_uses_async_connection_manager(self):
+        self.service.async_connection_manager = AsyncMemoryConnectionManager()
+        self.service.get_transfer_id = mock.Mock()
+        query_checksum, policy_checksum = self.service.get_connection_checksums(filter_expression=[])
+        await self.service.async_connection_manager.add_connection(
+            "bpn", "url", query_checksum, policy_checksum,
+            {"@type": "EndpointDataReferenceEntry", "@context": {}, "transferProcessId": "transfer-1", "providerId": "bpn"})
+
+        with mock.patch.object(bcc.asyncio, "to_thread", new_callable=mock.AsyncMock) as mock_to_thread:
+            transfer_id = await self.service.get_transfer_id_async(counter_party_id="bpn", counter_party_address="url",
+                                                                   filter_expression=[])
+        self.assertEqual(transfer_id, "transfer-1")
+        mock_to_thread.assert_not_awaited()
+        self.service.get_transfer_id.assert_not_called()
+
+    async def test_get_transfer_id_async_negotiates_once_in_a_thread(self):
+        self.service.async_connection_manager = AsyncMemoryConnectionManager()
+        negotiated_in = []
+
+        def negotiate_and_transfer(**kwargs):
+            negotiated_in.append(threading.current_thread())
+            return {"@type": "EndpointDataReferenceEntry", "@context": {}, "transferProcessId": "transfer-1",
+                    "providerId": "bpn"}
+
+        self.service.negotiate_and_transfer = mock.Mock(side_effect=negotiate_and_transfer)
+        results = await asyncio.gather(*(self.service.get_transfer_id_async(counter_party_id="bpn", counter_party_address="url",
+                                                                             filter_expression=[]) for _ in range(3)))
+
+        self.assertEqual(results, ["transfer-1"] * 3)
+        self.service.negotiate_and_transfer.assert_called_once()
+        self.assertIsNot(negotiated_in[0], threading.main_thread())
+        query_checksum, policy_checksum = self.service.get_connection_checksums(filter_expression=[])
+        self.assertEqual(await self.service.async_connection_manager.get_connection_transfer_id(
+            "bpn", "url", query_checksum, policy_checksum), "transfer-1")
+
+    async def test_do_post_async(self):
+        self.service.get_transfer_id = mock.Mock(return_value="transfer_id")
+        self.service.get_endpoint_with_token_async = mock.AsyncMock(return_value=("http://dataplane", "token"))
+
+        with mock.patch.object(bcc.AsyncHttpTools, "do_post", new_callable=mock.AsyncMock) as mock_do_post:
+            await self.service.do_post_async(counter_party_id="bpn", counter_party_address="url",
+                                             filter_expression=[], json={"a": 1})
+
+        kwargs = mock_do_post.call_args.kwargs
+        self.assertEqual(kwargs["json"], {"a": 1})
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+
+    async def test_do_put_async_raises_without_dataplane(self):
+        self.service.get_transfer_id = mock.Mock(return_value="transfer_id")
+        self.service.get_endpoint_with_token_async = mock.AsyncMock(return_value=(None, None))
+
+        with self.assertRaises(RuntimeError):
+            await self.service.do_put_async(counter_party_id="bpn", counter_party_address="url", filter_expression=[])
+
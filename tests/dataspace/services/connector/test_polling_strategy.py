@@ -0,0 +1,124 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from tractusx_sdk.dataspace.services.connector.polling_strategy import PollingStrategy, NegotiationEventListener
+
+
+class TestPollingStrategy(unittest.TestCase):
+
+    def test_first_poll_is_immediate(self):
+        strategy = PollingStrategy(initial_delay=5)
+        with mock.patch("time.sleep") as mock_sleep:
+            self.assertEqual(strategy.poll(lambda: "entry"), "entry")
+        mock_sleep.assert_not_called()
+
+    def test_exponential_backoff_capped(self):
+        strategy = PollingStrategy(initial_delay=1, max_delay=4, multiplier=2, jitter=0)
+        delays = strategy.delays()
+        self.assertEqual([next(delays) for _ in range(5)], [1, 2, 4, 4, 4])
+
+    def test_jitter_stays_in_range(self):
+        strategy = PollingStrategy(initial_delay=1, multiplier=1, jitter=0.5)
+        delays = strategy.delays()
+        for _ in range(50):
+            self.assertTrue(0.5 <= next(delays) <= 1.5)
+
+    def test_polls_until_result(self):
+        results = iter([None, None, "entry"])
+        strategy = PollingStrategy(initial_delay=0.1, jitter=0)
+        with mock.patch("time.sleep") as mock_sleep:
+            self.assertEqual(strategy.poll(lambda: next(results)), "entry")
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [0.1, 0.2])
+
+    def test_max_attempts(self):
+        fetch = mock.Mock(return_value=None)
+        strategy = PollingStrategy.fixed(interval=10, max_attempts=3)
+        with mock.patch("time.sleep") as mock_sleep:
+            self.assertIsNone(strategy.poll(fetch))
+        self.assertEqual(fetch.call_count, 3)
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [10, 10])
+
+    def test_deadline_limits_total_wait(self):
+        fetch = mock.Mock(return_value=None)
+        strategy = PollingStrategy(initial_delay=0.02, multiplier=1, jitter=0, deadline=0.1)
+        started = time.monotonic()
+        self.assertIsNone(strategy.poll(fetch))
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertGreater(fetch.call_count, 1)
+
+    def test_requires_a_limit(self):
+        with self.assertRaises(ValueError):
+            PollingStrategy(deadline=None, max_attempts=None)
+
+    def test_on_retry_callback(self):
+        on_retry = mock.Mock()
+        strategy = PollingStrategy.fixed(interval=0, max_attempts=2)
+        strategy.poll(lambda: None, on_retry=on_retry)
+        on_retry.assert_called_once_with(1, 0)
+
+
+class TestNegotiationEventListener(unittest.TestCase):
+
+    def test_notification_interrupts_the_wait(self):
+        listener = NegotiationEventListener()
+        strategy = PollingStrategy(initial_delay=30, jitter=0, deadline=60, event_listener=listener)
+        results = iter([None, "entry"])
+        polled = threading.Event()
+
+        def fetch():
+            polled.set()
+            return next(results)
+
+        notifier = threading.Thread(target=lambda: (polled.wait(timeout=5), time.sleep(0.05), listener.handle_event(
+            {"type": "ContractNegotiationFinalized", "payload": {"contractNegotiationId": "negotiation-1"}})))
+        notifier.start()
+        started = time.monotonic()
+        self.assertEqual(strategy.poll(fetch, key="negotiation-1"), "entry")
+        notifier.join(timeout=5)
+        self.assertLess(time.monotonic() - started, 5)
+        ## The event is released once the negotiation is no longer awaited
+        self.assertEqual(listener._events, {})
+
+    def test_event_without_negotiation_id_wakes_everyone(self):
+        listener = NegotiationEventListener()
+        first = listener.get_event("negotiation-1")
+        second = listener.get_event("negotiation-2")
+        listener.handle_event({"type": "TransferProcessStarted", "payload": {"transferProcessId": "transfer-1"}})
+        self.assertTrue(first.is_set())
+        self.assertTrue(second.is_set())
+
+    def test_notify_specific_negotiation(self):
+        listener = NegotiationEventListener()
+        first = listener.get_event("negotiation-1")
+        second = listener.get_event("negotiation-2")
+        listener.notify("negotiation-2")
+        self.assertFalse(first.is_set())
+        self.assertTrue(second.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
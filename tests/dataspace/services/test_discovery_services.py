@@ -21,6 +21,8 @@
 #################################################################################
 
 import pytest
+import threading
+import time
 from unittest import mock
 from tractusx_sdk.dataspace.services.discovery.discovery_finder_service import DiscoveryFinderService
 from tractusx_sdk.dataspace.services.discovery.connector_discovery_service import ConnectorDiscoveryService
@@ -328,3 +330,201 @@ class TestConnectorDiscoveryService:
             
             assert service.connector_discovery_key == "customKey"
             assert service.cache_timeout_seconds == 3600
+
+
+class TestConnectorDiscoveryServiceBatches:
+
+    @pytest.fixture
+    def batch_service(self, mock_oauth, mock_discovery_finder):
+        service = ConnectorDiscoveryService(
+            oauth=mock_oauth,
+            discovery_finder_service=mock_discovery_finder,
+            batch_size=2,
+            connector_cache_enabled=True
+        )
+        with mock.patch.object(ConnectorDiscoveryService, '_get_or_update_discovery_url',
+                               return_value="https://connector-discovery.example.com"):
+            yield service
+
+    @staticmethod
+    def discovery_response(json, status_code=200):
+        return mock.Mock(status_code=status_code, json=mock.Mock(return_value=[
+            {"bpn": bpn, "connectorEndpoint": [f"https://{bpn.lower()}.example.com/api/v1/dsp"]} for bpn in json
+            if bpn != "BPNL_UNKNOWN"
+        ]))
+
+    @mock.patch("tractusx_sdk.dataspace.services.discovery.connector_discovery_service.HttpTools")
+    def test_find_connectors_by_bpns_batches_and_caches(self, mock_http, batch_service, mock_oauth):
+        mock_http.do_post.side_effect = lambda url, headers, json: self.discovery_response(json)
+        bpns = ["BPNL1", "BPNL2", "BPNL3", "BPNL_UNKNOWN", "BPNL1"]
+
+        result = batch_service.find_connectors_by_bpns(bpns)
+
+        assert result == {
+            "BPNL1": ["https://bpnl1.example.com/api/v1/dsp"],
+            "BPNL2": ["https://bpnl2.example.com/api/v1/dsp"],
+            "BPNL3": ["https://bpnl3.example.com/api/v1/dsp"],
+            "BPNL_UNKNOWN": None
+        }
+        sent = sorted(call.kwargs["json"] for call in mock_http.do_post.call_args_list)
+        assert sent == [["BPNL1", "BPNL2"], ["BPNL3", "BPNL_UNKNOWN"]]
+        mock_oauth.add_auth_header.assert_called_once()
+
+        ## The single BPN lookup reads the same cache
+        assert batch_service.find_connector_by_bpn("BPNL2") == ["https://bpnl2.example.com/api/v1/dsp"]
+        assert batch_service.find_connector_by_bpn("BPNL_UNKNOWN") is None
+        assert mock_http.do_post.call_count == 2
+
+        batch_service.invalidate_connectors("BPNL2")
+        batch_service.find_connectors_by_bpns(["BPNL1", "BPNL2"])
+        assert mock_http.do_post.call_args.kwargs["json"] == ["BPNL2"]
+
+    @mock.patch("tractusx_sdk.dataspace.services.discovery.connector_discovery_service.HttpTools")
+    def test_find_connectors_by_bpns_failed_batch(self, mock_http, batch_service):
+        mock_http.do_post.side_effect = lambda url, headers, json: self.discovery_response(
+            json, status_code=500 if "BPNL3" in json else 200)
+
+        with pytest.raises(Exception, match="response was not successful"):
+            batch_service.find_connectors_by_bpns(["BPNL1", "BPNL2", "BPNL3"])
+
+        ## Only the failed batch is requested again
+        mock_http.do_post.side_effect = lambda url, headers, json: self.discovery_response(json)
+        mock_http.do_post.reset_mock()
+        result = batch_service.find_connectors_by_bpns(["BPNL1", "BPNL2", "BPNL3"])
+        assert set(result) == {"BPNL1", "BPNL2", "BPNL3"}
+        mock_http.do_post.assert_called_once()
+        assert mock_http.do_post.call_args.kwargs["json"] == ["BPNL3"]
+
+    @mock.patch("tractusx_sdk.dataspace.services.discovery.connector_discovery_service.HttpTools")
+    def test_connectors_are_not_cached_by_default(self, mock_http, mock_oauth, mock_discovery_finder):
+        mock_http.do_post.side_effect = lambda url, headers, json: self.discovery_response(json)
+        service = ConnectorDiscoveryService(oauth=mock_oauth, discovery_finder_service=mock_discovery_finder)
+        assert service.connector_cache is None
+
+        with mock.patch.object(ConnectorDiscoveryService, '_get_or_update_discovery_url',
+                               return_value="https://connector-discovery.example.com"):
+            service.find_connectors_by_bpns(["BPNL1"])
+            service.find_connectors_by_bpns(["BPNL1"])
+        assert mock_http.do_post.call_count == 2
+
+
+class TestDiscoveryUrlCache:
+
+    @pytest.fixture
+    def service(self, mock_oauth, mock_discovery_finder):
+        return ConnectorDiscoveryService(
+            oauth=mock_oauth,
+            discovery_finder_service=mock_discovery_finder,
+            cache_timeout_seconds=100
+        )
+
+    def test_concurrent_misses_share_one_request(self, service):
+        release = threading.Event()
+
+        def slow_discovery(discovery_finder_service, discovery_key):
+            release.wait(timeout=2)
+            return "https://connector-discovery.example.com"
+
+        results = []
+        with mock.patch.object(service, "get_discovery_url", side_effect=slow_discovery) as get_discovery_url:
+            threads = [threading.Thread(target=lambda: results.append(service._get_or_update_discovery_url())) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.05)
+            release.set()
+            for thread in threads:
+                thread.join(timeout=2)
+
+        assert results == ["https://connector-discovery.example.com"] * 8
+        get_discovery_url.assert_called_once()
+
+    @mock.patch("tractusx_sdk.dataspace.services.discovery.base_discovery_service.threading.Thread")
+    def test_url_is_refreshed_ahead_in_the_background(self, mock_thread, service):
+        mock_thread.side_effect = lambda target, args, daemon: mock.Mock(start=lambda: target(*args))
+        service.discovery_cache = {"bpn": {"url": "https://old.example.com", "timestamp": time.time() - 95}}
+
+        with mock.patch.object(service, "get_discovery_url", return_value="https://new.example.com"), \
+                mock.patch("random.random", return_value=0.6):
+            assert service._get_or_update_discovery_url() == "https://old.example.com"
+
+        assert service.discovery_cache["bpn"]["url"] == "https://new.example.com"
+
+    @mock.patch("tractusx_sdk.dataspace.services.discovery.base_discovery_service.threading.Thread")
+    def test_url_is_not_refreshed_ahead_early_in_its_life(self, mock_thread, service):
+        service.discovery_cache = {"bpn": {"url": "https://old.example.com", "timestamp": time.time() - 95}}
+
+        ## 5 seconds left of a 10 seconds window, a draw below one half does not refresh
+        with mock.patch("random.random", return_value=0.4):
+            assert service._get_or_update_discovery_url() == "https://old.example.com"
+        service.discovery_cache["bpn"] = {"url": "https://old.example.com", "timestamp": time.time() - 50}
+        with mock.patch("random.random", return_value=0.99):
+            assert service._get_or_update_discovery_url() == "https://old.example.com"
+
+        mock_thread.assert_not_called()
+
+
+class TestDiscoveryFinderPrefetch:
+
+    @staticmethod
+    def finder_response(types):
+        return mock.Mock(status_code=200, json=mock.Mock(return_value={"endpoints": [
+            {"type": key, "endpointAddress": f"https://{key.lower()}.example.com"} for key in types
+        ]}))
+
+    @mock.patch("tractusx_sdk.dataspace.services.discovery.discovery_finder_service.HttpTools")
+    def test_discovery_services_share_one_finder_request(self, mock_http, mock_oauth):
+        from tractusx_sdk.industry.services.discovery.bpn_discovery_service import BpnDiscoveryService
+
+        mock_http.do_post.side_effect = lambda url, headers, json: self.finder_response(json["types"])
+        finder = DiscoveryFinderService(url="https://discovery.example.com", oauth=mock_oauth)
+        connector_service = ConnectorDiscoveryService(oauth=mock_oauth, discovery_finder_service=finder)
+        bpn_service = BpnDiscoveryService(oauth=mock_oauth, discovery_finder_service=finder)
+
+        assert connector_service._get_or_update_discovery_url() == "https://bpn.example.com"
+        assert bpn_service._get_or_update_discovery_url().startswith("https://manufacturerpartid.example.com/")
+
+        mock_http.do_post.assert_called_once()
+        assert mock_http.do_post.call_args.kwargs["json"] == {"types": ["bpn", "manufacturerPartId"]}
+
+    @mock.patch("tractusx_sdk.dataspace.services.discovery.discovery_finder_service.HttpTools")
+    def test_expired_urls_are_resolved_again_together(self, mock_http, mock_oauth):
+        mock_http.do_post.side_effect = lambda url, headers, json: self.finder_response(json["types"])
+        finder = DiscoveryFinderService(url="https://discovery.example.com", oauth=mock_oauth,
+                                        discovery_keys=["bpn", "manufacturerPartId"], cache_ttl=60)
+        finder.prefetch()
+
+        assert finder.get_discovery_urls(keys=["bpn"]) == {"bpn": "https://bpn.example.com"}
+        assert mock_http.do_post.call_count == 1
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+            assert finder.get_discovery_urls(keys=["digitalTwinRegistry"]) == {
+                "digitalTwinRegistry": "https://digitaltwinregistry.example.com"}
+        assert mock_http.do_post.call_args.kwargs["json"] == {"types": ["bpn", "manufacturerPartId", "digitalTwinRegistry"]}
+
+    @mock.patch("tractusx_sdk.dataspace.services.discovery.discovery_finder_service.HttpTools")
+    def test_unknown_types_are_cached_negatively(self, mock_http, mock_oauth):
+        mock_http.do_post.side_effect = lambda url, headers, json: self.finder_response(
+            [key for key in json["types"] if key != "unknownType"])
+        finder = DiscoveryFinderService(url="https://discovery.example.com", oauth=mock_oauth,
+                                        discovery_keys=["bpn"], unknown_cache_ttl=30)
+
+        for _ in range(3):
+            assert finder.get_discovery_urls(keys=["unknownType"]) == {}
+        ## The unknown type was registered before the request was sent, no second request is needed
+        mock_http.do_post.assert_called_once()
+        assert finder.get_discovery_urls(keys=["bpn"]) == {"bpn": "https://bpn.example.com"}
+
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 31):
+            assert finder.get_discovery_urls(keys=["unknownType"]) == {}
+        assert mock_http.do_post.call_count == 2
+
+    @mock.patch("tractusx_sdk.dataspace.services.discovery.discovery_finder_service.HttpTools")
+    def test_keys_registered_during_a_request_are_requested_again(self, mock_http, mock_oauth):
+        mock_http.do_post.side_effect = lambda url, headers, json: self.finder_response(json["types"])
+        finder = DiscoveryFinderService(url="https://discovery.example.com", oauth=mock_oauth, discovery_keys=["bpn"])
+        ## Joins a shared request which was sent before the key was registered
+        finder._prefetches = mock.Mock(do=mock.Mock(return_value=({"bpn"}, {"bpn": "https://bpn.example.com"})))
+
+        assert finder.get_discovery_urls(keys=["manufacturerPartId"]) == {
+            "manufacturerPartId": "https://manufacturerpartid.example.com"}
+        mock_http.do_post.assert_called_once()
+        assert mock_http.do_post.call_args.kwargs["json"] == {"types": ["bpn", "manufacturerPartId"]}
@@ -0,0 +1,100 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+import unittest
+import httpx
+
+from tractusx_sdk.dataspace.tools.async_http_tools import AsyncHttpTools
+
+
+class TestAsyncHttpTools(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.test_url = "https://example.com/api/data"
+        self.requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request):
+            self.requests.append(request)
+            return httpx.Response(200, json={"message": "success"})
+
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        await AsyncHttpTools.aclose()
+
+    async def test_do_get_success(self):
+        response = await AsyncHttpTools.do_get(self.test_url, params={"a": "b"}, client=self.client)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"message": "success"})
+        self.assertEqual(str(self.requests[0].url), self.test_url + "?a=b")
+
+    async def test_do_post_json(self):
+        await AsyncHttpTools.do_post(self.test_url, json={"key": "value"}, client=self.client)
+        self.assertEqual(self.requests[0].method, "POST")
+        self.assertEqual(self.requests[0].content, b'{"key": "value"}')
+
+    async def test_do_put_raw_data(self):
+        await AsyncHttpTools.do_put(self.test_url, data="raw", client=self.client)
+        self.assertEqual(self.requests[0].method, "PUT")
+        self.assertEqual(self.requests[0].content, b"raw")
+
+    async def test_do_delete(self):
+        await AsyncHttpTools.do_delete(self.test_url, client=self.client)
+        self.assertEqual(self.requests[0].method, "DELETE")
+
+    def test_get_request_kwargs_translates_requests_arguments(self):
+        kwargs = AsyncHttpTools.get_request_kwargs(data={"form": "value"}, params={"a": "b"}, allow_redirects=True)
+        self.assertEqual(kwargs, {"params": {"a": "b"}, "follow_redirects": True, "data": {"form": "value"}})
+
+    async def test_get_client_is_shared_per_verify_mode(self):
+        client = AsyncHttpTools.get_client(verify=True)
+        self.assertIs(client, AsyncHttpTools.get_client(verify=True))
+        self.assertIsNot(client, AsyncHttpTools.get_client(verify=False))
+
+    async def test_aclose_recreates_client(self):
+        client = AsyncHttpTools.get_client()
+        await AsyncHttpTools.aclose()
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(client, AsyncHttpTools.get_client())
+
+    async def test_get_client_is_not_shared_across_event_loops(self):
+        client = AsyncHttpTools.get_client()
+
+        async def other_loop_client():
+            return AsyncHttpTools.get_client()
+
+        other_client = await asyncio.to_thread(asyncio.run, other_loop_client())
+        self.assertIsNot(client, other_client)
+        self.assertIs(client, AsyncHttpTools.get_client())
+
+    async def test_clients_of_closed_loops_are_dropped(self):
+        async def other_loop_client():
+            return AsyncHttpTools.get_client()
+
+        await asyncio.to_thread(asyncio.run, other_loop_client())
+        AsyncHttpTools.get_client()
+        self.assertEqual([entry[0] for entry in AsyncHttpTools._clients.values()], [asyncio.get_running_loop()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+import unittest
+
+from tractusx_sdk.dataspace.tools.bounded_executor import BoundedExecutor
+
+
+class TestBoundedExecutor(unittest.TestCase):
+
+    def test_results_are_yielded_as_completed(self):
+        delays = {"slow": 0.3, "fast": 0.0}
+
+        def function(item):
+            time.sleep(delays[item])
+            return item.upper()
+
+        results = [(item, future.result()) for item, future in BoundedExecutor.as_completed(function, ["slow", "fast"])]
+        self.assertEqual(results, [("fast", "FAST"), ("slow", "SLOW")])
+
+    def test_max_concurrency_is_respected(self):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def function(item):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return item
+
+        results = [future.result() for _, future in BoundedExecutor.as_completed(function, range(10), max_concurrency=2)]
+        self.assertEqual(sorted(results), list(range(10)))
+        self.assertLessEqual(peak, 2)
+
+    def test_deadline_stops_waiting(self):
+        release = threading.Event()
+
+        def function(item):
+            if item == "hanging":
+                release.wait(timeout=5)
+            return item
+
+        started = time.monotonic()
+        results = [item for item, _ in BoundedExecutor.as_completed(function, ["hanging", "quick"], deadline=0.2)]
+        release.set()
+        self.assertEqual(results, ["quick"])
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_errors_are_kept_in_the_futures(self):
+        def function(item):
+            raise ValueError(item)
+
+        for item, future in BoundedExecutor.as_completed(function, ["a"]):
+            self.assertIsInstance(future.exception(), ValueError)
+
+    def test_configure_replaces_pool(self):
+        first = BoundedExecutor.get_executor()
+        BoundedExecutor.configure(max_workers=4)
+        try:
+            second = BoundedExecutor.get_executor()
+            self.assertIsNot(first, second)
+            self.assertEqual(second._max_workers, 4)
+        finally:
+            BoundedExecutor.configure()
+
+
+if __name__ == "__main__":
+    unittest.main()
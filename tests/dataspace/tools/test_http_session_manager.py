@@ -0,0 +1,113 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import unittest
+from unittest import mock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tractusx_sdk.dataspace.tools.http_session_manager import HttpSessionManager
+
+
+class TestHttpSessionManager(unittest.TestCase):
+
+    def setUp(self):
+        HttpSessionManager.reset()
+        HttpSessionManager.configure()
+
+    def tearDown(self):
+        HttpSessionManager.reset()
+        HttpSessionManager.configure()
+
+    def test_get_session_returns_shared_instance(self):
+        self.assertIs(HttpSessionManager.get_session(), HttpSessionManager.get_session())
+
+    def test_default_adapter_is_pooled_with_retries(self):
+        HttpSessionManager.configure(pool_connections=5, pool_maxsize=7, max_retries=2,
+                                     backoff_factor=0.5, backoff_jitter=0.1, status_forcelist=(503,))
+        adapter = HttpSessionManager.get_session().get_adapter("https://example.com/api")
+        self.assertIsInstance(adapter, HTTPAdapter)
+        self.assertEqual(adapter._pool_connections, 5)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        retry = adapter.max_retries
+        self.assertEqual(retry.total, 2)
+        self.assertEqual(retry.backoff_factor, 0.5)
+        self.assertEqual(retry.backoff_jitter, 0.1)
+        self.assertEqual(retry.status_forcelist, (503,))
+        self.assertFalse(retry.raise_on_status)
+        ## Non idempotent methods are never retried
+        self.assertNotIn("POST", retry.allowed_methods)
+
+    def test_configure_rebuilds_session(self):
+        first = HttpSessionManager.get_session()
+        HttpSessionManager.configure(pool_maxsize=3)
+        second = HttpSessionManager.get_session()
+        self.assertIsNot(first, second)
+        self.assertEqual(second.get_adapter("http://example.com")._pool_maxsize, 3)
+
+    def test_configure_does_not_close_session_in_use(self):
+        first = HttpSessionManager.get_session()
+        with mock.patch.object(first, "close") as mock_close:
+            HttpSessionManager.configure(pool_maxsize=3)
+            mock_close.assert_not_called()
+        self.assertIsNot(first, HttpSessionManager.get_session())
+        first = HttpSessionManager.get_session()
+        with mock.patch.object(first, "close") as mock_close:
+            HttpSessionManager.configure_host("https://provider.example.com", pool_maxsize=99)
+            mock_close.assert_not_called()
+        self.assertIsNot(first, HttpSessionManager.get_session())
+
+    def test_shared_session_does_not_store_server_cookies(self):
+        session = HttpSessionManager.get_session()
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = mock.Mock(_original_response=mock.Mock(
+            msg=mock.Mock(get_all=mock.Mock(return_value=["session=provider-a; Path=/"]))))
+        request = requests.Request("GET", "https://provider-a.example.com/api").prepare()
+        requests.cookies.extract_cookies_to_jar(session.cookies, request, response.raw)
+        self.assertEqual(len(session.cookies), 0)
+        ## Explicit cookies are still sent with their call
+        prepared = session.prepare_request(requests.Request("GET", "https://provider-b.example.com",
+                                                            cookies={"explicit": "1"}))
+        self.assertEqual(prepared.headers["Cookie"], "explicit=1")
+
+    def test_configure_host_mounts_dedicated_pool(self):
+        HttpSessionManager.configure_host("https://provider.example.com", pool_maxsize=99, max_retries=0)
+        session = HttpSessionManager.get_session()
+        host_adapter = session.get_adapter("https://provider.example.com/api/public")
+        default_adapter = session.get_adapter("https://other.example.com")
+        self.assertIsNot(host_adapter, default_adapter)
+        self.assertEqual(host_adapter._pool_maxsize, 99)
+        self.assertEqual(host_adapter.max_retries.total, 0)
+        self.assertEqual(default_adapter._pool_maxsize, HttpSessionManager.pool_maxsize)
+
+    def test_reset_drops_host_pools(self):
+        HttpSessionManager.configure_host("https://provider.example.com", pool_maxsize=99)
+        HttpSessionManager.reset()
+        adapter = HttpSessionManager.get_session().get_adapter("https://provider.example.com")
+        self.assertEqual(adapter._pool_maxsize, HttpSessionManager.pool_maxsize)
+
+
+if __name__ == "__main__":
+    unittest.main()
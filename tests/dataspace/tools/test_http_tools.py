@@ -36,7 +36,7 @@ class TestHttpTools(unittest.TestCase):
         self.payload = {"key": "value"}
 
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_do_get_without_session_success(self, mock_get):
         """Test a successful GET request."""
         mock_get.return_value = Mock(status_code=200, json=lambda: {"message": "success"})
@@ -63,7 +63,7 @@ class TestHttpTools(unittest.TestCase):
         self.assertEqual(response.status_code, 500)
         self.assertEqual(response.json(), {"error": "Internal Server Error"})
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_do_post_without_session_success(self, mock_post):
         """Test a successful POST request."""
         mock_post.return_value = Mock(status_code=201, json=lambda: {"message": "created"})
@@ -72,7 +72,7 @@ class TestHttpTools(unittest.TestCase):
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response.json(), {"message": "created"})
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_do_post_without_session_failure(self, mock_post):
         """Test POST request with bad request response."""
         mock_post.return_value = Mock(status_code=400, json=lambda: {"error": "Bad Request"})
@@ -99,7 +99,7 @@ class TestHttpTools(unittest.TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.json(), {"error": "Bad Request"})
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_do_put_without_session_success(self, mock_put):
         """Test a successful PUT request."""
         mock_put.return_value = Mock(status_code=200, json=lambda: {"message": "updated"})
@@ -108,7 +108,7 @@ class TestHttpTools(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"message": "updated"})
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_do_put_without_session_failure(self, mock_put):
         """Test PUT request with bad request response."""
         mock_put.return_value = Mock(status_code=400, json=lambda: {"error": "Bad Request"})
@@ -135,7 +135,7 @@ class TestHttpTools(unittest.TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.json(), {"error": "Bad Request"})
 
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_do_delete_without_session_success(self, mock_delete):
         """Test a successful DELETE request."""
         mock_delete.return_value = Mock(status_code=204, json=lambda: {"message": "deleted"})
@@ -160,6 +160,15 @@ class TestHttpTools(unittest.TestCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json(), {"error": "Not Found"})
 
+    @patch("requests.Session.get")
+    def test_sessionless_calls_reuse_shared_session(self, mock_get):
+        """Sessionless calls go through the shared pooled session."""
+        mock_get.return_value = Mock(status_code=200)
+        HttpTools.do_get(self.test_url)
+        HttpTools.do_get_with_session(self.test_url)
+        self.assertIs(HttpTools.get_session(), HttpTools.get_session())
+        self.assertEqual(mock_get.call_count, 2)
+
     def test_response_json(self):
         """Ensure JSON response is properly structured."""
         response = HttpTools.json_response({"message": "OK"}, status_code=200)
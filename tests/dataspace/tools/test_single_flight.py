@@ -0,0 +1,108 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+import unittest
+
+from tractusx_sdk.dataspace.tools.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+
+    def _run_concurrently(self, key, function, callers=5):
+        results, errors = [], []
+
+        def call():
+            try:
+                results.append(self.single_flight.do(key, function))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+
+    def test_concurrent_calls_share_one_execution(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "transfer-id"
+
+        threads, results, errors = self._run_concurrently("key", function)
+        started.wait(timeout=5)
+        ## Give the other callers time to join the call in flight
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(results, ["transfer-id"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(self.single_flight.in_flight("key"))
+
+    def test_error_is_shared_by_waiting_callers(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def function():
+            started.set()
+            release.wait(timeout=5)
+            raise RuntimeError("negotiation failed")
+
+        leader = threading.Thread(target=lambda: self.assertRaises(RuntimeError, self.single_flight.do, "key", function))
+        leader.start()
+        started.wait(timeout=5)
+        threads, results, errors = self._run_concurrently("key", lambda: "never", callers=3)
+        release.set()
+        leader.join(timeout=5)
+        for thread in threads:
+            thread.join(timeout=5)
+
+        ## Followers either waited for the failed call, or started after it finished and executed their own
+        self.assertEqual(len(results) + len(errors), 3)
+        for error in errors:
+            self.assertIsInstance(error, RuntimeError)
+
+    def test_key_is_released_after_execution(self):
+        calls = []
+        self.single_flight.do("key", calls.append, 1)
+        self.single_flight.do("key", calls.append, 2)
+        self.assertEqual(calls, [1, 2])
+
+    def test_different_keys_do_not_wait(self):
+        self.assertEqual(self.single_flight.do("a", lambda: "a"), "a")
+        self.assertEqual(self.single_flight.do("b", lambda: "b"), "b")
+
+
+if __name__ == "__main__":
+    unittest.main()
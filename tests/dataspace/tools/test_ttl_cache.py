@@ -0,0 +1,84 @@
+#################################################################################
+# Eclipse Tractus-X - Software Development KIT
+#
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import time
+import unittest
+from unittest import mock
+
+from tractusx_sdk.dataspace.tools.ttl_cache import TtlCache
+
+
+class TestTtlCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = TtlCache(ttl=10, negative_ttl=2, max_entries=2)
+
+    def test_lookup(self):
+        self.assertEqual(self.cache.lookup("a"), (False, None))
+        self.cache.set("a", None)
+        self.assertEqual(self.cache.lookup("a"), (True, None))
+
+    def test_entries_expire(self):
+        now = time.monotonic()
+        self.cache.set("a", 1)
+        self.cache.set("b", 2, ttl=20)
+        with mock.patch("time.monotonic", return_value=now + 15):
+            self.assertEqual(self.cache.lookup("a"), (False, None))
+            self.assertEqual(self.cache.lookup("b"), (True, 2))
+
+    def test_errors_are_cached_for_the_negative_ttl(self):
+        now = time.monotonic()
+        self.cache.set_error("a", ConnectionError("unreachable"))
+        with self.assertRaises(ConnectionError):
+            self.cache.lookup("a")
+        with mock.patch("time.monotonic", return_value=now + 3):
+            self.assertEqual(self.cache.lookup("a"), (False, None))
+
+    def test_lookup_many(self):
+        self.cache.set("a", 1)
+        self.cache.set_error("b", ConnectionError("unreachable"))
+        self.assertEqual(self.cache.lookup_many(["a", "b", "c"]), ({"a": 1}, ["b", "c"]))
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.lookup("a")
+        self.cache.set("c", 3)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.lookup("b"), (False, None))
+        self.assertEqual(self.cache.lookup("a"), (True, 1))
+
+    def test_invalidate(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.invalidate("a")
+        self.assertEqual(self.cache.lookup("a"), (False, None))
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_zero_ttl_is_not_cached(self):
+        self.cache.set("a", 1, ttl=0)
+        self.assertEqual(self.cache.lookup("a"), (False, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -47,6 +47,15 @@ def service(mock_oauth, mock_discovery_finder):
         cache_timeout_seconds=10
     )
 
+@pytest.fixture
+def cached_service(mock_oauth, mock_discovery_finder):
+    return BpnDiscoveryService(
+        oauth=mock_oauth,
+        discovery_finder_service=mock_discovery_finder,
+        cache_timeout_seconds=10,
+        result_cache_enabled=True
+    )
+
 def test_get_bpn_discovery_url_success(service, mock_discovery_finder):
     """Test successful BPN discovery URL retrieval using legacy method."""
     # Mock the discovery finder to return a URL
@@ -485,3 +494,142 @@ def test_cache_successful_refresh_after_failure(mock_http, service):
     # Cache should be updated with new URL and timestamp
     assert service.discovery_cache["manufacturerPartId"]["url"] == "https://new-refreshed-bpn.example.com/api/v1.0/administration/connectors/bpnDiscovery"
     assert service.discovery_cache["manufacturerPartId"]["timestamp"] > old_timestamp
+
+def search_response(keys, identifier_type="manufacturerPartId"):
+    return {"bpns": [{"type": identifier_type, "key": key, "value": f"BPNL-{key}", "resourceId": f"id-{key}"}
+                     for key in keys if key != "unknown"]}
+
+def test_find_bpns_only_searches_the_keys_not_cached(cached_service):
+    """Test the BPNs found are cached per key, including the keys without BPNs."""
+    cached_service.search_bpns = mock.Mock(side_effect=lambda keys, identifier_type: search_response(keys, identifier_type))
+
+    assert set(cached_service.find_bpns(keys=["part1", "part2", "unknown"])) == {"BPNL-part1", "BPNL-part2"}
+    assert set(cached_service.find_bpns(keys=["part2", "part3", "unknown"])) == {"BPNL-part2", "BPNL-part3"}
+    assert cached_service.find_bpns(keys=["unknown"]) is None
+
+    assert cached_service.search_bpns.call_args_list == [
+        mock.call(keys=["part1", "part2", "unknown"], identifier_type="manufacturerPartId"),
+        mock.call(keys=["part3"], identifier_type="manufacturerPartId")
+    ]
+
+def test_find_bpns_cache_expires(cached_service):
+    """Test the keys without BPNs are searched again after the negative ttl."""
+    cached_service.search_bpns = mock.Mock(side_effect=lambda keys, identifier_type: search_response(keys, identifier_type))
+    cached_service.find_bpns(keys=["part1", "unknown"])
+
+    with mock.patch("time.monotonic", return_value=time.monotonic() + cached_service.result_cache.negative_ttl + 1):
+        cached_service.find_bpns(keys=["part1", "unknown"])
+
+    assert cached_service.search_bpns.call_args.kwargs["keys"] == ["unknown"]
+
+@mock.patch("tractusx_sdk.industry.services.discovery.bpn_discovery_service.HttpTools")
+def test_set_identifiers_invalidate_the_cached_bpns(mock_bpn_http, cached_service):
+    """Test our own registrations invalidate the cached results of their keys."""
+    cached_service.search_bpns = mock.Mock(side_effect=lambda keys, identifier_type: search_response(keys, identifier_type))
+    cached_service._get_or_update_discovery_url = mock.Mock(return_value="https://bpn.example.com/bpnDiscovery")
+    mock_bpn_http.do_post_with_session.return_value = mock.Mock(status_code=201, json=mock.Mock(return_value={}))
+    cached_service.find_bpns(keys=["part1", "part2", "part3"])
+
+    cached_service.set_identifier(identifier_key="part1")
+    cached_service.set_multiple_identifiers(identifiers=["part2"])
+    cached_service.find_bpns(keys=["part1", "part2", "part3"])
+
+    assert cached_service.search_bpns.call_args.kwargs["keys"] == ["part1", "part2"]
+
+def test_find_bpns_is_not_cached_by_default(service):
+    """Test every search reaches the BPN discovery when no result cache is enabled."""
+    service.search_bpns = mock.Mock(side_effect=lambda keys, identifier_type: search_response(keys, identifier_type))
+
+    service.find_bpns(keys=["part1"])
+    service.find_bpns(keys=["part1"])
+
+    assert service.result_cache is None
+    assert service.search_bpns.call_count == 2
+
+def test_finder_without_key_registration(mock_oauth):
+    """Test a finder without register_discovery_keys can still be used."""
+    finder = mock.Mock(spec=["get_discovery_urls"])
+    finder.get_discovery_urls.return_value = {"manufacturerPartId": "https://bpn.example.com"}
+
+    bpn_service = BpnDiscoveryService(oauth=mock_oauth, discovery_finder_service=finder)
+
+    assert bpn_service.get_discovery_url(finder, "manufacturerPartId") == "https://bpn.example.com" + bpn_service.base_path
+
+def batch_response(identifiers):
+    return [{"type": "manufacturerPartId", "key": key, "value": "BPNL000000000001", "resourceId": f"id-{key}"} for key in identifiers]
+
+def batch_http_response(status_code, identifiers):
+    return mock.Mock(status_code=status_code, json=mock.Mock(return_value=batch_response(identifiers)))
+
+def test_register_identifiers_in_chunks(service):
+    """Test the identifiers are read lazily and registered in chunks, with a per key report."""
+    read = []
+
+    def identifiers():
+        for i in range(7):
+            read.append(i)
+            yield f"part{i}"
+
+    service._post_identifiers_batch = mock.Mock(side_effect=lambda identifiers, identifier_type: batch_http_response(201, identifiers))
+
+    report = service.register_identifiers(identifiers(), chunk_size=3, max_in_flight=2)
+
+    assert sorted(len(call.kwargs["identifiers"]) for call in service._post_identifiers_batch.call_args_list) == [1, 3, 3]
+    assert set(report) == {f"part{i}" for i in range(7)}
+    assert report["part4"] == {"status": "registered", "result": batch_response(["part4"])[0]}
+    assert len(read) == 7
+
+@mock.patch("time.sleep")
+def test_register_identifiers_retries_failed_chunks(mock_sleep, service):
+    """Test only the transient failures of a chunk are retried with backoff, until its attempts are exhausted."""
+    import requests
+    from tractusx_sdk.dataspace.services.connector import PollingStrategy
+
+    attempts = {}
+
+    def flaky_batch(identifiers, identifier_type):
+        attempts[identifiers[0]] = attempts.get(identifiers[0], 0) + 1
+        if identifiers[0] == "part0" and attempts["part0"] == 1:
+            raise requests.ConnectionError("connection reset")
+        if identifiers[0] == "part2":
+            return batch_http_response(503, identifiers)
+        if identifiers[0] == "part4":
+            return batch_http_response(400, identifiers)
+        return batch_http_response(201, identifiers)
+
+    service._post_identifiers_batch = mock.Mock(side_effect=flaky_batch)
+    retry_strategy = PollingStrategy(initial_delay=1.0, multiplier=2.0, jitter=0.0, deadline=None, max_attempts=3)
+
+    report = service.register_identifiers(["part0", "part1", "part2", "part3", "part4", "part5"], chunk_size=2,
+                                          retry_strategy=retry_strategy)
+
+    ## The permanent failure is not retried
+    assert attempts == {"part0": 2, "part2": 3, "part4": 1}
+    assert report["part1"]["status"] == "registered"
+    assert report["part3"] == {"status": "failed",
+                               "error": "[BPN Discovery Service] Failed to create BPN identifiers batch. Response code: [503]"}
+    assert report["part5"] == {"status": "failed",
+                               "error": "[BPN Discovery Service] Failed to create BPN identifiers batch. Response code: [400]"}
+    assert sorted(call.args[0] for call in mock_sleep.call_args_list) == [1.0, 1.0, 2.0]
+
+@mock.patch("time.sleep")
+def test_register_identifiers_conflict_on_retry_is_registered(mock_sleep, service):
+    """Test a conflict answering a retry counts as registered, since the timed out attempt was stored."""
+    import requests
+
+    service._post_identifiers_batch = mock.Mock(side_effect=[requests.Timeout("read timed out"),
+                                                             batch_http_response(409, [])])
+
+    report = service.register_identifiers(["part0", "part1"], chunk_size=2)
+
+    assert report == {"part0": {"status": "registered", "result": None}, "part1": {"status": "registered", "result": None}}
+    assert service._post_identifiers_batch.call_count == 2
+
+def test_register_identifiers_conflict_on_first_attempt_fails(service):
+    """Test a conflict answering the first attempt is a failure."""
+    service._post_identifiers_batch = mock.Mock(return_value=batch_http_response(409, []))
+
+    report = service.register_identifiers(["part0"], chunk_size=2)
+
+    assert report["part0"]["status"] == "failed"
+    service._post_identifiers_batch.assert_called_once()